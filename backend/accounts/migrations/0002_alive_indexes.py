@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='accounthead',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['created_at'], name='accounthead_created_at_alive'),
+        ),
+    ]
@@ -1,5 +1,5 @@
 from django.db import models
-from backend.mixins import AuditMixin  
+from backend.mixins import AuditMixin, alive_indexes
 
 class AccountHead(AuditMixin):
     head_name = models.CharField(max_length=255, unique=True)
@@ -7,6 +7,9 @@ class AccountHead(AuditMixin):
     credit = models.DecimalField(max_digits=12, decimal_places=2, default=0.00)
     balance = models.DecimalField(max_digits=12, decimal_places=2, default=0.00)
 
+    class Meta:
+        indexes = alive_indexes("accounthead", "created_at")
+
     def save(self, *args, **kwargs):
         # Balance auto calculate = Debit - Credit
         self.balance = (self.debit or 0) - (self.credit or 0)
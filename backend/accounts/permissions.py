@@ -1,6 +1,6 @@
-from rest_framework.permissions import BasePermission
 from rest_framework.exceptions import PermissionDenied
-from users.models import UserPermissionSet
+from users.permission_engine import get_permission_snapshot
+from backend.scope import ObjectScopePermission
 
 # কোন কোন module-এর কি কি permission থাকবে
 ACCOUNTS_PERMISSIONS = {
@@ -25,7 +25,7 @@ def get_all_account_permissions():
 
 
 
-class AccountHeadModulePermission(BasePermission):
+class AccountHeadModulePermission(ObjectScopePermission):
     ACTION_MAP = {
         "list": "view",
         "retrieve": "view",
@@ -33,6 +33,8 @@ class AccountHeadModulePermission(BasePermission):
         "update": "edit",
         "partial_update": "edit",
         "destroy": "delete",
+        "bulk_delete": "delete",
+        "bulk_restore": "delete",
         "GET": "view",
         "POST": "create",
         "PUT": "edit",
@@ -57,21 +59,9 @@ class AccountHeadModulePermission(BasePermission):
         if not action_perm:
             return True
 
-        perms = UserPermissionSet.objects.filter(user=user)
-        for p in perms:
-            accounts_module = p.accounts_module
-            if isinstance(accounts_module, str):
-                import json
-                try:
-                    accounts_module = json.loads(accounts_module)
-                except json.JSONDecodeError:
-                    accounts_module = {}
-            elif accounts_module is None:
-                accounts_module = {}
-
-            # Ensure module_name exists
-            module_perms = accounts_module.get(module_name, {})
-            if module_perms.get(action_perm, False):
-                return True
+        # Compiled permission snapshot (request memo → redis → DB)
+        snapshot = get_permission_snapshot(user)
+        if snapshot.has("accounts_module", module_name, action_perm):
+            return True
 
         raise PermissionDenied(f"You cannot perform {action_perm} on {module_name}")
@@ -4,11 +4,13 @@ from rest_framework.permissions import IsAuthenticated
 from accounts.models.accountsHead import AccountHead
 from accounts.serializers.accountsHeadSerializers import AccountHeadSerializer
 from accounts.permissions import AccountHeadModulePermission
+from backend.bulk import BulkSoftDeleteMixin
 
-class AccountHeadViewSet(viewsets.ModelViewSet):
+class AccountHeadViewSet(BulkSoftDeleteMixin, viewsets.ModelViewSet):
     queryset = AccountHead.objects.all().order_by("-created_at")
     serializer_class = AccountHeadSerializer
     permission_classes = [IsAuthenticated, AccountHeadModulePermission]
     module_name = "account_head"
+    keyset_ordering = ("-created_at", "-id")
 
 
@@ -1,6 +1,14 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate, pre_migrate
 
 
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        # archive view গুলো migrate এর পথে না থাকে (backend/archive.py)
+        from backend.archive import drop_archive_views, refresh_archives
+
+        pre_migrate.connect(drop_archive_views, sender=self)
+        post_migrate.connect(refresh_archives, sender=self)
@@ -0,0 +1,39 @@
+# api/management/commands/archive_deleted_rows.py
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from backend.archive import archivable_models, archive_deleted_rows
+
+
+class Command(BaseCommand):
+    help = "Retention এর চেয়ে পুরোনো soft-deleted row গুলো <table>_archive এ batch করে move করে (cron থেকে চালাতে হবে)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=settings.ARCHIVE_RETENTION_DAYS)
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--model", action="append", help="app_label.Model (একাধিকবার দেওয়া যায়), না দিলে সব AuditMixin model")
+
+    def handle(self, *args, **options):
+        if options["model"]:
+            try:
+                models = [apps.get_model(label) for label in options["model"]]
+            except (LookupError, ValueError) as e:
+                raise CommandError(str(e))
+        else:
+            models = archivable_models()
+
+        # child আগে move হলে parent আর refer হয় না → কিছু move না হওয়া পর্যন্ত pass চলবে
+        total = 0
+        while True:
+            moved_this_pass = 0
+            for model in models:
+                moved = archive_deleted_rows(model, retention_days=options["days"], batch_size=options["batch_size"])
+                if moved:
+                    self.stdout.write(f"{model._meta.label}: {moved} rows archived")
+                moved_this_pass += moved
+            total += moved_this_pass
+            if not moved_this_pass:
+                break
+
+        self.stdout.write(self.style.SUCCESS(f"Done: {total} rows archived"))
@@ -0,0 +1,16 @@
+from django.contrib import admin
+from audit.models import AuditEvent, FieldHistory
+
+
+@admin.register(AuditEvent)
+class AuditEventAdmin(admin.ModelAdmin):
+    list_display = ("created_at", "action", "model", "object_pk", "actor", "ip_address")
+    list_filter = ("action", "model")
+    search_fields = ("object_pk",)
+
+
+@admin.register(FieldHistory)
+class FieldHistoryAdmin(admin.ModelAdmin):
+    list_display = ("changed_at", "model", "object_pk", "version", "is_snapshot", "actor")
+    list_filter = ("model", "is_snapshot")
+    search_fields = ("object_pk",)
@@ -0,0 +1,151 @@
+# audit/events.py
+import atexit
+import logging
+import queue
+import threading
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# -------------------------------
+# 🔹 Audit event stream
+# -------------------------------
+# AuditMixin.save / delete → record_event() (commit হলে) → request buffer এ জমা।
+# Response যাওয়ার পর AuditEventMiddleware পুরো buffer background writer কে দেয়,
+# writer batch করে AuditEvent.objects.bulk_create করে।
+# Request path এ শুধু list append / queue put, কোনো DB write নেই।
+# Request এর বাইরে (command, shell) event সরাসরি writer queue তে যায়।
+
+_request = ContextVar("audit_request", default=None)
+_buffer = ContextVar("audit_buffer", default=None)
+
+
+def _client_ip(request):
+    x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+    if x_forwarded_for:
+        return x_forwarded_for.split(",")[0].strip()
+    return request.META.get("REMOTE_ADDR")
+
+
+def record_event(model, object_pk, action, changes=None, actor_id=None):
+    if not settings.AUDIT_LOG_ENABLED:
+        return
+
+    request = _request.get()
+    if request is not None:
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            actor_id = user.pk
+
+    from audit.models import AuditEvent
+
+    event = AuditEvent(
+        created_at=timezone.now(),
+        actor_id=actor_id,
+        model=model._meta.label_lower,
+        object_pk=str(object_pk),
+        action=action,
+        changes=changes or {},
+        ip_address=_client_ip(request) if request is not None else None,
+        user_agent=request.META.get("HTTP_USER_AGENT", "")[:255] if request is not None else None,
+    )
+
+    def enqueue():
+        buffer = _buffer.get()
+        if buffer is not None:
+            buffer.append(event)
+        else:
+            writer.enqueue([event])
+
+    # rollback হলে event ও বাদ
+    transaction.on_commit(enqueue)
+
+
+class AuditWriter:
+    """Daemon thread: queue থেকে event নিয়ে AUDIT_BATCH_SIZE পর্যন্ত জমিয়ে একবারে insert"""
+
+    def __init__(self):
+        self.queue = queue.Queue(maxsize=settings.AUDIT_QUEUE_MAX_SIZE)
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def _start(self):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+                self.thread.start()
+
+    def enqueue(self, events):
+        if not settings.AUDIT_LOG_ASYNC:
+            self._write(events)
+            return
+        self._start()
+        for event in events:
+            try:
+                self.queue.put_nowait(event)
+            except queue.Full:
+                logger.warning("Audit queue full, event dropped: %s", event)
+
+    def _drain(self, first=None):
+        batch = [] if first is None else [first]
+        while len(batch) < settings.AUDIT_BATCH_SIZE:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            try:
+                first = self.queue.get(timeout=settings.AUDIT_FLUSH_INTERVAL)
+            except queue.Empty:
+                continue
+            self._write(self._drain(first))
+
+    def _write(self, batch):
+        from audit.models import AuditEvent
+
+        if not batch:
+            return
+        close_old_connections()
+        try:
+            AuditEvent.objects.bulk_create(batch, batch_size=settings.AUDIT_BATCH_SIZE)
+        except Exception:
+            logger.exception("Failed to write %s audit events", len(batch))
+
+    def flush(self):
+        """Queue এ যা আছে এখনই লিখে ফেলে (process exit / test)"""
+        while True:
+            batch = self._drain()
+            if not batch:
+                break
+            self._write(batch)
+
+
+writer = AuditWriter()
+atexit.register(writer.flush)
+
+
+class AuditEventMiddleware:
+    """Request প্রতি event buffer, response এর পর একবারে writer এ"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request_token = _request.set(request)
+        buffer_token = _buffer.set([])
+        try:
+            response = self.get_response(request)
+        finally:
+            events = _buffer.get()
+            _buffer.reset(buffer_token)
+            _request.reset(request_token)
+        if events:
+            writer.enqueue(events)
+        return response
@@ -0,0 +1,145 @@
+# audit/history.py
+from datetime import datetime, time
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Subquery
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework import status
+from rest_framework.response import Response
+
+from audit.models import FieldHistory
+
+# -------------------------------
+# 🔹 Field history (point-in-time)
+# -------------------------------
+# AuditMixin model এ:
+#     history_fields = ("per_bag_rent", "interest_rate")
+# দিলে save এর সময় (একই transaction এ) বদলানো history field গুলো FieldHistory তে delta হিসেবে যায়,
+# প্রতি HISTORY_SNAPSHOT_EVERY version এ পুরো snapshot।
+# as_of read: সবচেয়ে কাছের snapshot + তার পরের delta গুলো (একটা query, বড়জোর N row)।
+# (model, object_pk, version) unique → একসাথে দুইটা save একই version পেলে পরেরটা আবার পড়ে retry করে।
+
+HISTORY_WRITE_ATTEMPTS = 3
+
+
+def _values(instance, fields):
+    return {f.name: getattr(instance, f.attname) for f in fields}
+
+
+def record_history(instance, adding, update_fields=None, loaded=None):
+    model = type(instance)
+    all_fields = [model._meta.get_field(name) for name in model.history_fields]
+    fields = all_fields
+    if update_fields is not None:
+        fields = [f for f in fields if f.name in update_fields or f.attname in update_fields]
+    if not fields:
+        return
+
+    label, object_pk = model._meta.label_lower, str(instance.pk)
+    changed = None
+    if not adding:
+        changed = {
+            f.name: getattr(instance, f.attname)
+            for f in fields
+            if loaded is None or f.attname not in loaded or loaded[f.attname] != getattr(instance, f.attname)
+        }
+        if not changed:
+            return
+
+    for attempt in range(HISTORY_WRITE_ATTEMPTS):
+        last = (
+            FieldHistory.objects.filter(model=label, object_pk=object_pk)
+            .order_by("-version")
+            .values_list("version", flat=True)
+            .first()
+        )
+        version = 1 if last is None else last + 1
+        is_snapshot = version == 1 or version % settings.HISTORY_SNAPSHOT_EVERY == 0
+        try:
+            # savepoint → unique conflict হলে outer transaction নষ্ট হয় না
+            with transaction.atomic():
+                FieldHistory.objects.create(
+                    model=label,
+                    object_pk=object_pk,
+                    version=version,
+                    changed_at=timezone.now(),
+                    is_snapshot=is_snapshot,
+                    data=_values(instance, all_fields) if is_snapshot else changed,
+                    actor_id=instance.modified_by_id,
+                )
+            return
+        except IntegrityError:
+            if attempt == HISTORY_WRITE_ATTEMPTS - 1:
+                raise
+
+
+def state_as_of(model, pk, when):
+    """when সময়ে history field গুলোর value ({name: value}), তার আগে history না থাকলে None"""
+    label, object_pk = model._meta.label_lower, str(pk)
+    snapshot = (
+        FieldHistory.objects.filter(model=label, object_pk=object_pk, is_snapshot=True, changed_at__lte=when)
+        .order_by("-version")
+        .values("version")[:1]
+    )
+    rows = (
+        FieldHistory.objects.filter(model=label, object_pk=object_pk, changed_at__lte=when, version__gte=Subquery(snapshot))
+        .order_by("version")
+        .values_list("data", flat=True)
+    )
+
+    state = {}
+    for data in rows:
+        state.update(data)
+    if not state:
+        return None
+    # JSON এ Decimal / date string হয়ে থাকে → field type এ ফেরত
+    return {name: model._meta.get_field(name).to_python(value) for name, value in state.items()}
+
+
+def parse_as_of(raw):
+    # query string এ "+06:00" এর "+" space হয়ে আসে
+    raw = raw.strip().replace(" ", "+")
+    try:
+        when = parse_datetime(raw)
+        day = parse_date(raw) if when is None else None
+    except ValueError:
+        # format ঠিক কিন্তু date অসম্ভব (2025-02-30, month 13 ...)
+        return None
+    if when is None:
+        if day is None:
+            return None
+        # শুধু date → ওই দিনের শেষে যা ছিল
+        when = datetime.combine(day, time.max)
+    if timezone.is_naive(when):
+        when = timezone.make_aware(when)
+    return when
+
+
+class AsOfRetrieveMixin:
+    """
+    GET <detail-url>/?as_of=2025-03-01            (ওই দিনের শেষে)
+    GET <detail-url>/?as_of=2025-03-01T10:30:00Z
+    → {"id", "as_of", <history field>: value ...}
+    """
+
+    def retrieve(self, request, *args, **kwargs):
+        raw = request.query_params.get("as_of")
+        if raw is None:
+            return super().retrieve(request, *args, **kwargs)
+
+        when = parse_as_of(raw)
+        if when is None:
+            return Response({"error": "as_of must be a date or ISO datetime"}, status=status.HTTP_400_BAD_REQUEST)
+
+        instance = self.get_object()
+        state = state_as_of(type(instance), instance.pk, when)
+        if state is None:
+            return Response({"error": "No history at or before as_of"}, status=status.HTTP_404_NOT_FOUND)
+        # detail response এর মতো একই format (Decimal → "12.50" ইত্যাদি)
+        fields = self.get_serializer().fields
+        for name, value in state.items():
+            if value is not None and name in fields:
+                state[name] = fields[name].to_representation(value)
+        return Response({"id": instance.pk, "as_of": when, **state})
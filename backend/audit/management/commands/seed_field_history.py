@@ -0,0 +1,40 @@
+# audit/management/commands/seed_field_history.py
+from django.core.management.base import BaseCommand
+
+from audit.models import FieldHistory
+from backend.archive import archivable_models
+
+
+class Command(BaseCommand):
+    help = "history_fields আছে এমন model এর যেসব row এর কোনো history নেই, তাদের জন্য baseline snapshot (modified_at সময়ে)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        total = 0
+        for model in archivable_models():
+            if not model.history_fields:
+                continue
+            label = model._meta.label_lower
+            fields = [model._meta.get_field(name) for name in model.history_fields]
+            seeded = set(FieldHistory.objects.filter(model=label).values_list("object_pk", flat=True).distinct())
+
+            rows = []
+            for obj in model.all_objects.only("pk", "modified_at", *model.history_fields).iterator(chunk_size=batch_size):
+                if str(obj.pk) in seeded:
+                    continue
+                rows.append(FieldHistory(
+                    model=label,
+                    object_pk=str(obj.pk),
+                    version=1,
+                    changed_at=obj.modified_at,
+                    is_snapshot=True,
+                    data={f.name: getattr(obj, f.attname) for f in fields},
+                ))
+            FieldHistory.objects.bulk_create(rows, batch_size=batch_size)
+            total += len(rows)
+            self.stdout.write(f"{model._meta.label}: {len(rows)} baseline snapshots")
+
+        self.stdout.write(self.style.SUCCESS(f"Done: {total} baseline snapshots"))
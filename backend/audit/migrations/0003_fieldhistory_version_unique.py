@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0002_fieldhistory'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='fieldhistory',
+            constraint=models.UniqueConstraint(fields=('model', 'object_pk', 'version'), name='field_history_version_uniq'),
+        ),
+    ]
@@ -0,0 +1,85 @@
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+# -------------------------------
+# 🔹 Append-only audit event
+# -------------------------------
+class AuditEvent(models.Model):
+    """
+    AuditMixin model এর প্রতিটা create / update / delete / restore এর একটা row।
+    শুধু insert হয় (audit/events.py এর background writer থেকে bulk_create), কখনো update না।
+    """
+
+    ACTION_CHOICES = [
+        ("create", "Create"),
+        ("update", "Update"),
+        ("delete", "Delete"),
+        ("restore", "Restore"),
+        ("hard_delete", "Hard delete"),
+    ]
+
+    created_at = models.DateTimeField(db_index=True)
+    # user delete হলেও event থাকবে → FK constraint নেই
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    model = models.CharField(max_length=100)  # app_label.model_name
+    object_pk = models.CharField(max_length=64)
+    action = models.CharField(max_length=20, choices=ACTION_CHOICES)
+    # update → {"field": [old, new]}, create → {"field": new}
+    changes = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    ip_address = models.GenericIPAddressField(null=True, blank=True)
+    user_agent = models.CharField(max_length=255, null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["model", "object_pk", "created_at"], name="audit_event_object_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.action} {self.model}#{self.object_pk}"
+
+
+# -------------------------------
+# 🔹 Field-level history (point-in-time)
+# -------------------------------
+class FieldHistory(models.Model):
+    """
+    Model এর history_fields এর change (audit/history.py)।
+    delta row → শুধু বদলানো field এর নতুন value, snapshot row → সব history field এর value
+    (প্রতি HISTORY_SNAPSHOT_EVERY version এ একবার, তাই as_of read এ বড়জোর ততগুলো row লাগে)।
+    """
+
+    model = models.CharField(max_length=100)  # app_label.model_name
+    object_pk = models.CharField(max_length=64)
+    version = models.PositiveIntegerField()
+    changed_at = models.DateTimeField()
+    is_snapshot = models.BooleanField(default=False)
+    data = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["model", "object_pk", "changed_at"], name="field_history_object_idx"),
+        ]
+        # একই object এ দুইটা save একসাথে একই version লিখতে পারবে না (record_history retry করে)
+        constraints = [
+            models.UniqueConstraint(fields=["model", "object_pk", "version"], name="field_history_version_uniq"),
+        ]
+
+    def __str__(self):
+        return f"{self.model}#{self.object_pk} v{self.version}"
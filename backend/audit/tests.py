@@ -0,0 +1,162 @@
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from audit.history import state_as_of
+from audit.models import AuditEvent, FieldHistory
+from company.models import Company
+from pallot.models.pallotType import PallotType
+from party_type.models.party import Party
+from users.models import CustomUser
+
+
+# writer thread ছাড়া সরাসরি লেখে → commit এর পরেই event দেখা যায়
+@override_settings(AUDIT_LOG_ENABLED=True, AUDIT_LOG_ASYNC=False)
+class AuditEventTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_superuser(email="audit@example.com", password="x", name="audit")
+        cls.company = Company.objects.create(name="Audit Co")
+
+    def setUp(self):
+        cache.clear()
+
+    def _events(self, obj):
+        return list(
+            AuditEvent.objects.filter(model="pallot.pallottype", object_pk=str(obj.pk))
+            .order_by("id")
+            .values_list("action", "changes")
+        )
+
+    def test_create_update_delete_restore(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            pallot_type = PallotType.objects.create(company=self.company, name="Wood", modified_by=self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            pallot_type = PallotType.objects.get(pk=pallot_type.pk)
+            pallot_type.name = "Plastic"
+            pallot_type.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            pallot_type.delete(user=self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            pallot_type.is_deleted = False
+            pallot_type.save(update_fields=["is_deleted"])
+
+        events = self._events(pallot_type)
+        self.assertEqual([action for action, _ in events], ["create", "update", "delete", "restore"])
+        self.assertEqual(events[0][1]["name"], "Wood")
+        self.assertEqual(events[1][1], {"name": ["Wood", "Plastic"]})
+        self.assertEqual(events[2][1], {"is_deleted": [False, True]})
+        self.assertEqual(events[3][1], {"is_deleted": [True, False]})
+        self.assertEqual(AuditEvent.objects.get(action="delete").actor_id, self.user.pk)
+
+    def test_rolled_back_write_records_no_event(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    pallot_type = PallotType.objects.create(company=self.company, name="Rolled back")
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        self.assertEqual(self._events(pallot_type), [])
+
+    def test_request_event_has_client_info(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/api/pallot/pallot_types/",
+                {"name": "Steel", "company_id": self.company.pk},
+                content_type="application/json",
+                HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(self.user).access_token}",
+                HTTP_USER_AGENT="audit-test",
+            )
+
+        self.assertEqual(response.status_code, 201)
+        # row এর ip / browser column আর লেখা হয় না → response এও নেই
+        self.assertNotIn("ip_address", response.data)
+        event = AuditEvent.objects.get(model="pallot.pallottype", object_pk=str(response.data["id"]))
+        self.assertEqual((event.action, event.actor_id), ("create", self.user.pk))
+        self.assertEqual((event.ip_address, event.user_agent), ("127.0.0.1", "audit-test"))
+
+    def test_party_type_row_does_not_store_client_info(self):
+        from party_type.models.party_type import PartyType
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/api/party_type/party-types/",
+                {"name": "Farmer", "company_id": self.company.pk},
+                content_type="application/json",
+                HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(self.user).access_token}",
+                HTTP_USER_AGENT="audit-test",
+            )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertNotIn("browser_info", response.data)
+        row = PartyType.objects.get(pk=response.data["id"])
+        self.assertEqual((row.ip_address, row.browser_info, row.created_by_id), (None, None, self.user.pk))
+        event = AuditEvent.objects.get(model="party_type.partytype", object_pk=str(row.pk))
+        self.assertEqual(event.user_agent, "audit-test")
+
+
+@override_settings(AUDIT_LOG_ENABLED=False)
+class FieldHistoryTests(TestCase):
+    EDITS = 45
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_superuser(email="history@example.com", password="x", name="history")
+        company = Company.objects.create(name="History Co")
+
+        # প্রতিটা edit এক মিনিট পরপর: version i → start + i মিনিট
+        cls.start = timezone.now().replace(microsecond=0) - timedelta(days=1)
+        with mock.patch("audit.history.timezone.now", return_value=cls.start):
+            cls.party = Party.objects.create(company=company, name="Karim", per_bag_rent=0)
+        for i in range(1, cls.EDITS + 1):
+            party = Party.objects.get(pk=cls.party.pk)
+            party.per_bag_rent = i
+            if i == 30:
+                party.interest_rate = Decimal("7.50")
+            with mock.patch("audit.history.timezone.now", return_value=cls.at(i)):
+                party.save()
+
+    @classmethod
+    def at(cls, minutes):
+        return cls.start + timedelta(minutes=minutes)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_snapshots_are_periodic(self):
+        versions = FieldHistory.objects.filter(model="party_type.party", object_pk=str(self.party.pk))
+        self.assertEqual(versions.count(), self.EDITS + 1)
+        every = settings.HISTORY_SNAPSHOT_EVERY
+        expected = [1] + list(range(every, self.EDITS + 2, every))
+        self.assertEqual(list(versions.filter(is_snapshot=True).order_by("version").values_list("version", flat=True)), expected)
+
+    def test_state_as_of_several_points(self):
+        # version v এ per_bag_rent = v - 1 (version 1 = create)
+        for minutes, rent, rate in [(0, 0, 0), (18.5, 18, 0), (19, 19, 0), (33, 33, Decimal("7.50")), (500, self.EDITS, Decimal("7.50"))]:
+            with self.subTest(minutes=minutes):
+                state = state_as_of(Party, self.party.pk, self.at(minutes))
+                self.assertEqual(state["per_bag_rent"], Decimal(rent))
+                self.assertEqual(state["interest_rate"], Decimal(rate))
+
+        self.assertIsNone(state_as_of(Party, self.party.pk, self.at(-1)))
+
+    def test_as_of_endpoint(self):
+        self.client.defaults["HTTP_AUTHORIZATION"] = f"Bearer {RefreshToken.for_user(self.user).access_token}"
+        url = f"/api/party_type/parties/{self.party.pk}/"
+
+        response = self.client.get(url, {"as_of": self.at(33).isoformat()})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data["per_bag_rent"], response.data["interest_rate"]), ("33.00", "7.50"))
+
+        for bad in ("2025-02-30", "2025-13-01T00:00:00", "yesterday"):
+            with self.subTest(as_of=bad):
+                self.assertEqual(self.client.get(url, {"as_of": bad}).status_code, 400)
@@ -0,0 +1,112 @@
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+# -------------------------------
+# 🔹 Sparse fieldsets / on-demand expansion
+# -------------------------------
+# GET ?fields=id,name,company      → শুধু এই field গুলো
+# GET ?expand=company,party_type   → এই nested object গুলো পুরো আসবে,
+#                                    বাকি nested relation শুধু id হিসেবে (join লাগে না)
+# কোনো parameter না থাকলে response আগের মতোই।
+
+
+def _param_set(request, name):
+    raw = request.query_params.get(name)
+    if raw is None:
+        return None
+    return {f.strip() for f in raw.split(",") if f.strip()}
+
+
+def sparse_params(request):
+    """(fields, expand) অথবা None (sparse request না হলে)"""
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    fields = _param_set(request, "fields")
+    expand = _param_set(request, "expand")
+    if fields is None and expand is None:
+        return None
+    return fields, expand or set()
+
+
+def _collapse(field, name, source):
+    # nested serializer → শুধু primary key (FK column থেকেই, extra query নেই)
+    kwargs = {"read_only": True}
+    if source != name:
+        kwargs["source"] = source
+    if isinstance(field, serializers.ListSerializer):
+        kwargs["many"] = True
+    return serializers.PrimaryKeyRelatedField(**kwargs)
+
+
+class DynamicFieldsSerializerMixin(serializers.ModelSerializer):
+    def _is_root(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+    def get_fields(self):
+        fields = super().get_fields()
+        params = sparse_params(self.context.get("request"))
+        if params is None or not self._is_root():
+            return fields
+
+        only, expand = params
+        for name, field in list(fields.items()):
+            if field.write_only:
+                continue
+            if only is not None and name not in only and name not in expand:
+                del fields[name]
+            elif isinstance(field, serializers.BaseSerializer) and name not in expand:
+                # get_fields এ field এখনো bind হয়নি → source না দিলে field name
+                source = field.source or name
+                if "." in source or source == "*":
+                    continue
+                fields[name] = _collapse(field, name, source)
+        return fields
+
+
+def _select_related_paths(tree, prefix=""):
+    for name, children in tree.items():
+        path = f"{prefix}{name}"
+        if children:
+            yield from _select_related_paths(children, f"{path}__")
+        else:
+            yield path
+
+
+def narrow_select_related(queryset, serializer):
+    """
+    Serializer এ যে relation গুলো আর nested/dotted source হিসেবে লাগবে না,
+    queryset এর select_related থেকে সেগুলোর join বাদ।
+    """
+    select_related = queryset.query.select_related
+    if not isinstance(select_related, dict):
+        return queryset
+
+    needed = set()
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        if isinstance(field, serializers.BaseSerializer) or "." in field.source:
+            needed.add(field.source.split(".")[0])
+
+    paths = list(_select_related_paths(select_related))
+    kept = [p for p in paths if p.split("__")[0] in needed]
+    if len(kept) == len(paths):
+        return queryset
+    queryset = queryset.select_related(None)
+    return queryset.select_related(*kept) if kept else queryset
+
+
+class SparseFieldsViewMixin:
+    """
+    DynamicFieldsSerializerMixin serializer ব্যবহার করা viewset এ,
+    ?fields= / ?expand= থাকলে list/retrieve এর join ও কমে যায়।
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if sparse_params(self.request) is None:
+            return queryset
+        return narrow_select_related(queryset, self.get_serializer())
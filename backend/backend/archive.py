@@ -0,0 +1,238 @@
+# backend/backend/archive.py
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, models, transaction
+from django.db.models.sql import Query
+from django.utils import timezone
+
+from backend.mixins import AuditMixin, bump_table_version
+
+# -------------------------------
+# 🔹 Soft-deleted row archive
+# -------------------------------
+# Retention window এর চেয়ে পুরোনো is_deleted=True row গুলো hot table থেকে
+# <table>_archive এ চলে যায় (একই column + archived_at, কোনো unique/FK constraint নেই)।
+# <table>_all view = hot UNION ALL archive → objects.all_with_deleted() এটা থেকে পড়ে,
+# তাই hot table এ শুধু live (আর সদ্য deleted) data থাকে, history হারায় না।
+#
+# যে row কে অন্য কোনো row (alive বা deleted) FK / M2M দিয়ে refer করে সেটা move হয় না,
+# child আগে archive হলে পরের pass এ parent ও যায়।
+
+ARCHIVE_READY_KEY = "archive:ready:{label}"
+ARCHIVE_READY_TIMEOUT = 5 * 60
+
+
+def archive_table_name(model):
+    return f"{model._meta.db_table}_archive"
+
+
+def union_view_name(model):
+    return f"{model._meta.db_table}_all"
+
+
+def archivable_models():
+    return [
+        m for m in apps.get_models()
+        if issubclass(m, AuditMixin) and m._meta.managed and not m._meta.proxy
+    ]
+
+
+def _execute(connection, sql, params=None):
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+
+def _ready_key(model):
+    return ARCHIVE_READY_KEY.format(label=model._meta.label_lower)
+
+
+def _column_types(connection, table):
+    # PostgreSQL: {column: "numeric(12,2)"} → hot আর archive এর type মেলানোর জন্য
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT attname, format_type(atttypid, atttypmod) FROM pg_attribute "
+            "WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped",
+            [connection.ops.quote_name(table)],
+        )
+        return dict(cursor.fetchall())
+
+
+def ensure_archive(model, using="default"):
+    """
+    Archive table না থাকলে বানায়, hot table এর নতুন column / বদলানো type archive এ নেয়,
+    view আবার বানায়। পুরোটা একটা transaction এ → মাঝপথে কেউ view ছাড়া অবস্থা দেখে না।
+    """
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    hot, archive, view = model._meta.db_table, archive_table_name(model), union_view_name(model)
+    columns = [f.column for f in model._meta.concrete_fields]
+
+    with transaction.atomic(using=using):
+        with connection.cursor() as cursor:
+            existing = set(connection.introspection.table_names(cursor, include_views=True))
+
+        # view থাকলে archive এর column type বদলানো যায় না → আগে drop, শেষে আবার create
+        _execute(connection, f"DROP VIEW IF EXISTS {qn(view)}")
+
+        if archive not in existing:
+            if connection.vendor == "postgresql":
+                # LIKE → শুধু column আর default, PK/unique/FK constraint আসে না
+                _execute(connection, f"CREATE TABLE {qn(archive)} (LIKE {qn(hot)} INCLUDING DEFAULTS)")
+            else:
+                _execute(connection, f"CREATE TABLE {qn(archive)} AS SELECT * FROM {qn(hot)} WHERE 1 = 0")
+            archived_at = models.DateTimeField().db_type(connection)
+            _execute(connection, f"ALTER TABLE {qn(archive)} ADD COLUMN {qn('archived_at')} {archived_at} NULL")
+            _execute(connection, f"CREATE INDEX {qn(archive + '_pk')} ON {qn(archive)} ({qn(model._meta.pk.column)})")
+        elif connection.vendor == "postgresql":
+            hot_types = _column_types(connection, hot)
+            archive_types = _column_types(connection, archive)
+            for column in columns:
+                if column not in archive_types:
+                    _execute(connection, f"ALTER TABLE {qn(archive)} ADD COLUMN {qn(column)} {hot_types[column]} NULL")
+                elif archive_types[column] != hot_types[column]:
+                    _execute(
+                        connection,
+                        f"ALTER TABLE {qn(archive)} ALTER COLUMN {qn(column)} "
+                        f"TYPE {hot_types[column]} USING {qn(column)}::{hot_types[column]}",
+                    )
+            # model থেকে সরানো column (LIKE এ আসা NOT NULL সহ) নতুন INSERT আটকাবে না
+            for column in set(archive_types) - set(columns) - {"archived_at"}:
+                _execute(connection, f"ALTER TABLE {qn(archive)} ALTER COLUMN {qn(column)} DROP NOT NULL")
+        else:
+            # sqlite ইত্যাদি: column type loose, শুধু নতুন column যোগ
+            with connection.cursor() as cursor:
+                have = {c.name for c in connection.introspection.get_table_description(cursor, archive)}
+            for field in model._meta.concrete_fields:
+                if field.column not in have:
+                    _execute(connection, f"ALTER TABLE {qn(archive)} ADD COLUMN {qn(field.column)} {field.db_type(connection)} NULL")
+
+        select = ", ".join(qn(c) for c in columns)
+        _execute(
+            connection,
+            f"CREATE VIEW {qn(view)} AS "
+            f"SELECT {select} FROM {qn(hot)} UNION ALL SELECT {select} FROM {qn(archive)}",
+        )
+    cache.set(_ready_key(model), True, timeout=ARCHIVE_READY_TIMEOUT)
+
+
+def has_archive(model, using="default"):
+    key = _ready_key(model)
+    ready = cache.get(key)
+    if ready is None:
+        connection = connections[using]
+        with connection.cursor() as cursor:
+            ready = union_view_name(model) in connection.introspection.table_names(cursor, include_views=True)
+        # timeout আছে → migrate এ view drop / recreate হলে অন্য process ও কিছুক্ষণের মধ্যে দেখে
+        cache.set(key, ready, timeout=ARCHIVE_READY_TIMEOUT)
+    return ready
+
+
+# -------------------------------
+# 🔹 migrate এর আগে / পরে (api/apps.py তে connect)
+# -------------------------------
+# View থাকলে PostgreSQL hot table এর column type বদলাতে দেয় না
+# ("cannot alter type of a column used by a view"), তাই migrate এর আগে সব view drop,
+# পরে যেসব model এর archive table আছে সেগুলোর archive sync + view আবার create।
+
+def drop_archive_views(using="default", **kwargs):
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        existing = set(connection.introspection.table_names(cursor, include_views=True))
+    with transaction.atomic(using=using):
+        for model in archivable_models():
+            if union_view_name(model) in existing:
+                _execute(connection, f"DROP VIEW {qn(union_view_name(model))}")
+            # migrate চলাকালীন all_with_deleted() শুধু hot table পড়বে
+            cache.set(_ready_key(model), False, timeout=ARCHIVE_READY_TIMEOUT)
+
+
+def refresh_archives(using="default", **kwargs):
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        existing = set(connection.introspection.table_names(cursor))
+    for model in archivable_models():
+        if archive_table_name(model) in existing and model._meta.db_table in existing:
+            ensure_archive(model, using)
+
+
+class UnionViewQuery(Query):
+    """Base table এর বদলে <table>_all view থেকে SELECT (filter / join সব আগের মতো)"""
+
+    def get_initial_alias(self):
+        if not self.alias_map and self.model is not None:
+            return self.join(self.base_table_class(union_view_name(self.model), None))
+        return super().get_initial_alias()
+
+
+def with_archive(queryset):
+    if not has_archive(queryset.model, queryset.db):
+        return queryset
+    queryset.query = queryset.query.chain(UnionViewQuery)
+    return queryset
+
+
+def _reference_filter(model):
+    # অন্য কোনো row (deleted সহ) এই row কে refer করলে move করা যাবে না (FK constraint)
+    references = {}
+    for i, rel in enumerate(model._meta.related_objects):
+        if rel.many_to_many:
+            lookup = {rel.field.name: models.OuterRef("pk")}
+        else:
+            lookup = {rel.field.attname: models.OuterRef(rel.field.target_field.attname)}
+        references[f"_ref_{i}"] = models.Exists(rel.related_model._base_manager.filter(**lookup))
+    for i, field in enumerate(model._meta.many_to_many):
+        through = field.remote_field.through
+        references[f"_m2m_{i}"] = models.Exists(
+            through._base_manager.filter(**{field.m2m_field_name(): models.OuterRef("pk")})
+        )
+    return references
+
+
+def archive_deleted_rows(model, retention_days=None, batch_size=1000, using="default"):
+    """
+    Retention এর চেয়ে পুরোনো soft-deleted row batch করে archive এ move করে।
+    প্রতিটা batch আলাদা transaction (INSERT ... SELECT + DELETE) → lock ছোট থাকে।
+    Return: কতগুলো row move হলো
+    """
+    if retention_days is None:
+        retention_days = settings.ARCHIVE_RETENTION_DAYS
+    ensure_archive(model, using)
+
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    hot, archive = qn(model._meta.db_table), qn(archive_table_name(model))
+    pk = qn(model._meta.pk.column)
+    columns = ", ".join(qn(f.column) for f in model._meta.concrete_fields)
+
+    references = _reference_filter(model)
+    candidates = (
+        model.all_objects.using(using)
+        .filter(is_deleted=True, deleted_at__lt=timezone.now() - timedelta(days=retention_days))
+        .alias(**references)
+        .filter(**{alias: False for alias in references})
+        .order_by("pk")
+    )
+
+    moved = 0
+    while True:
+        with transaction.atomic(using=using):
+            ids = list(candidates.select_for_update(skip_locked=True, of=("self",)).values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                break
+            placeholders = ", ".join(["%s"] * len(ids))
+            _execute(
+                connection,
+                f"INSERT INTO {archive} ({columns}, {qn('archived_at')}) "
+                f"SELECT {columns}, %s FROM {hot} WHERE {pk} IN ({placeholders})",
+                [connection.ops.adapt_datetimefield_value(timezone.now()), *ids],
+            )
+            _execute(connection, f"DELETE FROM {hot} WHERE {pk} IN ({placeholders})", ids)
+        moved += len(ids)
+
+    if moved:
+        bump_table_version(model)
+    return moved
@@ -0,0 +1,111 @@
+# backend/backend/bulk.py
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from audit.events import record_event
+from backend.mixins import bump_table_version, delete_blockers
+from backend.scope import TenantScopeMixin, object_scope_queryset
+
+# -------------------------------
+# 🔹 Bulk soft delete / restore
+# -------------------------------
+# POST <list-url>/bulk-delete/  {"ids": [1, 2, 3]}
+# POST <list-url>/bulk-restore/ {"ids": [1, 2, 3]}
+#
+# পুরো id set এর জন্য একটা child check (delete_blockers) আর একটা UPDATE।
+# যে row এ alive child আছে সেগুলো বাদ দিয়ে বাকিগুলো delete হয়, response এ কারণসহ report।
+# Permission class এর ACTION_MAP এ bulk_delete / bulk_restore → "delete"।
+# TenantScopeMixin ছাড়া view এ candidate row গুলো object scope দিয়ে filter হয়
+# (single destroy এর has_object_permission এর মতো), scope এর বাইরের id → not_found।
+
+BULK_MAX_IDS = 10000
+
+
+def _parse_ids(request):
+    ids = request.data.get("ids")
+    if not isinstance(ids, list) or not ids:
+        return None, "ids must be a non-empty list"
+    if len(ids) > BULK_MAX_IDS:
+        return None, f"At most {BULK_MAX_IDS} ids per request"
+    try:
+        return list({int(pk) for pk in ids}), None
+    except (TypeError, ValueError):
+        return None, "ids must be integers"
+
+
+class BulkSoftDeleteMixin:
+    """AuditMixin model এর ModelViewSet এ bulk-delete / bulk-restore action"""
+
+    def _bulk_scope(self, queryset):
+        if isinstance(self, TenantScopeMixin):
+            return self.scope_queryset(queryset)
+        return object_scope_queryset(self.request.user, queryset)
+
+    def get_bulk_delete_queryset(self):
+        queryset = self.get_queryset()
+        # TenantScopeMixin view এর get_queryset আগেই scoped
+        if isinstance(self, TenantScopeMixin):
+            return queryset
+        return self._bulk_scope(queryset)
+
+    def get_bulk_restore_queryset(self):
+        # get_queryset শুধু alive row দেয় → restore এর জন্য deleted row, একই scope এ
+        qs = self.get_queryset().model.all_objects.filter(is_deleted=True)
+        return self._bulk_scope(qs)
+
+    @action(detail=False, methods=["post"], url_path="bulk-delete")
+    def bulk_delete(self, request):
+        ids, error = _parse_ids(request)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = self.get_bulk_delete_queryset()
+        model = queryset.model
+        with transaction.atomic():
+            found = set(queryset.filter(pk__in=ids).values_list("pk", flat=True))
+            blocked = delete_blockers(model, found)
+            deletable = found - set(blocked)
+            deleted = model.all_objects.filter(pk__in=deletable).update(
+                is_deleted=True,
+                deleted_at=timezone.now(),
+                deleted_by=request.user,
+            ) if deletable else 0
+            for pk in deletable:
+                record_event(model, pk, "delete", {"is_deleted": [False, True]}, actor_id=request.user.pk)
+            transaction.on_commit(lambda: bump_table_version(model))
+
+        return Response({
+            "deleted": deleted,
+            "blocked": {
+                pk: f"You need to delete child records first ({', '.join(rels)})."
+                for pk, rels in blocked.items()
+            },
+            "not_found": sorted(set(ids) - found),
+        })
+
+    @action(detail=False, methods=["post"], url_path="bulk-restore")
+    def bulk_restore(self, request):
+        ids, error = _parse_ids(request)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = self.get_bulk_restore_queryset()
+        model = queryset.model
+        with transaction.atomic():
+            found = set(queryset.filter(pk__in=ids).values_list("pk", flat=True))
+            restored = model.all_objects.filter(pk__in=found).update(
+                is_deleted=False,
+                deleted_at=None,
+                deleted_by=None,
+            ) if found else 0
+            for pk in found:
+                record_event(model, pk, "restore", {"is_deleted": [True, False]}, actor_id=request.user.pk)
+            transaction.on_commit(lambda: bump_table_version(model))
+
+        return Response({
+            "restored": restored,
+            "not_found": sorted(set(ids) - found),
+        })
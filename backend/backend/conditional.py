@@ -0,0 +1,95 @@
+# backend/backend/conditional.py
+import hashlib
+from datetime import datetime, timezone
+
+from django.db.models import Count, Max
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+from backend.mixins import get_table_version
+from backend.scope import scope_hash
+
+
+def _related_models(model, tree):
+    # select_related tree → nested serializer এ যে model গুলো render হবে
+    for name, children in tree.items():
+        related = model._meta.get_field(name).related_model
+        yield related
+        yield from _related_models(related, children)
+
+
+# -------------------------------
+# 🔹 Conditional GET (ETag / Last-Modified)
+# -------------------------------
+class ConditionalGetMixin:
+    """
+    list / retrieve এ serialize করার আগেই validator বের করে,
+    If-None-Match / If-Modified-Since match করলে সরাসরি 304।
+
+    List validator  : filtered queryset এর Max(modified_at) + count (একটা aggregate query)
+                      + table version (soft delete / related row change) + user scope hash + full path
+    Detail validator: object এর modified_at + table version + scope hash
+
+    Last-Modified = modified_at আর table version সময়ের মধ্যে যেটা পরে, তাই শুধু
+    If-Modified-Since পাঠানো client ও soft delete / related row change এর পর 304 পায় না।
+    """
+
+    def _table_versions(self, queryset):
+        models = [queryset.model]
+        if isinstance(queryset.query.select_related, dict):
+            models.extend(_related_models(queryset.model, queryset.query.select_related))
+        return [get_table_version(m) for m in models]
+
+    def _last_modified(self, modified_at, versions):
+        # table version = bump এর সময় (time.time_ns)
+        changed = datetime.fromtimestamp(max(versions) / 1e9, tz=timezone.utc)
+        return changed if modified_at is None else max(modified_at, changed)
+
+    def _etag(self, *parts):
+        raw = repr((self.request.get_full_path(), scope_hash(self.request.user), *parts))
+        return '"%s"' % hashlib.sha1(raw.encode()).hexdigest()
+
+    def _not_modified(self, etag, last_modified):
+        headers = self.request.headers
+        if_none_match = headers.get("If-None-Match")
+        if if_none_match is not None:
+            matched = etag in [tag.strip() for tag in if_none_match.split(",")]
+        else:
+            since = parse_http_date_safe(headers.get("If-Modified-Since", ""))
+            matched = since is not None and last_modified is not None and int(last_modified.timestamp()) <= since
+        if matched:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        return None
+
+    def _with_validators(self, response, etag, last_modified):
+        if response.status_code == status.HTTP_200_OK:
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified.timestamp())
+            response["Cache-Control"] = "private, no-cache"
+        return response
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        agg = queryset.order_by().aggregate(last_modified=Max("modified_at"), count=Count("pk"))
+        versions = self._table_versions(queryset)
+        last_modified = self._last_modified(agg["last_modified"], versions)
+        etag = self._etag(last_modified, agg["count"], versions)
+
+        not_modified = self._not_modified(etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+        return self._with_validators(super().list(request, *args, **kwargs), etag, last_modified)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        versions = self._table_versions(self.get_queryset())
+        last_modified = self._last_modified(instance.modified_at, versions)
+        etag = self._etag(instance.pk, last_modified, versions)
+
+        not_modified = self._not_modified(etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+        serializer = self.get_serializer(instance)
+        return self._with_validators(Response(serializer.data), etag, last_modified)
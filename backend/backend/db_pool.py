@@ -0,0 +1,49 @@
+# backend/backend/db_pool.py
+from django.conf import settings
+from django.db import connections
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+# -------------------------------
+# 🔹 Connection pool metrics
+# -------------------------------
+# settings.DB_CONN_MODE অনুযায়ী প্রতিটা database alias এর connection অবস্থা।
+# pool mode এ psycopg_pool এর get_stats() (pool_size, pool_available, requests_waiting,
+# requests_num, connections_num, connections_errors ...)।
+
+
+def pool_stats():
+    stats = {}
+    for alias in connections:
+        wrapper = connections[alias]
+        db = wrapper.settings_dict
+        info = {
+            "mode": settings.DB_CONN_MODE or "per-request",
+            "conn_max_age": db.get("CONN_MAX_AGE", 0),
+            "health_checks": db.get("CONN_HEALTH_CHECKS", False),
+            "connected": wrapper.connection is not None,
+        }
+        # pool property শুধু PostgreSQL backend এ থাকে, pool option না থাকলে None
+        pool = getattr(wrapper, "pool", None)
+        if pool is not None:
+            info["pool"] = {
+                "name": pool.name,
+                "min_size": pool.min_size,
+                "max_size": pool.max_size,
+                **pool.get_stats(),
+            }
+        stats[alias] = info
+    return stats
+
+
+class DatabasePoolView(APIView):
+    """GET /api/db-pool/ → প্রতিটা database alias এর connection/pool metrics (শুধু superuser)"""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if not request.user.is_superuser:
+            return Response({"detail": "Access denied"}, status=status.HTTP_403_FORBIDDEN)
+        return Response(pool_stats())
@@ -0,0 +1,107 @@
+# backend/backend/db_router.py
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from rest_framework.permissions import SAFE_METHODS
+
+# -------------------------------
+# 🔹 Read replica routing
+# -------------------------------
+# GET/HEAD/OPTIONS request এর read query গুলো replica তে যায়, বাকি সব primary (default) তে।
+# কোনো user write করলে REPLICA_PIN_SECONDS পর্যন্ত তার read ও primary থেকে
+# (replication lag এ নিজের সদ্য save করা data না দেখার সমস্যা এড়াতে)।
+# settings.DATABASES এ replica alias না থাকলে সবকিছু আগের মতো default এ।
+
+PIN_KEY = "db:pin_primary:{user_id}"
+
+_read_alias = ContextVar("read_alias", default=None)
+
+
+def replica_alias():
+    alias = getattr(settings, "DATABASE_REPLICA_ALIAS", "replica")
+    return alias if alias in settings.DATABASES else None
+
+
+def pin_to_primary(user_id):
+    cache.set(PIN_KEY.format(user_id=user_id), 1, timeout=settings.REPLICA_PIN_SECONDS)
+
+
+def is_pinned(user_id):
+    return cache.get(PIN_KEY.format(user_id=user_id)) is not None
+
+
+def _token_user_id(request):
+    """
+    JWT authentication DRF view এর ভিতরে হয় → middleware এ request.user এখনো anonymous।
+    তাই access token থেকে সরাসরি user id (signature check, DB query নেই)।
+    """
+    from rest_framework_simplejwt.authentication import JWTAuthentication
+    from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+    from rest_framework_simplejwt.settings import api_settings
+
+    auth = JWTAuthentication()
+    header = auth.get_header(request)
+    raw_token = auth.get_raw_token(header) if header else None
+    if raw_token is None:
+        return None
+    try:
+        return auth.get_validated_token(raw_token).get(api_settings.USER_ID_CLAIM)
+    except (InvalidToken, TokenError):
+        return None
+
+
+class ReplicaRouter:
+    """
+    settings.DATABASE_ROUTERS = ["backend.db_router.ReplicaRouter"]
+
+    Replica alias শুধু ReplicaRoutingMiddleware যখন current request এর জন্য
+    set করে তখনই ব্যবহার হয় (management command, shell, celery → সব default)।
+    """
+
+    def db_for_read(self, model, **hints):
+        alias = _read_alias.get()
+        if alias is None:
+            return "default"
+        # transaction এর ভিতরে read → primary (নিজের uncommitted write দেখতে)
+        if connections["default"].in_atomic_block:
+            return "default"
+        return alias
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replica হলো primary র copy → একই data
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == "default"
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Safe method + replica configured + user সম্প্রতি write করেনি → read replica তে।
+    Unsafe method এর পর user কে REPLICA_PIN_SECONDS এর জন্য primary তে pin করে।
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        alias = replica_alias()
+        if alias is None:
+            return self.get_response(request)
+
+        user_id = _token_user_id(request)
+        use_replica = request.method in SAFE_METHODS and not (user_id is not None and is_pinned(user_id))
+        token = _read_alias.set(alias if use_replica else None)
+        try:
+            response = self.get_response(request)
+        finally:
+            _read_alias.reset(token)
+
+        if request.method not in SAFE_METHODS and user_id is not None:
+            pin_to_primary(user_id)
+        return response
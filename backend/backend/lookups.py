@@ -0,0 +1,117 @@
+# backend/backend/lookups.py
+from django.apps import apps
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from backend.mixins import get_table_version
+from backend.scope import compile_scope_predicate, scope_hash
+from users.permission_engine import get_permission_snapshot
+
+# -------------------------------
+# 🔹 Dropdown lookup registry
+# -------------------------------
+# entity → (model label, name field, scope fields, include_unassigned, (permission column, module))
+# scope fields এর মানে TenantScopeMixin.scope_fields এর মতোই (None → level skip, {} → unscoped)
+# permission → matching viewset এর module permission, "view" না থাকলে 403
+COMPANY_ONLY = {"company": "company_id", "business_type": None, "factory": None}
+FULL_SCOPE = {"company": "company_id", "business_type": "business_type_id", "factory": "factory_id"}
+
+LOOKUPS = {
+    "companies": ("company.Company", "name", {"company": "id", "business_type": None, "factory": None}, False,
+                  ("company_module", "company")),
+    "business-types": ("company.BusinessType", "name", {"company": "company_id", "business_type": "id", "factory": None}, False,
+                       ("company_module", "business_type")),
+    "factories": ("company.Factory", "name", {"company": "company_id", "business_type": None, "factory": "id"}, False,
+                  ("company_module", "factory")),
+    "product-types": ("products.ProductType", "name", FULL_SCOPE, False, ("product_module", "product_type")),
+    "categories": ("products.Category", "name", FULL_SCOPE, False, ("product_module", "category")),
+    "units": ("products.Unit", "name", FULL_SCOPE, True, ("product_module", "unit")),
+    "unit-sizes": ("products.UnitSize", "size_name", {
+        "company": "unit__company_id",
+        "business_type": "unit__business_type_id",
+        "factory": "unit__factory_id",
+    }, True, ("product_module", "unit_size")),
+    "party-types": ("party_type.PartyType", "name", COMPANY_ONLY, False, ("party_type_module", "party_type")),
+    "bag-types": ("essential_settings.BagType", "name", {}, False, ("settings_module", "bag_type")),
+    "pallot-types": ("pallot.PallotType", "name", COMPANY_ONLY, False, ("pallot_module", "pallot_type")),
+    "chambers": ("pallot.Chamber", "name", COMPANY_ONLY, False, ("pallot_module", "chamber")),
+}
+
+LOOKUP_TIMEOUT = 60 * 60
+LOOKUP_KEY = "lookup:{entity}:{version}:{scope}"
+
+
+def _scope_models(model, scope_fields):
+    # "unit__company_id" → Unit: scope column অন্য table এ থাকলে সেই table বদলালেও list বদলায়
+    models = [model]
+    for path in scope_fields.values():
+        current = model
+        for part in (path or "").split("__")[:-1]:
+            current = current._meta.get_field(part).related_model
+            if current not in models:
+                models.append(current)
+    return models
+
+
+def _build_lookup(user, model, name_field, scope_fields, include_unassigned):
+    qs = model.objects.all()
+    if scope_fields and not (user.is_superuser or user.is_staff):
+        predicate = compile_scope_predicate(
+            get_permission_snapshot(user),
+            company_field=scope_fields.get("company"),
+            business_type_field=scope_fields.get("business_type"),
+            factory_field=scope_fields.get("factory"),
+            include_unassigned=include_unassigned,
+        )
+        if predicate is None:
+            return []
+        qs = qs.filter(predicate)
+    rows = qs.order_by(name_field, "id").values_list("id", name_field)
+    return [{"id": pk, "name": name} for pk, name in rows]
+
+
+class LookupView(APIView):
+    """
+    GET /api/lookups/<entity>/ → [{"id", "name"}] (user এর scope অনুযায়ী)
+
+    Response per (entity, table version, scope) cache হয়।
+    AuditMixin save/delete এ table version বদলায় → cache আর ETag দুটোই invalid।
+    Scope যে related table দিয়ে (unit-sizes → Unit) তার version ও key তে থাকে।
+    If-None-Match match করলে DB/cache data না ছুঁয়েই 304।
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, entity):
+        config = LOOKUPS.get(entity)
+        if config is None:
+            return Response({"error": f"Unknown lookup '{entity}'"}, status=status.HTTP_404_NOT_FOUND)
+
+        label, name_field, scope_fields, include_unassigned, (column, module) = config
+        model = apps.get_model(label)
+        user = request.user
+        # viewset এর মতো: module এ view না থাকলে scope এর ভিতরের id/name ও দেখা যাবে না
+        if not (user.is_superuser or user.is_staff) and not get_permission_snapshot(user).has(column, module, "view"):
+            raise PermissionDenied(f"You cannot perform view on {module}")
+
+        scope = scope_hash(user) if scope_fields else "all"
+        version = "-".join(str(get_table_version(m)) for m in _scope_models(model, scope_fields))
+        etag = f'"{entity}-{version}-{scope}"'
+
+        if etag in request.headers.get("If-None-Match", ""):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        key = LOOKUP_KEY.format(entity=entity, version=version, scope=scope)
+        data = cache.get(key)
+        if data is None:
+            data = _build_lookup(user, model, name_field, scope_fields, include_unassigned)
+            cache.set(key, data, timeout=LOOKUP_TIMEOUT)
+
+        response = Response(data)
+        response["ETag"] = etag
+        response["Cache-Control"] = "private, no-cache"
+        return response
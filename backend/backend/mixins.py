@@ -1,6 +1,10 @@
 # backend/backend/mixins.py
-from django.db import models
+import time
+
+from django.db import models, transaction
+from django.db.models.fields.files import FieldFile
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 from rest_framework.exceptions import ValidationError as DRFValidationError
@@ -16,6 +20,14 @@ class SoftDeleteQuerySet(models.QuerySet):
     def deleted(self):
         return self.filter(is_deleted=True)
 
+    def update(self, **kwargs):
+        # queryset.update() save() এড়িয়ে যায় → table version এখানেই bump
+        rows = super().update(**kwargs)
+        if rows:
+            model = self.model
+            transaction.on_commit(lambda: bump_table_version(model), using=self.db)
+        return rows
+
 
 class SoftDeleteManager(models.Manager):
     def get_queryset(self):
@@ -23,14 +35,131 @@ class SoftDeleteManager(models.Manager):
         return SoftDeleteQuerySet(self.model, using=self._db).alive()
 
     def all_with_deleted(self):
-        # সব data (deleted সহ)
-        return SoftDeleteQuerySet(self.model, using=self._db).all()
+        # সব data (deleted সহ, archive এ move হওয়া row ও — backend/archive.py)
+        from backend.archive import with_archive
+
+        return with_archive(SoftDeleteQuerySet(self.model, using=self._db).all())
 
     def only_deleted(self):
         # শুধু deleted data
         return SoftDeleteQuerySet(self.model, using=self._db).deleted()
 
 
+# -------------------------------
+# 🔹 Table version (cache invalidation)
+# -------------------------------
+# AuditMixin model এর যেকোনো row save/delete হলে সেই table এর version বদলায়।
+# Lookup / conditional GET cache key তে version থাকে → পুরোনো entry আর match করে না।
+# objects.filter(...).update() নিজেই bump করে (SoftDeleteQuerySet.update)।
+# save() এড়ানো বাকি write (bulk_create, bulk_update, all_objects.update, raw SQL)
+# এর পরে caller কে bump_table_version(model) call করতে হবে।
+TABLE_VERSION_KEY = "table:version:{label}"
+
+
+def get_table_version(model):
+    return cache.get_or_set(TABLE_VERSION_KEY.format(label=model._meta.label_lower), time.time_ns, timeout=None)
+
+
+def bump_table_version(model):
+    cache.set(TABLE_VERSION_KEY.format(label=model._meta.label_lower), time.time_ns(), timeout=None)
+
+
+# -------------------------------
+# 🔹 Alive-row partial indexes
+# -------------------------------
+ALIVE = models.Q(is_deleted=False)
+
+
+def alive_indexes(prefix, *field_groups):
+    """
+    AuditMixin subclass এর Meta.indexes এর জন্য WHERE is_deleted = false partial index।
+    SoftDeleteManager এর সব query এই condition দেয়, তাই deleted history যত বাড়ুক index ছোট থাকে।
+
+        indexes = alive_indexes("party", ("company", "code"))
+
+    unique=True column এ single-column alive index দেওয়া হয় না: full unique index এ
+    lookup এমনিতেই ≤1 row, partial টা শুধু write cost বাড়ায়।
+    """
+    indexes = []
+    for group in field_groups:
+        fields = [group] if isinstance(group, str) else list(group)
+        name = f"{prefix}_{'_'.join(f.lstrip('-') for f in fields)}_alive"
+        if len(name) > 30:
+            raise ValueError(f"Index name '{name}' is longer than 30 characters")
+        indexes.append(models.Index(fields=fields, name=name, condition=ALIVE))
+    return indexes
+
+
+# -------------------------------
+# 🔹 Delete guard (alive child check)
+# -------------------------------
+# Model class প্রতি একবার plan বানিয়ে রাখা হয়: যেসব reverse relation এর child model এ
+# is_deleted আছে (AuditMixin), সেগুলোর জন্য একটা করে EXISTS subquery।
+# সব EXISTS একটা SELECT এ → যত relation ই থাকুক, check এ একটাই query।
+_DELETE_PLANS = {}
+
+
+def _delete_plan(model):
+    plan = _DELETE_PLANS.get(model)
+    if plan is None:
+        plan = []
+        for rel in model._meta.related_objects:
+            child = rel.related_model
+            if not any(f.name == "is_deleted" for f in child._meta.concrete_fields):
+                continue
+            if rel.many_to_many:
+                lookup = {rel.field.name: models.OuterRef("pk")}
+            else:
+                lookup = {rel.field.attname: models.OuterRef(rel.field.target_field.attname)}
+            plan.append((rel.get_accessor_name(), child, lookup))
+        _DELETE_PLANS[model] = plan
+    return plan
+
+
+def delete_blockers(model, pks, using=None):
+    """
+    {pk: [relation accessor, ...]} → কোন row এর কোন relation এ alive child আছে।
+    শুধু blocked row গুলো return হয়; খালি dict মানে সব row delete করা যাবে।
+    """
+    plan = _delete_plan(model)
+    pks = list(pks)
+    if not plan or not pks:
+        return {}
+
+    checks = {
+        f"_child_{i}": models.Exists(child._base_manager.filter(is_deleted=False, **lookup))
+        for i, (_, child, lookup) in enumerate(plan)
+    }
+    any_child = models.Q()
+    for alias in checks:
+        any_child |= models.Q(**{alias: True})
+
+    rows = (
+        model._base_manager.using(using or "default")
+        .filter(pk__in=pks)
+        .annotate(**checks)
+        .filter(any_child)
+        .values("pk", *checks)
+    )
+    return {
+        row["pk"]: [plan[i][0] for i, alias in enumerate(checks) if row[alias]]
+        for row in rows
+    }
+
+
+# audit event diff এ এই field গুলো ধরা হয় না (actor / timestamp event এ আলাদা থাকে)
+AUDIT_SKIP_FIELDS = {
+    "created_at", "modified_at", "created_by", "modified_by",
+    "ip_address", "browser_info", "deleted_at", "deleted_by",
+    "password", "last_login",
+}
+
+
+def _audit_value(value):
+    # file field → শুধু path, বাকি সব DjangoJSONEncoder সামলায়
+    return value.name if isinstance(value, FieldFile) else value
+
+
 # -------------------------------
 # 🔹 Audit + Soft Delete Base Mixin
 # -------------------------------
@@ -70,9 +199,66 @@ class AuditMixin(models.Model):
     objects = SoftDeleteManager()       # Default → alive data only
     all_objects = models.Manager()      # সব data (deleted সহ)
 
+    # এই field গুলোর point-in-time history রাখা হয় (audit/history.py)
+    history_fields = ()
+
     class Meta:
         abstract = True
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # audit diff এর জন্য load হওয়া value (extra query নেই)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def _audit_fields(self, update_fields=None):
+        for field in self._meta.concrete_fields:
+            if field.primary_key or field.name in AUDIT_SKIP_FIELDS:
+                continue
+            if update_fields is not None and field.name not in update_fields and field.attname not in update_fields:
+                continue
+            yield field
+
+    def _record_audit_event(self, adding, update_fields):
+        from audit.events import record_event
+
+        loaded = getattr(self, "_loaded_values", None)
+        if adding or loaded is None:
+            action = "create" if adding else "update"
+            changes = {
+                f.attname: _audit_value(getattr(self, f.attname))
+                for f in self._audit_fields(update_fields)
+                if getattr(self, f.attname) is not None
+            }
+        else:
+            changes = {}
+            for f in self._audit_fields(update_fields):
+                if f.attname not in loaded:
+                    continue
+                old, new = _audit_value(loaded[f.attname]), _audit_value(getattr(self, f.attname))
+                if old != new:
+                    changes[f.attname] = [old, new]
+            if not changes:
+                return
+            action = "update"
+            if "is_deleted" in changes:
+                action = "delete" if self.is_deleted else "restore"
+
+        record_event(type(self), self.pk, action, changes, actor_id=self.deleted_by_id if action == "delete" else self.modified_by_id)
+        self._loaded_values = {f.attname: getattr(self, f.attname) for f in self._meta.concrete_fields}
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        model = type(self)
+        transaction.on_commit(lambda: bump_table_version(model))
+        if self.history_fields:
+            from audit.history import record_history
+
+            record_history(self, adding, kwargs.get("update_fields"), getattr(self, "_loaded_values", None))
+        self._record_audit_event(adding, kwargs.get("update_fields"))
+
     # 🔹 Soft delete method
 
     def delete(self, using=None, keep_parents=False, user=None):
@@ -80,14 +266,11 @@ class AuditMixin(models.Model):
         Override delete → soft delete only.
         If child exists (not deleted), block delete.
         """
-        for rel in self._meta.related_objects:
-            accessor = rel.get_accessor_name()
-            related_qs = getattr(self, accessor).all()
-
-            # child model এ যদি AuditMixin থাকে (is_deleted field থাকে) → তখন চেক করবো
-            if hasattr(related_qs, "filter") and related_qs.filter(is_deleted=False).exists():
-                # 🔹 DRF-friendly exception
-                raise DRFValidationError("You need to delete child records first.")
+        # child model এ যদি AuditMixin থাকে (is_deleted field থাকে) → তখন চেক করবো (একটা query)
+        blocking = delete_blockers(type(self), [self.pk], using=using).get(self.pk)
+        if blocking:
+            # 🔹 DRF-friendly exception
+            raise DRFValidationError(f"You need to delete child records first ({', '.join(blocking)}).")
 
         self.is_deleted = True
         self.deleted_at = timezone.now()
@@ -98,4 +281,11 @@ class AuditMixin(models.Model):
 
     # 🔹 Hard delete (database থেকে একেবারে মুছে ফেলা)
     def hard_delete(self, using=None, keep_parents=False):
-        return super().delete(using=using, keep_parents=keep_parents)
\ No newline at end of file
+        from audit.events import record_event
+
+        pk = self.pk
+        result = super().delete(using=using, keep_parents=keep_parents)
+        model = type(self)
+        transaction.on_commit(lambda: bump_table_version(model))
+        record_event(model, pk, "hard_delete", actor_id=self.modified_by_id)
+        return result
\ No newline at end of file
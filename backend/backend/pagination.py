@@ -0,0 +1,118 @@
+# backend/backend/pagination.py
+import json
+
+from django.db import connections
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def approximate_count(queryset):
+    """
+    PostgreSQL এ planner এর row estimate (EXPLAIN) → বড় table এ COUNT(*) scan লাগে না।
+    অন্য database এ সাধারণ count()।
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+# -------------------------------
+# 🔹 Keyset (cursor) pagination
+# -------------------------------
+class KeysetPagination(CursorPagination):
+    """
+    Project-wide default pagination (settings.REST_FRAMEWORK)।
+    OFFSET এর বদলে ordering column এর last value দিয়ে পরের page → page যত পরেই হোক একই cost।
+
+    View এ:
+        keyset_ordering = ("code",)     # stable/unique column, না দিলে queryset এর ordering বা "-pk"
+        pagination_class = None         # opt-out (পুরো list আগের মতো)
+
+    ?page_size=100          → page size (max_page_size পর্যন্ত)
+    ?count=approx|exact     → response এ total count (approx = planner estimate)
+
+    View এর paginate_by_offset() True দিলে (যেমন ranked search) queryset এর নিজের
+    ordering এ ?offset= দিয়ে page, response এর format একই।
+    """
+
+    page_size_query_param = "page_size"
+    max_page_size = 500
+    ordering = "-pk"
+    count_query_param = "count"
+    offset_query_param = "offset"
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, "keyset_ordering", None)
+        if ordering:
+            return (ordering,) if isinstance(ordering, str) else tuple(ordering)
+
+        # View এ explicit ordering নেই → queryset / Meta.ordering (simple field হলে)
+        ordering = [o for o in (queryset.query.order_by or queryset.model._meta.ordering) if isinstance(o, str)]
+        if not ordering or "__" in ordering[0]:
+            return (self.ordering,)
+        if not {"pk", "-pk", "id", "-id"} & set(ordering):
+            ordering.append("-pk" if ordering[0].startswith("-") else "pk")
+        return tuple(ordering)
+
+    def _paginate_by_offset(self, queryset, request):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.base_url = request.build_absolute_uri()
+        try:
+            self.offset = max(int(request.query_params.get(self.offset_query_param, 0)), 0)
+        except ValueError:
+            self.offset = 0
+        # একটা বেশি row → পরের page আছে কিনা (COUNT ছাড়া)
+        rows = list(queryset[self.offset:self.offset + self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        return rows[:self.page_size]
+
+    def get_next_link(self):
+        if self.offset is None:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = remove_query_param(self.base_url, self.cursor_query_param)
+        return replace_query_param(url, self.offset_query_param, self.offset + self.page_size)
+
+    def get_previous_link(self):
+        if self.offset is None:
+            return super().get_previous_link()
+        if self.offset <= 0:
+            return None
+        url = remove_query_param(self.base_url, self.cursor_query_param)
+        previous = self.offset - self.page_size
+        if previous <= 0:
+            return remove_query_param(url, self.offset_query_param)
+        return replace_query_param(url, self.offset_query_param, previous)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = None
+        self.offset = None
+        mode = request.query_params.get(self.count_query_param)
+        if view is not None and getattr(view, "paginate_by_offset", None) and view.paginate_by_offset():
+            page = self._paginate_by_offset(queryset, request)
+        else:
+            page = super().paginate_queryset(queryset, request, view)
+        if page is not None and mode == "exact":
+            self.count = queryset.count()
+        elif page is not None and mode == "approx":
+            self.count = approximate_count(queryset)
+        return page
+
+    def get_paginated_response(self, data):
+        payload = {"next": self.get_next_link(), "previous": self.get_previous_link()}
+        if self.count is not None:
+            payload["count"] = self.count
+        payload["results"] = data
+        return Response(payload)
@@ -0,0 +1,335 @@
+# backend/backend/scope.py
+import hashlib
+
+from django.db.models import BooleanField, Expression, F, Q
+from rest_framework.permissions import BasePermission
+
+from users.permission_engine import get_permission_snapshot
+
+
+# -------------------------------
+# 🔹 Array / Row-value IN predicate
+# -------------------------------
+class InArray(Expression):
+    """
+    (col_a, col_b, ...) IN rows
+
+    PostgreSQL এ rows গুলো column-wise array হিসেবে bind হয়:
+        "company_id" = ANY(%s)
+        ("company_id", "business_type_id") IN (SELECT * FROM unnest(%s::bigint[], %s::bigint[]))
+    তাই grant সংখ্যা যত বাড়ুক, SQL এর shape একই থাকে (plan cache friendly)।
+    """
+
+    conditional = True
+
+    def __init__(self, fields, rows):
+        super().__init__(output_field=BooleanField())
+        self.fields = [F(f) if isinstance(f, str) else f for f in fields]
+        self.rows = [tuple(r) if isinstance(r, (list, tuple)) else (r,) for r in rows]
+
+    def get_source_expressions(self):
+        return self.fields
+
+    def set_source_expressions(self, exprs):
+        self.fields = list(exprs)
+
+    def _compile_columns(self, compiler):
+        sqls, params = [], []
+        for f in self.fields:
+            sql, p = compiler.compile(f)
+            sqls.append(sql)
+            params.extend(p)
+        return sqls, params
+
+    def as_sql(self, compiler, connection):
+        # Generic fallback (sqlite ইত্যাদি) → row-value IN list
+        cols, params = self._compile_columns(compiler)
+        if len(cols) == 1:
+            placeholders = ", ".join(["%s"] * len(self.rows))
+            return f"{cols[0]} IN ({placeholders})", (*params, *(r[0] for r in self.rows))
+        row_sql = "(" + ", ".join(["%s"] * len(cols)) + ")"
+        placeholders = ", ".join([row_sql] * len(self.rows))
+        flat = [v for r in self.rows for v in r]
+        return f"({', '.join(cols)}) IN ({placeholders})", (*params, *flat)
+
+    def as_postgresql(self, compiler, connection):
+        cols, params = self._compile_columns(compiler)
+        arrays = [list(col) for col in zip(*self.rows)]
+        if len(cols) == 1:
+            return f"{cols[0]} = ANY(%s::bigint[])", (*params, arrays[0])
+        unnest = ", ".join(["%s::bigint[]"] * len(cols))
+        return f"({', '.join(cols)}) IN (SELECT * FROM unnest({unnest}))", (*params, *arrays)
+
+
+# -------------------------------
+# 🔹 Tenant Scope Predicate Compiler
+# -------------------------------
+def compile_scope_predicate(
+    snapshot,
+    company_field="company_id",
+    business_type_field="business_type_id",
+    factory_field="factory_id",
+    include_unassigned=False,
+):
+    """
+    Snapshot এর companies / business_types / factories → কয়েকটা fixed-shape predicate।
+    আগের মতো প্রতি company/business type/factory এর জন্য আলাদা Q clause আর .distinct() লাগে না।
+
+    business_type_field / factory_field None হলে সেই level skip হবে।
+    include_unassigned=True হলে NULL business type / factory row গুলো shared ধরা হবে
+    (Unit / UnitSize এর পুরোনো behaviour)।
+
+    কোনো scope না থাকলে None return করে।
+    """
+    companies = []            # company unrestricted
+    bt_pairs = []             # (company, business_type)
+    factory_rows = []         # (company, factory[, business_type])
+    null_bt_factories = []    # (company, factory) → business_type NULL
+    bt_only_companies = []    # unassigned: business_type NULL
+    factory_only_companies = []  # unassigned: factory NULL
+    both_bt_pairs = []        # unassigned: factory NULL, business_type in grants
+    both_companies = []       # unassigned: factory NULL, business_type NULL
+
+    for cid in sorted(snapshot.companies):
+        bts = snapshot.business_types.get(cid, frozenset()) if business_type_field else frozenset()
+        factories = snapshot.factories.get(cid, frozenset()) if factory_field else frozenset()
+
+        if not bts and not factories:
+            companies.append(cid)
+            continue
+
+        if not factories:
+            bt_pairs.extend((cid, bt) for bt in sorted(bts))
+            if include_unassigned:
+                bt_only_companies.append(cid)
+            continue
+
+        for factory_id, bt in sorted(factories, key=lambda pair: (pair[0], pair[1] or 0)):
+            if not business_type_field:
+                factory_rows.append((cid, factory_id))
+            elif bt is None:
+                if not bts or include_unassigned:
+                    null_bt_factories.append((cid, factory_id))
+            elif not bts or bt in bts:
+                factory_rows.append((cid, factory_id, bt))
+
+        if include_unassigned:
+            if bts:
+                both_bt_pairs.extend((cid, bt) for bt in sorted(bts))
+                both_companies.append(cid)
+            else:
+                factory_only_companies.append(cid)
+
+    factory_cols = [company_field, factory_field] + ([business_type_field] if business_type_field else [])
+    predicates = []
+
+    if companies:
+        predicates.append(Q(InArray([company_field], companies)))
+    if bt_pairs:
+        predicates.append(Q(InArray([company_field, business_type_field], bt_pairs)))
+    if factory_rows:
+        predicates.append(Q(InArray(factory_cols, factory_rows)))
+    if null_bt_factories:
+        predicates.append(
+            Q(InArray([company_field, factory_field], null_bt_factories))
+            & Q(**{f"{business_type_field}__isnull": True})
+        )
+    if bt_only_companies:
+        predicates.append(
+            Q(InArray([company_field], bt_only_companies))
+            & Q(**{f"{business_type_field}__isnull": True})
+        )
+    if factory_only_companies:
+        predicates.append(
+            Q(InArray([company_field], factory_only_companies))
+            & Q(**{f"{factory_field}__isnull": True})
+        )
+    if both_bt_pairs:
+        predicates.append(
+            Q(InArray([company_field, business_type_field], both_bt_pairs))
+            & Q(**{f"{factory_field}__isnull": True})
+        )
+    if both_companies:
+        predicates.append(
+            Q(InArray([company_field], both_companies))
+            & Q(**{f"{factory_field}__isnull": True})
+            & Q(**{f"{business_type_field}__isnull": True})
+        )
+    if include_unassigned and not snapshot.companies:
+        predicates.append(Q(**{f"{company_field}__isnull": True}))
+
+    if not predicates:
+        return None
+
+    predicate = predicates[0]
+    for p in predicates[1:]:
+        predicate |= p
+    return predicate
+
+
+def _resolve_field(obj, field):
+    # "unit__company_id" → obj.unit.company_id
+    for part in field.split("__"):
+        if obj is None:
+            return None
+        obj = getattr(obj, part, None)
+    return obj
+
+
+def object_in_scope(
+    snapshot,
+    obj,
+    company_field="company_id",
+    business_type_field="business_type_id",
+    factory_field="factory_id",
+    include_unassigned=False,
+):
+    """
+    compile_scope_predicate এর in-memory version → একটা object scope এর ভিতরে কিনা।
+    কোনো query নেই (select_related না থাকলে traversal এর জন্য lazy load হতে পারে)।
+    """
+    cid = _resolve_field(obj, company_field)
+    if cid is None:
+        return include_unassigned and not snapshot.companies
+    if cid not in snapshot.companies:
+        return False
+
+    bts = snapshot.business_types.get(cid, frozenset()) if business_type_field else frozenset()
+    factories = snapshot.factories.get(cid, frozenset()) if factory_field else frozenset()
+    bt = _resolve_field(obj, business_type_field) if business_type_field else None
+
+    if bts and bt not in bts and not (include_unassigned and bt is None):
+        return False
+
+    if factories:
+        factory_id = _resolve_field(obj, factory_field)
+        if factory_id is None:
+            return include_unassigned
+        if business_type_field:
+            return (factory_id, bt) in factories
+        return any(f == factory_id for f, _ in factories)
+
+    return True
+
+
+def scope_hash(user):
+    """User এর company / business type / factory scope এর ছোট hash (admin → "all")"""
+    if user.is_superuser or user.is_staff:
+        return "all"
+    snapshot = get_permission_snapshot(user)
+    raw = repr((
+        sorted(snapshot.companies),
+        sorted((cid, sorted(ids)) for cid, ids in snapshot.business_types.items()),
+        sorted((cid, sorted(pairs, key=lambda p: (p[0], p[1] or 0))) for cid, pairs in snapshot.factories.items()),
+    ))
+    return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+
+# -------------------------------
+# 🔹 ViewSet Mixin
+# -------------------------------
+class TenantScopeMixin:
+    """
+    get_queryset এর শেষে self.scope_queryset(qs) call করলে user এর
+    company / business type / factory scope অনুযায়ী filter হবে।
+
+    scope_permission_column : UserPermissionSet এর column (e.g. "product_module")
+    scope_module_name       : default → view.module_name
+    scope_actions           : এর যেকোনো একটা action থাকলেই queryset দেখা যাবে
+    scope_fields            : model এর scope column (None → level skip)
+    """
+
+    scope_permission_column = None
+    scope_module_name = None
+    scope_actions = ("view",)
+    scope_fields = {
+        "company": "company_id",
+        "business_type": "business_type_id",
+        "factory": "factory_id",
+    }
+    scope_include_unassigned = False
+
+    def scope_queryset(self, qs):
+        user = self.request.user
+        if user.is_superuser or user.is_staff:
+            return qs
+
+        snapshot = get_permission_snapshot(user)
+        module_name = self.scope_module_name or getattr(self, "module_name", None)
+        if not any(snapshot.has(self.scope_permission_column, module_name, a) for a in self.scope_actions):
+            return qs.none()
+
+        predicate = compile_scope_predicate(
+            snapshot,
+            company_field=self.scope_fields.get("company"),
+            business_type_field=self.scope_fields.get("business_type"),
+            factory_field=self.scope_fields.get("factory"),
+            include_unassigned=self.scope_include_unassigned,
+        )
+        if predicate is None:
+            return qs.none()
+        return qs.filter(predicate)
+
+
+# -------------------------------
+# 🔹 Object-level scope permission
+# -------------------------------
+DEFAULT_OBJECT_SCOPE_FIELDS = ("company_id", "business_type_id", "factory_id")
+
+
+class ObjectScopePermission(BasePermission):
+    """
+    App এর module permission class গুলোর base।
+    has_object_permission আবার has_permission চালায় না (DRF আগেই সেটা pass করিয়েছে),
+    request এর memoized snapshot দিয়ে obj এর company / business type / factory check করে।
+    """
+
+    def has_object_permission(self, request, view, obj):
+        user = request.user
+        if user.is_superuser or user.is_staff:
+            return True
+
+        if isinstance(view, TenantScopeMixin):
+            fields = view.scope_fields
+            include_unassigned = view.scope_include_unassigned
+        else:
+            # Scoped mixin নেই → obj এ যে scope column গুলো আছে সেগুলোই check
+            present = [f if hasattr(obj, f) else None for f in DEFAULT_OBJECT_SCOPE_FIELDS]
+            if present[0] is None:
+                return True
+            fields = dict(zip(("company", "business_type", "factory"), present))
+            include_unassigned = False
+
+        return object_in_scope(
+            get_permission_snapshot(user),
+            obj,
+            company_field=fields.get("company"),
+            business_type_field=fields.get("business_type"),
+            factory_field=fields.get("factory"),
+            include_unassigned=include_unassigned,
+        )
+
+
+def object_scope_queryset(user, queryset):
+    """
+    TenantScopeMixin ছাড়া view এর জন্য ObjectScopePermission এর queryset version:
+    model এ যে scope column (company_id / business_type_id / factory_id) আছে সেগুলো দিয়ে filter।
+    Bulk action এ প্রতিটা row load করে has_object_permission না চালিয়ে একটা predicate।
+    """
+    if user.is_superuser or user.is_staff:
+        return queryset
+
+    attnames = {f.attname for f in queryset.model._meta.concrete_fields}
+    company, business_type, factory = [f if f in attnames else None for f in DEFAULT_OBJECT_SCOPE_FIELDS]
+    if company is None:
+        return queryset
+
+    predicate = compile_scope_predicate(
+        get_permission_snapshot(user),
+        company_field=company,
+        business_type_field=business_type,
+        factory_field=factory,
+    )
+    if predicate is None:
+        return queryset.none()
+    return queryset.filter(predicate)
@@ -0,0 +1,88 @@
+# backend/backend/search.py
+from django.db import connections
+from django.db.models import F, Q, TextField
+from django.db.models.functions import Cast, Greatest, Upper
+
+# -------------------------------
+# 🔹 ?search= (pg_trgm)
+# -------------------------------
+# PostgreSQL এ UPPER(column::text) expression এর উপর gin_trgm_ops index থাকে (migration এ)।
+# Django র icontains (UPPER(col::text) LIKE UPPER('%term%')) আর word similarity (%>)
+# দুটোই একই expression ব্যবহার করে → একটা index এই দুই ধরনের search চলে,
+# বাংলা/English দুই text এ substring ও বানান ভুল দুটোই ধরা পড়ে।
+# অন্য database এ শুধু icontains (rank ছাড়া)।
+
+
+def _search_expression(field):
+    return Upper(Cast(F(field), TextField()))
+
+
+def trigram_index_sql(table, column):
+    name = f"{table}_{column}_trgm"
+    return f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+
+
+def create_trigram_indexes(table, columns):
+    """Migration এর RunPython থেকে call করার জন্য (PostgreSQL ছাড়া অন্য DB তে কিছু করে না)"""
+
+    def forwards(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for column in columns:
+            schema_editor.execute(trigram_index_sql(table, column))
+
+    def backwards(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for column in columns:
+            schema_editor.execute(f'DROP INDEX IF EXISTS "{table}_{column}_trgm"')
+
+    return forwards, backwards
+
+
+class TrigramSearchMixin:
+    """
+    ViewSet এ:
+        search_fields = ("name", "mobile")
+
+    GET ?search=রহিম → match করা row, rank (best word similarity) অনুযায়ী sorted।
+    Rank float আর tie অনেক → cursor এ position ঠিকমতো round-trip হয় না, তাই ranked
+    search এর page গুলো ?offset= দিয়ে (KeysetPagination এটা paginate_by_offset() থেকে জানে)।
+    """
+
+    search_fields = ()
+    search_param = "search"
+
+    def get_search_term(self):
+        return (self.request.query_params.get(self.search_param) or "").strip()
+
+    def _is_postgres(self, queryset):
+        return connections[queryset.db].vendor == "postgresql"
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        term = self.get_search_term()
+        if not term or not self.search_fields:
+            return queryset
+
+        predicate = Q()
+        for field in self.search_fields:
+            predicate |= Q(**{f"{field}__icontains": term})
+
+        if not self._is_postgres(queryset):
+            return queryset.filter(predicate)
+
+        from django.contrib.postgres.lookups import TrigramWordSimilar
+        from django.contrib.postgres.search import TrigramWordSimilarity
+
+        term = term.upper()
+        for field in self.search_fields:
+            predicate |= Q(TrigramWordSimilar(_search_expression(field), term))
+        similarities = [TrigramWordSimilarity(term, _search_expression(field)) for field in self.search_fields]
+        rank = Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+        return queryset.filter(predicate).annotate(search_rank=rank).order_by("-search_rank", "pk")
+
+    def paginate_by_offset(self):
+        # ranked search (PostgreSQL) → offset/limit, বাকি সব keyset
+        return bool(self.get_search_term()) and self._is_postgres(self.get_queryset())
@@ -5,6 +5,7 @@
 
 from pathlib import Path
 from datetime import timedelta
+from decouple import config
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -42,6 +43,7 @@ INSTALLED_APPS = [
     "pallot",
     "loan",
     "essential_settings","accounts",
+    "audit",
     
 ]
 
@@ -54,6 +56,8 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    "backend.db_router.ReplicaRoutingMiddleware",
+    "audit.events.AuditEventMiddleware",
    
 ]
 
@@ -106,6 +110,54 @@ DATABASES = {
     }
 }
 
+# -------------------------------
+# 🔹 Read replica (optional, backend/db_router.py)
+# -------------------------------
+# DB_REPLICA_HOST দিলে safe-method (GET) request এর read গুলো replica তে যায়।
+# না দিলে সব আগের মতো default এ।
+DB_REPLICA_HOST = config("DB_REPLICA_HOST", default="")
+if DB_REPLICA_HOST:
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "NAME": config("DB_REPLICA_NAME", default=DATABASES["default"]["NAME"]),
+        "USER": config("DB_REPLICA_USER", default=DATABASES["default"]["USER"]),
+        "PASSWORD": config("DB_REPLICA_PASSWORD", default=DATABASES["default"]["PASSWORD"]),
+        "HOST": DB_REPLICA_HOST,
+        "PORT": config("DB_REPLICA_PORT", default=DATABASES["default"]["PORT"]),
+        # test run এ replica আলাদা test DB না বানিয়ে default কেই দেখে
+        "TEST": {"MIRROR": "default"},
+    }
+
+# -------------------------------
+# 🔹 Connection reuse (optional, backend/db_pool.py)
+# -------------------------------
+# DB_CONN_MODE:
+#   ""           → আগের মতো, প্রতি request এ নতুন connection
+#   "persistent" → CONN_MAX_AGE পর্যন্ত connection reuse, প্রতি request এর শুরুতে health check
+#   "pool"       → Django র native psycopg 3 pool (pip install -r requirements-pool.txt)
+DB_CONN_MODE = config("DB_CONN_MODE", default="")
+for _db in DATABASES.values():
+    if DB_CONN_MODE == "persistent":
+        _db["CONN_MAX_AGE"] = config("DB_CONN_MAX_AGE", default=60, cast=int)
+        _db["CONN_HEALTH_CHECKS"] = True
+    elif DB_CONN_MODE == "pool":
+        # pool এ CONN_MAX_AGE 0 থাকতে হবে, health check হয় pool থেকে checkout এর সময়
+        _db["CONN_HEALTH_CHECKS"] = True
+        _db["OPTIONS"] = {
+            **_db.get("OPTIONS", {}),
+            "pool": {
+                "min_size": config("DB_POOL_MIN_SIZE", default=2, cast=int),
+                "max_size": config("DB_POOL_MAX_SIZE", default=10, cast=int),
+                "timeout": config("DB_POOL_TIMEOUT", default=10, cast=float),
+                "max_idle": config("DB_POOL_MAX_IDLE", default=300, cast=float),
+            },
+        }
+
+DATABASE_ROUTERS = ["backend.db_router.ReplicaRouter"]
+
+# write করার পর এত second ওই user এর read primary থেকে (replication lag)
+REPLICA_PIN_SECONDS = config("REPLICA_PIN_SECONDS", default=5, cast=int)
+
 
 # Parler settings
 PARLER_LANGUAGES = {
@@ -143,8 +195,17 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": False,
     "BLACKLIST_AFTER_ROTATION": True,
     "AUTH_HEADER_TYPES": ("Bearer",),
+    "TOKEN_OBTAIN_SERIALIZER": "users.serializers.PermissionTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "users.serializers.PermissionTokenRefreshSerializer",
 }
 
+# True হলে access token এ signed permission digest থাকবে (users/token_claims.py)
+# → permission class গুলো DB hit ছাড়াই decide করবে
+PERMISSION_TOKEN_CLAIMS = False
+
+# Blacklisted refresh token jti cache (users/token_blacklist.py) কতক্ষণ পর পর DB থেকে re-warm হবে
+JWT_BLACKLIST_REWARM_TIMEOUT = 60 * 60
+
 
 AUTH_USER_MODEL = "users.CustomUser"
 
@@ -173,11 +234,14 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.PermissionClaimsJWTAuthentication',
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.AllowAny",
     ),
+    # Keyset pagination (backend/pagination.py), view এ pagination_class = None দিলে opt-out
+    "DEFAULT_PAGINATION_CLASS": "backend.pagination.KeysetPagination",
+    "PAGE_SIZE": 50,
 }
 
 
@@ -193,3 +257,22 @@ CACHES = {
 }
 
 
+
+# Compiled permission snapshot (users/permission_engine.py) cache TTL (seconds)
+PERMISSION_SNAPSHOT_TIMEOUT = 60 * 60
+
+# JWT authentication এর cached user row TTL (seconds, users/user_cache.py)
+AUTH_USER_CACHE_TIMEOUT = 5 * 60
+
+# এত দিনের পুরোনো soft-deleted row archive table এ যায় (backend/archive.py, archive_deleted_rows command)
+ARCHIVE_RETENTION_DAYS = 90
+
+# Audit event stream (audit/events.py)
+AUDIT_LOG_ENABLED = True
+AUDIT_LOG_ASYNC = True          # False → response এর পর একই thread এ bulk insert
+AUDIT_BATCH_SIZE = 200
+AUDIT_FLUSH_INTERVAL = 2        # seconds, writer queue wait
+AUDIT_QUEUE_MAX_SIZE = 10000
+
+# Field history (audit/history.py): প্রতি এতগুলো version এ একটা পুরো snapshot
+HISTORY_SNAPSHOT_EVERY = 20
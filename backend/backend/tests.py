@@ -0,0 +1,514 @@
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, models, router
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from users.models import CustomUser, UserPermissionSet
+from users.permission_catalog import get_permission_catalog
+
+# ======================
+# Query-budget harness
+# ======================
+# প্রতিটা router-registered list/detail endpoint realistic data দিয়ে call করে
+# query count আর timing record করে। ViewSet এ `query_budget` না থাকলে DEFAULT_QUERY_BUDGET।
+# N+1 ঢুকলে row বাড়ার সাথে query বাড়ে → budget ছাড়িয়ে test fail।
+
+DEFAULT_QUERY_BUDGET = 5
+SEED_ROWS = 10
+SKIP_APPS = {"admin", "auth", "contenttypes", "sessions", "token_blacklist", "users"}
+AUDIT_FIELDS = {"created_by", "modified_by", "deleted_by"}
+
+# 2xx ছাড়া যেসব response জানা ও ইচ্ছাকৃত: (view, "list" / "detail", user) → status।
+# এর বাইরে কোনো endpoint 2xx না দিলে test fail (500 আর budget check এ লুকায় না)।
+EXPECTED_STATUS = {
+    # company module permission এ superuser bypass নেই, seeded admin এর permission set ও নেই
+    ("CompanyViewSet", "list", "admin"): 403,
+    ("CompanyViewSet", "detail", "admin"): 403,
+    ("BusinessTypeViewSet", "list", "admin"): 403,
+    ("BusinessTypeViewSet", "detail", "admin"): 403,
+    ("FactoryViewSet", "list", "admin"): 403,
+    ("FactoryViewSet", "detail", "admin"): 403,
+    # Party scope company_module.party থেকে, catalog এ ওই module নেই → member এর list খালি
+    ("PartyViewSet", "detail", "member"): 404,
+}
+
+
+def _value(field, i):
+    if field.choices:
+        return field.choices[i % len(field.choices)][0]
+    if isinstance(field, models.EmailField):
+        return f"seed{i}@example.com"
+    if isinstance(field, (models.CharField, models.TextField)):
+        value = f"{field.name} {i}"
+        return value[: field.max_length] if field.max_length else value
+    if isinstance(field, (models.IntegerField, models.BigIntegerField)):
+        return i + 1
+    if isinstance(field, models.DecimalField):
+        return Decimal("1.00")
+    if isinstance(field, models.FloatField):
+        return 1.0
+    if isinstance(field, models.BooleanField):
+        return False
+    if isinstance(field, models.DateTimeField):
+        return timezone.now()
+    if isinstance(field, models.DateField):
+        return date.today()
+    if isinstance(field, models.JSONField):
+        return {}
+    if isinstance(field, models.GenericIPAddressField):
+        return "127.0.0.1"
+    return None
+
+
+class Seeder:
+    """সব project model এ SEED_ROWS টা করে row, FK গুলো আগের seeded row এর মধ্যে ঘুরিয়ে দেওয়া"""
+
+    def __init__(self, rows=SEED_ROWS):
+        self.rows = rows
+        self.seeded = {}
+
+    def seed(self, model):
+        if model in self.seeded:
+            return self.seeded[model]
+        self.seeded[model] = []  # self-referencing FK এ loop না হয়
+
+        fk_rows = {}
+        for field in model._meta.concrete_fields:
+            if field.is_relation and field.name not in AUDIT_FIELDS and field.related_model is not model:
+                if field.related_model._meta.app_label not in SKIP_APPS:
+                    fk_rows[field.name] = self.seed(field.related_model)
+
+        instances = []
+        for i in range(self.rows):
+            values = {}
+            for field in model._meta.concrete_fields:
+                if field.primary_key or getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+                    continue
+                if field.is_relation:
+                    related = fk_rows.get(field.name)
+                    if related:
+                        values[field.name] = related[i % len(related)]
+                    continue
+                if field.name == "is_deleted" or field.name == "deleted_at":
+                    continue
+                if field.has_default() and field.default is not None and not field.unique:
+                    continue
+                value = _value(field, i)
+                if value is not None:
+                    values[field.name] = value
+            instances.append(model.objects.create(**values) if hasattr(model, "objects") else model.all_objects.create(**values))
+
+        self.seeded[model] = instances
+        return instances
+
+    def seed_project(self):
+        for model in apps.get_models():
+            if model._meta.app_label not in SKIP_APPS and not model._meta.abstract:
+                self.seed(model)
+
+
+def _walk(resolver, prefix=""):
+    for pattern in resolver.url_patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _walk(pattern, prefix + str(pattern.pattern))
+        elif isinstance(pattern, URLPattern) and getattr(pattern.callback, "cls", None) is not None:
+            yield prefix + str(pattern.pattern), pattern
+
+
+def router_endpoints():
+    """(url, view class) → DefaultRouter এর -list / -detail route (format suffix বাদ)"""
+    seen = set()
+    for route, pattern in _walk(get_resolver()):
+        name = pattern.name or ""
+        if not (name.endswith("-list") or name.endswith("-detail")) or "format" in route:
+            continue
+        route = route.replace("^", "").replace("$", "")
+        if route in seen:
+            continue
+        seen.add(route)
+        yield "/" + route, pattern.callback.cls, name.endswith("-detail")
+
+
+def _endpoint_model(view_class):
+    queryset = getattr(view_class, "queryset", None)
+    if queryset is not None:
+        return queryset.model
+    serializer = getattr(view_class, "serializer_class", None)
+    meta = getattr(serializer, "Meta", None)
+    return getattr(meta, "model", None)
+
+
+# audit event writer thread test DB transaction এর বাইরে লেখে → harness এ বন্ধ
+@override_settings(AUDIT_LOG_ENABLED=False)
+class QueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Seeder().seed_project()
+
+        cls.admin = CustomUser.objects.create_superuser(email="budget-admin@example.com", password="x", name="admin")
+        cls.member = CustomUser.objects.create_user(email="budget-member@example.com", password="x", name="member")
+
+        # সব module এ সব action, সব seeded company তে
+        from company.models import Company
+
+        full = {"create": True, "view": True, "edit": True, "delete": True}
+        columns = {column: {module: dict(full) for module in modules} for column, modules in get_permission_catalog().items()}
+        UserPermissionSet.objects.create(
+            user=cls.member,
+            companies=list(Company.objects.values_list("id", flat=True)),
+            **columns,
+        )
+
+    def setUp(self):
+        # আগের test এর user / permission snapshot cache (rollback এর পর একই id) leak না করে
+        cache.clear()
+
+    def _client_for(self, user):
+        self.client.defaults["HTTP_AUTHORIZATION"] = f"Bearer {RefreshToken.for_user(user).access_token}"
+        return self.client
+
+    def _measure(self, user, url):
+        client = self._client_for(user)
+        client.get(url)  # warm-up: user / permission snapshot cache
+        with CaptureQueriesContext(connection) as ctx:
+            start = time.perf_counter()
+            response = client.get(url)
+            elapsed = (time.perf_counter() - start) * 1000
+        return response.status_code, len(ctx), elapsed
+
+    def test_router_endpoints_stay_within_query_budget(self):
+        self.client.raise_request_exception = False
+        report = []
+        failures = []
+
+        for url, view_class, is_detail in router_endpoints():
+            if is_detail:
+                model = _endpoint_model(view_class)
+                instance = model.objects.order_by("pk").first() if model else None
+                if instance is None:
+                    continue
+                url = url.replace(url[url.index("(?P<pk>"):url.index(")/") + 1], str(instance.pk)) if "(?P<pk>" in url else url
+            budget = getattr(view_class, "query_budget", DEFAULT_QUERY_BUDGET)
+
+            for user in (self.admin, self.member):
+                status_code, queries, elapsed = self._measure(user, url)
+                report.append(f"{status_code} {queries:>3}q {elapsed:7.1f}ms  {user.name:<6} {url}")
+                expected = EXPECTED_STATUS.get((view_class.__name__, "detail" if is_detail else "list", user.name))
+                if expected is not None:
+                    if status_code != expected:
+                        failures.append(f"{url} ({user.name}): status {status_code}, expected {expected}")
+                elif not 200 <= status_code < 300:
+                    failures.append(f"{url} ({user.name}): status {status_code}")
+                elif queries > budget:
+                    failures.append(f"{url} ({user.name}): {queries} queries > budget {budget}")
+
+        self.assertEqual(failures, [], "\n".join(failures + ["", "Query budget report:"] + report))
+
+
+# ======================
+# Bulk delete / restore scope
+# ======================
+@override_settings(AUDIT_LOG_ENABLED=False)
+class BulkScopeTests(TestCase):
+    """TenantScopeMixin ছাড়া view (Chamber) এও অন্য company র row bulk action এ ধরা যাবে না"""
+
+    @classmethod
+    def setUpTestData(cls):
+        from company.models import Company
+        from pallot.models.pallotLocation import Chamber
+
+        own, other = Seeder(2).seed(Company)
+        cls.own = Chamber.objects.create(company=own, name="own")
+        cls.other = Chamber.objects.create(company=other, name="other")
+
+        cls.member = CustomUser.objects.create_user(email="bulk-member@example.com", password="x", name="member")
+        full = {"create": True, "view": True, "edit": True, "delete": True}
+        UserPermissionSet.objects.create(user=cls.member, companies=[own.id], pallot_module={"chamber": full})
+
+    def setUp(self):
+        cache.clear()
+
+    def _post(self, action, ids):
+        return self.client.post(
+            f"/api/pallot/chambers/{action}/",
+            {"ids": ids},
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(self.member).access_token}",
+        )
+
+    def test_bulk_delete_ignores_other_company(self):
+        response = self._post("bulk-delete", [self.own.pk, self.other.pk])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["deleted"], 1)
+        self.assertEqual(response.data["not_found"], [self.other.pk])
+        self.other.refresh_from_db()
+        self.assertFalse(self.other.is_deleted)
+
+    def test_bulk_restore_ignores_other_company(self):
+        for chamber in (self.own, self.other):
+            chamber.delete()
+
+        response = self._post("bulk-restore", [self.own.pk, self.other.pk])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["restored"], 1)
+        self.assertEqual(response.data["not_found"], [self.other.pk])
+        self.other.refresh_from_db()
+        self.assertTrue(self.other.is_deleted)
+
+
+# ======================
+# Soft-deleted row archive
+# ======================
+@override_settings(AUDIT_LOG_ENABLED=False)
+class ArchiveTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_archived_row_is_read_back_through_all_with_deleted(self):
+        from backend.archive import archive_deleted_rows, drop_archive_views, refresh_archives
+        from company.models import Company
+        from pallot.models.pallotLocation import Chamber
+
+        company = Seeder(1).seed(Company)[0]
+        old, recent = Chamber.objects.create(company=company, name="old"), Chamber.objects.create(company=company, name="recent")
+        old.delete()
+        recent.delete()
+        Chamber.all_objects.filter(pk=old.pk).update(deleted_at=timezone.now() - timedelta(days=settings.ARCHIVE_RETENTION_DAYS + 1))
+
+        self.assertEqual(archive_deleted_rows(Chamber), 1)
+        self.assertFalse(Chamber.all_objects.filter(pk=old.pk).exists())
+        self.assertTrue(Chamber.all_objects.filter(pk=recent.pk).exists())
+
+        archived = Chamber.objects.all_with_deleted().get(pk=old.pk)
+        self.assertEqual((archived.name, archived.is_deleted), ("old", True))
+        self.assertEqual(Chamber.objects.all_with_deleted().filter(company=company).count(), 2)
+
+        # migrate এর সময়: view drop → শুধু hot table, পরে archive আবার দেখা যায়
+        drop_archive_views()
+        self.assertEqual(Chamber.objects.all_with_deleted().filter(company=company).count(), 1)
+        refresh_archives()
+        self.assertEqual(Chamber.objects.all_with_deleted().get(pk=old.pk).name, "old")
+
+
+# ======================
+# Dropdown lookups
+# ======================
+@override_settings(AUDIT_LOG_ENABLED=False)
+class LookupTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        from company.models import Company
+        from products.models import Category, UnitSize
+
+        seeder = Seeder(2)
+        seeder.seed(Category)
+        seeder.seed(UnitSize)
+        cls.member = CustomUser.objects.create_user(email="lookup-member@example.com", password="x", name="member")
+        cls.permissions = UserPermissionSet.objects.create(
+            user=cls.member,
+            companies=list(Company.objects.values_list("id", flat=True)),
+            product_module={"unit": {"view": True}},
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.defaults["HTTP_AUTHORIZATION"] = f"Bearer {RefreshToken.for_user(self.member).access_token}"
+
+    def test_lookup_requires_module_view_permission(self):
+        self.assertEqual(self.client.get("/api/lookups/categories/").status_code, 403)
+        self.assertEqual(self.client.get("/api/lookups/units/").status_code, 200)
+
+    def test_unit_sizes_follow_unit_scope_changes(self):
+        from company.models import Company
+        from products.models import UnitSize
+
+        size = UnitSize.objects.select_related("unit").order_by("pk").first()
+        unit = size.unit
+        other = Company.objects.exclude(pk=unit.company_id).first()
+        self.permissions.companies = [unit.company_id]
+        self.permissions.product_module = {"unit_size": {"view": True}}
+        self.permissions.save()
+        cache.clear()
+
+        before = self.client.get("/api/lookups/unit-sizes/")
+        self.assertIn(size.pk, [row["id"] for row in before.data])
+
+        # Unit অন্য company তে গেলে UnitSize table না বদলালেও list আর ETag বদলায়
+        with self.captureOnCommitCallbacks(execute=True):
+            unit.company = other
+            unit.save()
+        after = self.client.get("/api/lookups/unit-sizes/", HTTP_IF_NONE_MATCH=before["ETag"])
+        self.assertEqual(after.status_code, 200)
+        self.assertNotIn(size.pk, [row["id"] for row in after.data])
+
+
+# ======================
+# Offset pages (ranked search)
+# ======================
+class OffsetPaginationTests(TestCase):
+    def test_offset_pages_cover_tied_rows_once(self):
+        from rest_framework.request import Request
+        from rest_framework.test import APIRequestFactory
+
+        from backend.pagination import KeysetPagination
+        from company.models import Company
+
+        Seeder(7).seed(Company)
+        # সব row এর sort key সমান (rank tie এর মতো) → pk tiebreaker এ stable page
+        queryset = Company.objects.order_by("is_deleted", "pk")
+
+        class SearchView:
+            def paginate_by_offset(self):
+                return True
+
+        seen, url = [], "/api/company/companies/?search=x&page_size=3"
+        while url:
+            paginator = KeysetPagination()
+            page = paginator.paginate_queryset(queryset, Request(APIRequestFactory().get(url)), view=SearchView())
+            seen.extend(obj.pk for obj in page)
+            url = paginator.get_next_link()
+
+        self.assertEqual(seen, list(queryset.values_list("pk", flat=True)))
+        self.assertIn("offset=3", paginator.get_previous_link())
+
+
+# ======================
+# Read replica routing
+# ======================
+class ReplicaRoutingTests(SimpleTestCase):
+    """
+    settings এ default এর mirror হিসেবে "replica" alias বসিয়ে router + middleware এর decision check।
+    TestCase এর transaction এর ভিতরে router সবসময় default দেয় → তাই SimpleTestCase,
+    আর query চালানো হয় না (শুধু কোন alias এ যাবে সেটা দেখা হয়)।
+    """
+
+    def setUp(self):
+        from backend.db_router import PIN_KEY
+
+        replica = {**settings.DATABASES["default"], "TEST": {"MIRROR": "default"}}
+        patcher = mock.patch.dict(settings.DATABASES, {"replica": replica})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # DB তে save না করেই token (access token এ OutstandingToken লেখা হয় না)
+        self.user = CustomUser(pk=4242, email="replica@test.com")
+        self.auth = f"Bearer {AccessToken.for_user(self.user)}"
+        cache.delete(PIN_KEY.format(user_id=self.user.pk))
+
+    def _route(self, method):
+        from backend.db_router import ReplicaRoutingMiddleware
+        from company.models import Company
+
+        seen = {}
+
+        def get_response(request):
+            seen["read"] = Company.objects.all().db
+            seen["locked"] = Company.objects.select_for_update().db
+            seen["write"] = router.db_for_write(Company)
+            return HttpResponse()
+
+        request = getattr(RequestFactory(), method)("/api/company/companies/", HTTP_AUTHORIZATION=self.auth)
+        ReplicaRoutingMiddleware(get_response)(request)
+        return seen
+
+    def test_reads_go_to_replica_and_writes_to_default(self):
+        from company.models import Company
+
+        self.assertEqual(self._route("get"), {"read": "replica", "locked": "default", "write": "default"})
+        # request এর বাইরে (shell, command) সব default
+        self.assertEqual(Company.objects.all().db, "default")
+
+    def test_unsafe_request_uses_default(self):
+        self.assertEqual(self._route("post"), {"read": "default", "locked": "default", "write": "default"})
+
+    @override_settings(REPLICA_PIN_SECONDS=1)
+    def test_write_pins_user_to_primary_for_pin_seconds(self):
+        from backend.db_router import is_pinned
+
+        self._route("post")
+        self.assertTrue(is_pinned(self.user.pk))
+        self.assertEqual(self._route("get")["read"], "default")
+
+        time.sleep(1.1)
+        self.assertFalse(is_pinned(self.user.pk))
+        self.assertEqual(self._route("get")["read"], "replica")
+
+
+# ======================
+# Blacklisted JTI cache
+# ======================
+class BlacklistCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_direct_blacklist_row_reaches_cache(self):
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+        from users.token_blacklist import BLACKLIST_READY_KEY, is_jti_blacklisted
+
+        user = CustomUser.objects.create_user(email="blacklist@example.com", password="x", name="member")
+        jti = RefreshToken.for_user(user)["jti"]
+        # ready flag থাকলে DB থেকে re-warm হয় না → শুধু receiver এর set করা key দেখা যায়
+        cache.set(BLACKLIST_READY_KEY, 1)
+        self.assertFalse(is_jti_blacklisted(jti))
+
+        # admin / shell এর মতো blacklist() ছাড়া সরাসরি row
+        BlacklistedToken.objects.create(token=OutstandingToken.objects.get(jti=jti))
+        self.assertTrue(is_jti_blacklisted(jti))
+
+
+# ======================
+# Reverse access index
+# ======================
+class AccessIndexTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        from company.models import BusinessType, Factory
+
+        Seeder(2).seed(Factory)
+        cls.factory = Factory.objects.exclude(business_type=None).select_related("business_type").first()
+        cls.other_bt = BusinessType.objects.exclude(pk=cls.factory.business_type_id).first()
+        cls.member = CustomUser.objects.create_user(email="access-member@example.com", password="x", name="member")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_factory_grant_must_match_factory_business_type(self):
+        from users.access_index import users_with_access
+        from users.models import UserScopeGrant
+
+        company_id = self.factory.company_id
+        UserScopeGrant.objects.create(user=self.member, company_id=company_id)
+        grant = UserScopeGrant.objects.create(
+            user=self.member, company_id=company_id, business_type=self.other_bt, factory=self.factory
+        )
+        self.assertNotIn(self.member, users_with_access(factory_id=self.factory.pk))
+
+        for business_type_id in (self.factory.business_type_id, None):
+            grant.business_type_id = business_type_id
+            grant.save()
+            self.assertIn(self.member, users_with_access(factory_id=self.factory.pk))
+
+    def test_grant_sync_invalidates_snapshot_after_commit(self):
+        from users.grants import sync_grants_for_users
+        from users.permission_engine import get_permission_version
+
+        before = get_permission_version(self.member.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            UserPermissionSet.objects.create(user=self.member, companies=[self.factory.company_id])
+            sync_grants_for_users([self.member.pk])
+            self.assertEqual(get_permission_version(self.member.pk), before)
+        self.assertNotEqual(get_permission_version(self.member.pk), before)
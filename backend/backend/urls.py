@@ -3,6 +3,8 @@ from django.urls import path, include
 from django.conf.urls.static import static
 from django.conf import settings
 from rest_framework_simplejwt.views import TokenRefreshView
+from backend.lookups import LookupView
+from backend.db_pool import DatabasePoolView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -24,4 +26,6 @@ urlpatterns = [
 
     path("api/", include("language.urls")),
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path("api/lookups/<str:entity>/", LookupView.as_view(), name="lookup"),  # dropdown data
+    path("api/db-pool/", DatabasePoolView.as_view(), name="db_pool"),  # connection pool metrics
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -1,6 +1,6 @@
-from rest_framework.permissions import BasePermission
 from rest_framework.exceptions import PermissionDenied
-from users.models import UserPermissionSet
+from users.permission_engine import get_permission_snapshot
+from backend.scope import ObjectScopePermission
 
 
 BOOKING_PERMISSIONS = {
@@ -23,7 +23,7 @@ def get_all_booking_permissions():
 
 
 
-class BookingModulePermission(BasePermission):
+class BookingModulePermission(ObjectScopePermission):
     ACTION_MAP = {
         "list": "view",
         "retrieve": "view",
@@ -31,6 +31,8 @@ class BookingModulePermission(BasePermission):
         "update": "edit",
         "partial_update": "edit",
         "destroy": "delete",
+        "bulk_delete": "delete",
+        "bulk_restore": "delete",
         "GET": "view",
         "POST": "create",
         "PUT": "edit",
@@ -55,21 +57,9 @@ class BookingModulePermission(BasePermission):
         if not action_perm:
             return True
 
-        perms = UserPermissionSet.objects.filter(user=user)
-        for p in perms:
-            booking_module = p.booking_module
-            if isinstance(booking_module, str):
-                import json
-                try:
-                    booking_module = json.loads(booking_module)
-                except json.JSONDecodeError:
-                    booking_module = {}
-            elif booking_module is None:
-                booking_module = {}
-
-            # Ensure module_name exists
-            module_perms = booking_module.get(module_name, {})
-            if module_perms.get(action_perm, False):
-                return True
+        # Compiled permission snapshot (request memo → redis → DB)
+        snapshot = get_permission_snapshot(user)
+        if snapshot.has("booking_module", module_name, action_perm):
+            return True
 
         raise PermissionDenied(f"You cannot perform {action_perm} on {module_name}")
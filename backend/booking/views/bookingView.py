@@ -7,8 +7,9 @@ from rest_framework.authentication import TokenAuthentication
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from utils.excel_import import import_excel_to_model
+from backend.bulk import BulkSoftDeleteMixin
 
-class BookingViewSet(viewsets.ModelViewSet):
+class BookingViewSet(BulkSoftDeleteMixin, viewsets.ModelViewSet):
     queryset = Booking.objects.all()
     serializer_class = BookingSerializer
     permission_classes = [IsAuthenticated, BookingModulePermission]
@@ -1,7 +1,7 @@
 # company/permissions.py
-from rest_framework.permissions import BasePermission
 from rest_framework.exceptions import PermissionDenied
-from users.models import UserPermissionSet
+from users.permission_engine import get_permission_snapshot
+from backend.scope import ObjectScopePermission
 
 COMPANY_PERMISSIONS = {
     "company": ["create", "view", "edit", "delete"],
@@ -22,7 +22,7 @@ def get_all_company_permissions():
     return permissions
 
 
-class CompanyModulePermission(BasePermission):
+class CompanyModulePermission(ObjectScopePermission):
     """
     এই permission class টি Company ViewSet এবং CompanyDetailsView (APIView) উভয়ের জন্য কাজ করবে।
     ViewSet হলে: view.action থেকে action নেবে
@@ -37,6 +37,8 @@ class CompanyModulePermission(BasePermission):
         "update": "edit",
         "partial_update": "edit",
         "destroy": "delete",
+        "bulk_delete": "delete",
+        "bulk_restore": "delete",
 
         # APIView এর জন্য HTTP method mapping
         "GET": "view",
@@ -66,13 +68,10 @@ class CompanyModulePermission(BasePermission):
         if not action_perm:
             return True  # যদি mapping না থাকে, skip permission
 
-        # User permission sets fetch
-        perms = UserPermissionSet.objects.filter(user=user)
-        for p in perms:
-            company_module = p.company_module or {}
-            module_perms = company_module.get(module_name, {})
-            if module_perms.get(action_perm, False):
-                return True
+        # Compiled permission snapshot (request memo → redis → DB)
+        snapshot = get_permission_snapshot(user)
+        if snapshot.has("company_module", module_name, action_perm):
+            return True
 
         # If no permissions
         raise PermissionDenied(f"You can not do this action !!!: {action_perm} {module_name}.")
\ No newline at end of file
@@ -8,23 +8,24 @@ from company.serializers.companySerializers import CompanySerializer
 from company.serializers.businessTypeSerializers import BusinessTypeSerializer
 from company.serializers.factorySerializers import FactorySerializer
 from company.permissions import CompanyModulePermission
-from users.models import UserPermissionSet
-from django.db.models import Q
+from backend.scope import TenantScopeMixin
 from rest_framework.views import APIView
 from django.core.exceptions import ValidationError
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from utils.excel_import import import_excel_to_model
+from backend.bulk import BulkSoftDeleteMixin
 # ----------------- Business Type -----------------
-class BusinessTypeViewSet(viewsets.ModelViewSet):
+class BusinessTypeViewSet(TenantScopeMixin, BulkSoftDeleteMixin, viewsets.ModelViewSet):
     queryset = BusinessType.objects.select_related("company").all().order_by("name")
     serializer_class = BusinessTypeSerializer
     permission_classes = [IsAuthenticated, CompanyModulePermission]
     module_name = "business_type"
+    scope_permission_column = "company_module"
+    scope_fields = {"company": "company_id", "business_type": "id", "factory": None}
 
     def get_queryset(self):
-        user = self.request.user
         qs = BusinessType.objects.select_related("company").all().order_by("name")
 
         # 👉 filter by company_id (from query param)
@@ -32,28 +33,9 @@ class BusinessTypeViewSet(viewsets.ModelViewSet):
         if company_id:
             qs = qs.filter(company_id=company_id)
 
-        # 👉 Superuser/staff হলে সব দেখতে পাবে
-        if user.is_superuser or user.is_staff:
-            return qs
+        # 👉 Permission scope (superuser/staff হলে সব)
+        return self.scope_queryset(qs)
 
-        # 👉 Permission check
-        perms = UserPermissionSet.objects.filter(user=user)
-        allowed_bt_ids = []
-        for p in perms:
-            company_perm = p.company_module or {}
-            module_perm = company_perm.get("business_type", {})
-            if not module_perm.get("view", False):
-                continue
-
-            for company_id in p.companies or []:
-                if p.business_types and str(company_id) in p.business_types:
-                    allowed_bt_ids.extend(p.business_types[str(company_id)])
-                else:
-                    allowed_bt_ids.extend(
-                        BusinessType.objects.filter(company_id=company_id).values_list("id", flat=True)
-                    )
-
-        return qs.filter(id__in=allowed_bt_ids).distinct()
     @action(detail=False, methods=["post"], url_path="bulk-import")
     def bulk_import(self, request):
 
@@ -3,8 +3,8 @@ from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from django.db.models import Q
 from users.models import UserPermissionSet
+from backend.scope import TenantScopeMixin
 from company.models.company import Company
 from company.models.business_type import BusinessType
 from company.models.factory import Factory
@@ -17,30 +17,22 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from utils.excel_import import import_excel_to_model
+from backend.bulk import BulkSoftDeleteMixin
 # ----------------- Company -----------------
 
-class CompanyViewSet(viewsets.ModelViewSet):
+class CompanyViewSet(TenantScopeMixin, BulkSoftDeleteMixin, viewsets.ModelViewSet):
     queryset = Company.objects.all()
     serializer_class = CompanySerializer
     permission_classes = [IsAuthenticated, CompanyModulePermission]
     module_name = "company"
+    scope_permission_column = "company_module"
+    scope_fields = {"company": "id", "business_type": None, "factory": None}
 
     def get_queryset(self):
-        user = self.request.user
         qs = Company.objects.all().order_by("name")
 
-        if user.is_superuser or user.is_staff:
-            return qs
-
-        perms = UserPermissionSet.objects.filter(user=user)
-        allowed_company_ids = set()
-        for p in perms:
-            company_perm = p.company_module or {}
-            module_perm = company_perm.get("company", {})
-            if module_perm.get("view", False):
-                allowed_company_ids.update(p.companies or [])
+        return self.scope_queryset(qs)
 
-        return qs.filter(id__in=allowed_company_ids).distinct()
     @action(detail=False, methods=["post"], url_path="bulk-import")
     def bulk_import(self, request):
 
@@ -8,49 +8,27 @@ from company.serializers.companySerializers import CompanySerializer
 from company.serializers.businessTypeSerializers import BusinessTypeSerializer
 from company.serializers.factorySerializers import FactorySerializer
 from company.permissions import CompanyModulePermission
-from users.models import UserPermissionSet
-from django.db.models import Q
+from backend.scope import TenantScopeMixin
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from utils.excel_import import import_excel_to_model
+from backend.bulk import BulkSoftDeleteMixin
 
 # ----------------- Factory -----------------
-class FactoryViewSet(viewsets.ModelViewSet):
+class FactoryViewSet(TenantScopeMixin, BulkSoftDeleteMixin, viewsets.ModelViewSet):
     queryset = Factory.objects.all()   # ✅ Add this line
     serializer_class = FactorySerializer
     permission_classes = [IsAuthenticated, CompanyModulePermission]
     module_name = "factory"
+    scope_permission_column = "company_module"
+    scope_fields = {"company": "company_id", "business_type": None, "factory": "id"}
 
     def get_queryset(self):
-        user = self.request.user
-        qs = Factory.objects.select_related("company", "business_type").all()
-        if user.is_superuser or user.is_staff:
-            return qs
-
-        perms = UserPermissionSet.objects.filter(user=user)
-        query = Q()
-        for p in perms:
-            company_perm = p.company_module or {}
-            module_perm = company_perm.get("factory", {})
-            if not module_perm.get("view", False):
-                continue
-
-            for company_id in p.companies or []:
-                allowed_factories = p.factories.get(str(company_id), [])
-                if allowed_factories:
-                    for f in allowed_factories:
-                        query |= Q(company_id=company_id,
-                                   id=f["factory_id"],
-                                   business_type_id=f.get("business_type_id"))
-                else:
-                    query |= Q(company_id=company_id)
-
-        if query:
-            return qs.filter(query).distinct()
-        return Factory.objects.none()
+        qs = Factory.objects.select_related("company", "business_type__company").all()
+        return self.scope_queryset(qs)
 
     @action(detail=False, methods=["post"], url_path="bulk-import")
     def bulk_import(self, request):
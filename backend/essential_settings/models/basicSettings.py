@@ -53,6 +53,13 @@ class BasicSetting(AuditMixin):
     loantype_interest = models.TextField(null=True, blank=True)
 
     key = models.CharField(max_length=32, null=True, blank=True)
+
+    # ভাড়া / সুদের হার কোন তারিখে কত ছিল → ?as_of= (audit/history.py)
+    history_fields = (
+        "interest_rate", "empty_bag_price", "max_loan_per_qty",
+        "max_rent_per_qty", "max_rent_per_kg", "carrying_interest_rate",
+    )
+
     def save(self, *args, **kwargs):
         if not self.key:
             self.key = self.generate_unique_key()
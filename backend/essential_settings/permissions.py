@@ -1,6 +1,6 @@
-from rest_framework.permissions import BasePermission
 from rest_framework.exceptions import PermissionDenied
-from users.models import UserPermissionSet
+from users.permission_engine import get_permission_snapshot
+from backend.scope import ObjectScopePermission
 
 SETTINGS_PERMISSIONS = {
   "bag_type": ["create", "view", "edit", "delete"],
@@ -27,7 +27,7 @@ def get_all_settings_permissions():
 
 
 
-class SettingsModulePermission(BasePermission):
+class SettingsModulePermission(ObjectScopePermission):
     ACTION_MAP = {
         "list": "view",
         "retrieve": "view",
@@ -35,6 +35,8 @@ class SettingsModulePermission(BasePermission):
         "update": "edit",
         "partial_update": "edit",
         "destroy": "delete",
+        "bulk_delete": "delete",
+        "bulk_restore": "delete",
         "GET": "view",
         "POST": "create",
         "PUT": "edit",
@@ -59,21 +61,9 @@ class SettingsModulePermission(BasePermission):
         if not action_perm:
             return True
 
-        perms = UserPermissionSet.objects.filter(user=user)
-        for p in perms:
-            settings_module = p.settings_module
-            if isinstance(settings_module, str):
-                import json
-                try:
-                    settings_module = json.loads(settings_module)
-                except json.JSONDecodeError:
-                    settings_module = {}
-            elif settings_module is None:
-                settings_module = {}
-
-            # Ensure module_name exists
-            module_perms = settings_module.get(module_name, {})
-            if module_perms.get(action_perm, False):
-                return True
+        # Compiled permission snapshot (request memo → redis → DB)
+        snapshot = get_permission_snapshot(user)
+        if snapshot.has("settings_module", module_name, action_perm):
+            return True
 
         raise PermissionDenied(f"You cannot perform {action_perm} on {module_name}")
@@ -3,8 +3,9 @@ from rest_framework.permissions import IsAuthenticated
 from essential_settings.permissions import SettingsModulePermission
 from essential_settings.serializers.bagTypeSerializers import BagTypeSerializer
 from essential_settings.models.bagType import BagType
+from backend.bulk import BulkSoftDeleteMixin
 
-class BagTypeViewSet(viewsets.ModelViewSet):
+class BagTypeViewSet(BulkSoftDeleteMixin, viewsets.ModelViewSet):
     
     queryset = BagType.objects.all()
     serializer_class = BagTypeSerializer
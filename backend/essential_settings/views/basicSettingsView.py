@@ -4,10 +4,12 @@ from rest_framework.permissions import IsAuthenticated
 from essential_settings.permissions import SettingsModulePermission
 from essential_settings.serializers.basicSettingsSerializers import BasicSettingSerializer
 from essential_settings.models.basicSettings import BasicSetting
+from backend.bulk import BulkSoftDeleteMixin
+from audit.history import AsOfRetrieveMixin
 
 
-class BasicSettingViewSet(viewsets.ModelViewSet):
-    queryset = BasicSetting.objects.all()
+class BasicSettingViewSet(AsOfRetrieveMixin, BulkSoftDeleteMixin, viewsets.ModelViewSet):
+    queryset = BasicSetting.objects.select_related("factory")
     serializer_class = BasicSettingSerializer
     permission_classes = [IsAuthenticated, SettingsModulePermission]
     module_name = "basic_settings"
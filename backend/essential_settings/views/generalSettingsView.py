@@ -4,10 +4,11 @@ from rest_framework.permissions import IsAuthenticated
 from essential_settings.permissions import SettingsModulePermission
 from essential_settings.serializers.generalSettingsSerializers import GeneralSettingSerializer
 from essential_settings.models.generalSettings import GeneralSetting
+from backend.bulk import BulkSoftDeleteMixin
 
 
-class GeneralSettingViewSet(viewsets.ModelViewSet):
-    queryset = GeneralSetting.objects.all()
+class GeneralSettingViewSet(BulkSoftDeleteMixin, viewsets.ModelViewSet):
+    queryset = GeneralSetting.objects.select_related("factory")
     serializer_class = GeneralSettingSerializer
     permission_classes = [IsAuthenticated, SettingsModulePermission]
     module_name = "general_settings"
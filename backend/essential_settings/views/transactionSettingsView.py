@@ -4,10 +4,11 @@ from rest_framework.permissions import IsAuthenticated
 from essential_settings.permissions import SettingsModulePermission
 from essential_settings.serializers.transactionSettingsSerializers import TransactionSettingSerializer
 from essential_settings.models.transactionSettings import TransactionSetting
+from backend.bulk import BulkSoftDeleteMixin
 
 
-class TransactionSettingViewSet(viewsets.ModelViewSet):
-    queryset = TransactionSetting.objects.all()
+class TransactionSettingViewSet(BulkSoftDeleteMixin, viewsets.ModelViewSet):
+    queryset = TransactionSetting.objects.select_related("factory")
     serializer_class = TransactionSettingSerializer
     permission_classes = [IsAuthenticated, SettingsModulePermission]
     module_name = "transaction_settings"
@@ -1,6 +1,6 @@
-from rest_framework.permissions import BasePermission
 from rest_framework.exceptions import PermissionDenied
-from users.models import UserPermissionSet
+from users.permission_engine import get_permission_snapshot
+from backend.scope import ObjectScopePermission
 
 # কোন কোন module-এর কি কি permission থাকবে
 LOAN_PERMISSIONS = {
@@ -25,7 +25,7 @@ def get_all_loan_module_permissions():
 
 
 
-class LoanModulePermission(BasePermission):
+class LoanModulePermission(ObjectScopePermission):
     ACTION_MAP = {
         "list": "view",
         "retrieve": "view",
@@ -33,6 +33,8 @@ class LoanModulePermission(BasePermission):
         "update": "edit",
         "partial_update": "edit",
         "destroy": "delete",
+        "bulk_delete": "delete",
+        "bulk_restore": "delete",
         "get": "view",
         "post": "create",
         "put": "edit",
@@ -57,20 +59,9 @@ class LoanModulePermission(BasePermission):
         if not action_perm:
             return True
 
-        perms = UserPermissionSet.objects.filter(user=user)
-        for p in perms:
-            loan_module = self._parse_permissions(p.loan_module)
-            module_perms = loan_module.get(module_name, {})
-            if module_perms.get(action_perm, False):
-                return True
+        # Compiled permission snapshot (request memo → redis → DB)
+        snapshot = get_permission_snapshot(user)
+        if snapshot.has("loan_module", module_name, action_perm):
+            return True
 
         raise PermissionDenied(f"You cannot perform {action_perm} on {module_name}")
-
-    def _parse_permissions(self, raw_perm):
-        import json
-        if isinstance(raw_perm, str):
-            try:
-                return json.loads(raw_perm)
-            except json.JSONDecodeError:
-                return {}
-        return raw_perm or {}
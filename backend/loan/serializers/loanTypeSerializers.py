@@ -12,9 +12,11 @@ class FactorySerializer(serializers.ModelSerializer):
 
 # Account Head Serializer
 class AccountHeadSerializer(serializers.ModelSerializer):
+    name = serializers.CharField(source="head_name", read_only=True)
+
     class Meta:
         model = AccountHead
-        fields = ["id", "name", "code"]
+        fields = ["id", "name"]
 
 # LoanType Serializer
 class LoanTypeSerializer(AuditSerializerMixin, serializers.ModelSerializer):
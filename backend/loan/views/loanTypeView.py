@@ -5,9 +5,10 @@ from loan.serializers.loanTypeSerializers import LoanTypeSerializer
 from loan.permissions import LoanModulePermission
 from users.models import UserPermissionSet
 import json
+from backend.bulk import BulkSoftDeleteMixin
 
 
-class LoanTypeViewSet(viewsets.ModelViewSet):
+class LoanTypeViewSet(BulkSoftDeleteMixin, viewsets.ModelViewSet):
     queryset = LoanType.objects.all()
     serializer_class = LoanTypeSerializer
     permission_classes = [IsAuthenticated, LoanModulePermission]
@@ -15,7 +16,7 @@ class LoanTypeViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
-        qs = LoanType.objects.all()
+        qs = LoanType.objects.select_related("branch", "head")
 
         if not user.is_authenticated:
             return LoanType.objects.none()
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pallot', '0004_chamber_deleted_at_chamber_deleted_by_and_more'),
+        ('sr', '0003_alive_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pallot',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['pallot_number'], name='pallot_pallot_number_alive'),
+        ),
+        migrations.AddIndex(
+            model_name='pallot',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['sr'], name='pallot_sr_alive'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:26
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pallot', '0005_alive_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='pallot',
+            name='pallot_pallot_number_alive',
+        ),
+    ]
@@ -1,6 +1,6 @@
 from django.db import models
 from django.db.models import Max
-from backend.mixins import AuditMixin
+from backend.mixins import AuditMixin, alive_indexes
 from pallot.models.pallotType import PallotType
 from pallot.models.pallotLocation import Chamber, Floor, Pocket
 from sr.models.sr import SR
@@ -57,6 +57,9 @@ class Pallot(AuditMixin):
     )
     quantity = models.PositiveIntegerField(default=0)
 
+    class Meta:
+        indexes = alive_indexes("pallot", "sr")
+
     def save(self, *args, **kwargs):
         # নতুন হলে auto increment, তবে user যদি number দেয় সেটা use হবে
         if not self.pk and not self.pallot_number:
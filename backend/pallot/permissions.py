@@ -1,7 +1,6 @@
-from rest_framework.permissions import BasePermission
 from rest_framework.exceptions import PermissionDenied
-from users.models import UserPermissionSet
-import json
+from users.permission_engine import get_permission_snapshot
+from backend.scope import ObjectScopePermission
 
 # কোন কোন module-এর কি কি permission থাকবে
 PALLOT_PERMISSIONS = {
@@ -26,7 +25,7 @@ def get_all_pallot_permissions():
     return permissions
 
 
-class PallotModulePermission(BasePermission):
+class PallotModulePermission(ObjectScopePermission):
     ACTION_MAP = {
         "list": "view",
         "retrieve": "view",
@@ -34,6 +33,8 @@ class PallotModulePermission(BasePermission):
         "update": "edit",
         "partial_update": "edit",
         "destroy": "delete",
+        "bulk_delete": "delete",
+        "bulk_restore": "delete",
         "GET": "view",
         "POST": "create",
         "PUT": "edit",
@@ -59,20 +60,9 @@ class PallotModulePermission(BasePermission):
         if not action_perm:
             return True
 
-        # DB থেকে user permissions বের করা
-        perms = UserPermissionSet.objects.filter(user=user)
-        for p in perms:
-            pallot_module = p.pallot_module
-            if isinstance(pallot_module, str):
-                try:
-                    pallot_module = json.loads(pallot_module)
-                except json.JSONDecodeError:
-                    pallot_module = {}
-            elif pallot_module is None:
-                pallot_module = {}
-
-            module_perms = pallot_module.get(module_name, {})
-            if module_perms.get(action_perm, False):
-                return True
+        # Compiled permission snapshot (request memo → redis → DB)
+        snapshot = get_permission_snapshot(user)
+        if snapshot.has("pallot_module", module_name, action_perm):
+            return True
 
         raise PermissionDenied(f"You cannot perform {action_perm} on {module_name}")
@@ -4,6 +4,7 @@ from pallot.models.pallotType import PallotType
 from pallot.models.pallotLocation import Chamber, Floor, Pocket
 from sr.models.sr import SR
 from backend.AuditSerializerMixin import AuditSerializerMixin
+from backend.DynamicFieldsSerializerMixin import DynamicFieldsSerializerMixin
 
 
 class SRSerializer(serializers.ModelSerializer):
@@ -36,7 +37,7 @@ class PocketSerializer(serializers.ModelSerializer):
         fields = ["id", "name"]
 
 
-class PallotSerializer(AuditSerializerMixin, serializers.ModelSerializer):
+class PallotSerializer(AuditSerializerMixin, DynamicFieldsSerializerMixin, serializers.ModelSerializer):
     pallot_type = PallotTypeSerializer(read_only=True)
     sr = SRSerializer(read_only=True)
     chamber = ChamberSerializer(read_only=True)
@@ -6,8 +6,9 @@ from pallot.serializers.pallotLocationSerializers import (
 )
 from pallot.permissions import PallotModulePermission
 from django.views.decorators.cache import cache_page
+from backend.bulk import BulkSoftDeleteMixin
 
-class ChamberViewSet(viewsets.ModelViewSet):
+class ChamberViewSet(BulkSoftDeleteMixin, viewsets.ModelViewSet):
     queryset = Chamber.objects.all()
     serializer_class = ChamberSerializer
     permission_classes = [PallotModulePermission]
@@ -31,7 +32,7 @@ class ChamberViewSet(viewsets.ModelViewSet):
 
 
 
-class FloorViewSet(viewsets.ModelViewSet):
+class FloorViewSet(BulkSoftDeleteMixin, viewsets.ModelViewSet):
     serializer_class = FloorSerializer
     permission_classes = [PallotModulePermission]
     module_name = "floor"
@@ -56,7 +57,7 @@ class FloorViewSet(viewsets.ModelViewSet):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
-class PocketViewSet(viewsets.ModelViewSet):
+class PocketViewSet(BulkSoftDeleteMixin, viewsets.ModelViewSet):
     serializer_class = PocketSerializer
     permission_classes = [PallotModulePermission]
     module_name = "pocket"
@@ -8,12 +8,18 @@ from pallot.serializers.pallotSerializers import PallotSerializer
 from pallot.permissions import PallotModulePermission
 from utils.excel_import import import_excel_to_model
 from django.views.decorators.cache import cache_page
+from backend.DynamicFieldsSerializerMixin import SparseFieldsViewMixin
+from backend.conditional import ConditionalGetMixin
+from backend.bulk import BulkSoftDeleteMixin
 
-class PallotViewSet(viewsets.ModelViewSet):
+class PallotViewSet(SparseFieldsViewMixin, ConditionalGetMixin, BulkSoftDeleteMixin, viewsets.ModelViewSet):
     queryset = Pallot.objects.all().select_related("sr", "chamber", "floor", "pocket", "pallot_type")
     serializer_class = PallotSerializer
     permission_classes = [PallotModulePermission]
     module_name = "pallot"
+    keyset_ordering = ("pallot_number",)
+    # backend/tests.py: conditional GET aggregate + এক page (nested relation সব select_related এ)
+    query_budget = 2
     
     @action(detail=False, methods=["get"])
     def get_sr_quantity(self, request):
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0002_booking_deleted_at_booking_deleted_by_and_more'),
+        ('company', '0002_businesstype_deleted_at_businesstype_deleted_by_and_more'),
+        ('party_type', '0005_alter_partytype_company'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='party',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['code'], name='party_code_alive'),
+        ),
+        migrations.AddIndex(
+            model_name='party',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['company', 'code'], name='party_company_code_alive'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations
+
+from backend.search import create_trigram_indexes
+
+forwards, backwards = create_trigram_indexes(
+    "party_type_party", ["name", "father_name", "village", "mobile", "nid"]
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('party_type', '0006_alive_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -1,5 +1,5 @@
 from django.db import models
-from backend.mixins import AuditMixin
+from backend.mixins import AuditMixin, alive_indexes
 from company.models import Company
 from booking.models.booking import Booking
 from .party_type import PartyType
@@ -38,8 +38,15 @@ class Party(AuditMixin):
     interest_start_date = models.DateField(blank=True, null=True)
     interest_rate = models.DecimalField(max_digits=5, decimal_places=2, default=0)  # percentage
 
+    # ভাড়া / সুদের হার কোন তারিখে কত ছিল → ?as_of= (audit/history.py)
+    history_fields = (
+        "per_bag_rent", "per_kg_rent", "rent_receive",
+        "per_bag_commission", "interest_start_date", "interest_rate",
+    )
+
     class Meta:
         ordering = ["code"]
+        indexes = alive_indexes("party", ("company", "code"))
 
     def __str__(self):
         return f"{self.name} ({self.code})"
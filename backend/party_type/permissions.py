@@ -1,6 +1,6 @@
-from rest_framework.permissions import BasePermission
 from rest_framework.exceptions import PermissionDenied
-from users.models import UserPermissionSet
+from users.permission_engine import get_permission_snapshot
+from backend.scope import ObjectScopePermission
 
 # কোন কোন module-এর কি কি permission থাকবে
 PARTY_TYPE_PERMISSIONS = {
@@ -26,7 +26,7 @@ def get_all_party_type_permissions():
 
 
 
-class PartyTypeModulePermission(BasePermission):
+class PartyTypeModulePermission(ObjectScopePermission):
     ACTION_MAP = {
         "list": "view",
         "retrieve": "view",
@@ -34,6 +34,8 @@ class PartyTypeModulePermission(BasePermission):
         "update": "edit",
         "partial_update": "edit",
         "destroy": "delete",
+        "bulk_delete": "delete",
+        "bulk_restore": "delete",
         "GET": "view",
         "POST": "create",
         "PUT": "edit",
@@ -58,21 +60,9 @@ class PartyTypeModulePermission(BasePermission):
         if not action_perm:
             return True
 
-        perms = UserPermissionSet.objects.filter(user=user)
-        for p in perms:
-            party_type_module = p.party_type_module
-            if isinstance(party_type_module, str):
-                import json
-                try:
-                    party_type_module = json.loads(party_type_module)
-                except json.JSONDecodeError:
-                    party_type_module = {}
-            elif party_type_module is None:
-                party_type_module = {}
-
-            # Ensure module_name exists
-            module_perms = party_type_module.get(module_name, {})
-            if module_perms.get(action_perm, False):
-                return True
+        # Compiled permission snapshot (request memo → redis → DB)
+        snapshot = get_permission_snapshot(user)
+        if snapshot.has("party_type_module", module_name, action_perm):
+            return True
 
         raise PermissionDenied(f"You cannot perform {action_perm} on {module_name}")
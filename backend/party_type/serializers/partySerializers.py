@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from backend.AuditSerializerMixin import AuditSerializerMixin
+from backend.DynamicFieldsSerializerMixin import DynamicFieldsSerializerMixin
 from party_type.models.party_type import PartyType
 from party_type.models.party import Party
 from company.models import Company
@@ -19,7 +20,7 @@ class BookingTypeSerializer(serializers.ModelSerializer):
     class Meta:
         model = Booking
         fields = ['id', 'name']
-class PartySerializer(AuditSerializerMixin, serializers.ModelSerializer):
+class PartySerializer(AuditSerializerMixin, DynamicFieldsSerializerMixin, serializers.ModelSerializer):
     company = CompanySerializer(read_only=True)  # nested company object
     company_id = serializers.PrimaryKeyRelatedField(
         queryset=Company.objects.all(),
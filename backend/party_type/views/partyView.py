@@ -3,8 +3,10 @@ from party_type.models.party import Party
 from party_type.serializers.partySerializers import PartySerializer
 from rest_framework.permissions import IsAuthenticated
 from party_type.permissions import PartyTypeModulePermission
-from users.models import UserPermissionSet
-from django.db.models import Q
+from backend.scope import TenantScopeMixin
+from backend.DynamicFieldsSerializerMixin import SparseFieldsViewMixin
+from backend.conditional import ConditionalGetMixin
+from backend.search import TrigramSearchMixin
 from django.db import models
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -18,31 +20,21 @@ from party_type.models.party_type import PartyType
 
 from django.views.decorators.cache import cache_page
 from django.utils.decorators import method_decorator
-class PartyViewSet(viewsets.ModelViewSet):
+from backend.bulk import BulkSoftDeleteMixin
+from audit.history import AsOfRetrieveMixin
+class PartyViewSet(AsOfRetrieveMixin, TenantScopeMixin, TrigramSearchMixin, SparseFieldsViewMixin, ConditionalGetMixin, BulkSoftDeleteMixin, viewsets.ModelViewSet):
     queryset = Party.objects.all().order_by("code")
     serializer_class = PartySerializer
     permission_classes = [IsAuthenticated, PartyTypeModulePermission]
     module_name = "party"
+    keyset_ordering = ("code",)
+    search_fields = ("name", "father_name", "village", "mobile", "nid")
+    scope_permission_column = "company_module"
+    scope_fields = {"company": "company_id", "business_type": None, "factory": None}
     # @method_decorator(cache_page(60 * 5))  # cache for 5 min
     def get_queryset(self):
-        user = self.request.user
-        qs = Party.objects.all().order_by("code")
-        if user.is_superuser or user.is_staff:
-            return qs
-
-        perms = UserPermissionSet.objects.filter(user=user)
-        query = Q()
-        for p in perms:
-            company_perm = p.company_module or {}
-            module_perm = company_perm.get("party", {})
-            if not module_perm.get("view", False):
-                continue
-            for company_id in p.companies or []:
-                query |= Q(company_id=company_id)  # assuming Party has company foreign key
-
-        if query:
-            return qs.filter(query).distinct()
-        return Party.objects.none()
+        qs = Party.objects.select_related("company", "party_type", "booking").order_by("code")
+        return self.scope_queryset(qs)
 
         # ✅ Bulk Import for Party
     @cache_page(60 * 5)  # 5 minutes
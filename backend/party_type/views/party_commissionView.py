@@ -9,10 +9,11 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from utils.excel_import import import_excel_to_model
+from backend.bulk import BulkSoftDeleteMixin
 
 
 
-class PartyCommissionViewSet(viewsets.ModelViewSet):
+class PartyCommissionViewSet(BulkSoftDeleteMixin, viewsets.ModelViewSet):
     queryset = PartyCommission.objects.all().select_related(
         "party_type", "party", "category", "product", "unit", "unit_size"
     )
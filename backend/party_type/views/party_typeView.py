@@ -3,53 +3,32 @@ from party_type.models.party_type import PartyType
 from party_type.serializers.party_typeSerializers import PartyTypeSerializer
 from rest_framework.permissions import IsAuthenticated
 from party_type.permissions import PartyTypeModulePermission
-from users.models import UserPermissionSet
-from django.db.models import Q
+from backend.scope import TenantScopeMixin
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from utils.excel_import import import_excel_to_model
 from django.views.decorators.cache import cache_page
+from backend.bulk import BulkSoftDeleteMixin
 
-class PartyTypeViewSet(viewsets.ModelViewSet):
+class PartyTypeViewSet(TenantScopeMixin, BulkSoftDeleteMixin, viewsets.ModelViewSet):
     queryset = PartyType.objects.all()
     serializer_class = PartyTypeSerializer
     permission_classes = [IsAuthenticated, PartyTypeModulePermission]
     module_name = "party_type"
+    scope_permission_column = "party_type_module"
+    scope_actions = ("view", "edit")
+    scope_fields = {"company": "company_id", "business_type": None, "factory": None}
     
     def get_queryset(self):
-        user = self.request.user
-        qs = PartyType.objects.all()
+        qs = PartyType.objects.select_related("company")
 
         # 🔹 filter by company_id if query param given
         company_id = self.request.query_params.get("company_id")
         if company_id:
             qs = qs.filter(company_id=company_id)
 
-        if user.is_superuser or user.is_staff:
-            return qs
+        return self.scope_queryset(qs)
 
-        perms = UserPermissionSet.objects.filter(user=user)
-        allowed_company_ids = set()
-        for p in perms:
-            party_perm = p.party_type_module
-            if isinstance(party_perm, str):
-                import json
-                try:
-                    party_perm = json.loads(party_perm)
-                except:
-                    party_perm = {}
-            elif party_perm is None:
-                party_perm = {}
-
-            module_perm = party_perm.get("party_type", {})
-            if module_perm.get("view", False) or module_perm.get("edit", False):
-                for cid in p.companies or []:
-                    allowed_company_ids.add(cid)
-
-        if not allowed_company_ids:
-            return PartyType.objects.none()
-
-        return qs.filter(company_id__in=allowed_company_ids).distinct()
     @action(detail=False, methods=["post"], url_path="bulk-import")
     def bulk_import(self, request):
 
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company', '0002_businesstype_deleted_at_businesstype_deleted_by_and_more'),
+        ('products', '0002_category_deleted_at_category_deleted_by_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['company', 'business_type', 'factory', 'is_deleted'], name='category_tenant_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['company', 'business_type', 'factory', 'is_deleted'], name='product_tenant_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='productsizesetting',
+            index=models.Index(fields=['company', 'business_type', 'factory', 'is_deleted'], name='productsizesetting_tenant_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='producttype',
+            index=models.Index(fields=['company', 'business_type', 'factory', 'is_deleted'], name='producttype_tenant_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='unit',
+            index=models.Index(fields=['company', 'business_type', 'factory', 'is_deleted'], name='unit_tenant_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='unitconversion',
+            index=models.Index(fields=['company', 'business_type', 'factory', 'is_deleted'], name='unitconversion_tenant_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='unitsize',
+            index=models.Index(fields=['company', 'business_type', 'factory', 'is_deleted'], name='unitsize_tenant_idx'),
+        ),
+    ]
@@ -41,5 +41,10 @@ class Category(AuditMixin):
         blank=True
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["company", "business_type", "factory", "is_deleted"], name="category_tenant_idx"),
+        ]
+
     def __str__(self):
         return f"{self.name} ({self.company.name if self.company else 'No Company'})"
@@ -48,6 +48,11 @@ class Product(AuditMixin):
     name = models.CharField(max_length=200)
     short_name = models.CharField(max_length=100, blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["company", "business_type", "factory", "is_deleted"], name="product_tenant_idx"),
+        ]
+
     def __str__(self):
         return self.name
 
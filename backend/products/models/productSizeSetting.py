@@ -37,5 +37,10 @@ class ProductSizeSetting(AuditMixin):
     code = models.BigIntegerField(blank=True,null=True,unique=True)
     customize_name = models.CharField(max_length=100, blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["company", "business_type", "factory", "is_deleted"], name="productsizesetting_tenant_idx"),
+        ]
+
     def __str__(self):
         return f"{self.product.name} - {self.unit.short_name} ({self.customize_name or self.size})"
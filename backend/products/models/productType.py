@@ -20,5 +20,10 @@ class ProductType(AuditMixin):
     name = models.CharField(max_length=200)
     desc = models.TextField(blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["company", "business_type", "factory", "is_deleted"], name="producttype_tenant_idx"),
+        ]
+
     def __str__(self):
         return f"{self.name} ({self.company.name if self.company else 'No Company'})"
@@ -29,5 +29,10 @@ class Unit(AuditMixin):
     name = models.CharField(max_length=200)
     short_name = models.CharField(max_length=50)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["company", "business_type", "factory", "is_deleted"], name="unit_tenant_idx"),
+        ]
+
     def __str__(self):
         return self.short_name
@@ -31,5 +31,10 @@ class UnitConversion(AuditMixin):
     child_unit = models.ForeignKey(Unit, on_delete=models.CASCADE, related_name="child_conversions")
     qty = models.DecimalField(max_digits=10, decimal_places=2)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["company", "business_type", "factory", "is_deleted"], name="unitconversion_tenant_idx"),
+        ]
+
     def __str__(self):
         return f"1 {self.parent_unit.short_name} = {self.qty} {self.child_unit.short_name}"
@@ -31,5 +31,10 @@ class UnitSize(AuditMixin):
     size_name = models.CharField(max_length=100)
     uom_weight = models.DecimalField(max_digits=10, decimal_places=2)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["company", "business_type", "factory", "is_deleted"], name="unitsize_tenant_idx"),
+        ]
+
     def __str__(self):
         return f"{self.size_name} ({self.unit.short_name})"
@@ -1,7 +1,7 @@
 # products/permissions.py
-from rest_framework.permissions import BasePermission
 from rest_framework.exceptions import PermissionDenied
-from users.models import UserPermissionSet
+from users.permission_engine import get_permission_snapshot
+from backend.scope import ObjectScopePermission
 
 # ===========================
 # Product / Module Permissions
@@ -34,7 +34,7 @@ def get_all_module_permissions():
 # DRF Module Permission Class
 # ===========================
 
-class ModulePermission(BasePermission):
+class ModulePermission(ObjectScopePermission):
     """
     Checks if a user has permission for a specific module and action.
     """
@@ -46,6 +46,8 @@ class ModulePermission(BasePermission):
         "bulk_create": "create",  # ✅ added for bulk create
         "partial_update": "edit",
         "destroy": "delete",
+        "bulk_delete": "delete",
+        "bulk_restore": "delete",
     }
 
     def has_permission(self, request, view):
@@ -57,24 +59,11 @@ class ModulePermission(BasePermission):
         if user.is_superuser or user.is_staff:
             return True
 
-        # Fetch user permission sets
-        perms = UserPermissionSet.objects.filter(user=user)
-
-        # Check each permission set
-        for p in perms:
-            # product_module should be a dict like:
-            # {"category": {"view": True, "create": False, "edit": True, "delete": False}}
-            module_perms = (p.product_module or {}).get(module_name, {})
-
-            # If permission exists, allow access
-            if module_perms.get(action_perm, False):
-                return True
+        # Compiled permission snapshot (request memo → redis → DB)
+        snapshot = get_permission_snapshot(user)
+        if snapshot.has("product_module", module_name, action_perm):
+            return True
 
         # If none matched, deny
         return False
 
-    def has_object_permission(self, request, view, obj):
-        """
-        Optional: Use this if you want object-level permission filtering
-        """
-        return self.has_permission(request, view)
@@ -0,0 +1,18 @@
+from django.db import connection
+from django.test import TestCase
+
+from products.models import (
+    Category, Product, ProductSizeSetting, ProductType, Unit, UnitConversion, UnitSize,
+)
+
+TENANT_SCOPED_MODELS = [Product, Category, Unit, UnitSize, UnitConversion, ProductSizeSetting, ProductType]
+
+
+class TenantIndexTests(TestCase):
+    def test_scoped_models_have_tenant_index(self):
+        with connection.cursor() as cursor:
+            for model in TENANT_SCOPED_MODELS:
+                with self.subTest(model=model.__name__):
+                    constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+                    columns = [c["columns"] for c in constraints.values() if c["index"]]
+                    self.assertIn(["company_id", "business_type_id", "factory_id", "is_deleted"], columns)
@@ -2,64 +2,27 @@ from rest_framework import viewsets, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.decorators import action
-from django.db.models import Q
 
 from utils.excel_import import import_excel_to_model
 from products.models.product import Product
 from products.serializers.productSerializer import ProductSerializer, BulkProductSerializer
-from users.models import UserPermissionSet
+from backend.scope import TenantScopeMixin
 from products.permissions import ModulePermission
+from backend.bulk import BulkSoftDeleteMixin
 
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(TenantScopeMixin, BulkSoftDeleteMixin, viewsets.ModelViewSet):
     serializer_class = ProductSerializer
     permission_classes = [IsAuthenticated, ModulePermission]
     module_name = "product"
+    scope_permission_column = "product_module"
 
     def get_queryset(self):
-        user = self.request.user
         qs = Product.objects.select_related(
             "company", "business_type", "factory", "product_type", "category"
         ).all()
 
-        if user.is_superuser or user.is_staff:
-            return qs
-
-        perms = UserPermissionSet.objects.filter(user=user)
-        query = Q()
-
-        for p in perms:
-            product_perm = p.product_module or {}
-            module_perm = product_perm.get("product", {})
-            if not module_perm.get("view", False):
-                continue
-
-            allowed_companies = list(map(int, p.companies or []))
-            for company_id in allowed_companies:
-                company_filter = Q(company_id=company_id)
-
-                allowed_bts = p.business_types.get(str(company_id), [])
-                if allowed_bts:
-                    bt_filter = Q()
-                    for bt_id in allowed_bts:
-                        bt_filter |= Q(business_type_id=bt_id)
-                    company_filter &= bt_filter
-
-                allowed_factories = p.factories.get(str(company_id), [])
-                if allowed_factories:
-                    factory_filter = Q()
-                    for f in allowed_factories:
-                        factory_filter |= Q(
-                            factory_id=f["factory_id"],
-                            business_type_id=f.get("business_type_id"),
-                        )
-                    company_filter &= factory_filter
-
-                query |= company_filter
-
-        if query:
-            return qs.filter(query).distinct()
-
-        return Product.objects.none()
+        # ✅ company / business type / factory scope (single predicate, no DISTINCT)
+        return self.scope_queryset(qs)
 
     # ✅ Bulk create
     @action(detail=False, methods=["post"], url_path="bulk-create")
@@ -1,22 +1,22 @@
 from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Q
 
 from products.models.unitConversion import UnitConversion
 from products.serializers.unitConversionSerializer import UnitConversionSerializer
 from products.permissions import ModulePermission
-from users.models import UserPermissionSet
+from backend.scope import TenantScopeMixin
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from utils.excel_import import import_excel_to_model
+from backend.bulk import BulkSoftDeleteMixin
 
-class UnitConversionViewSet(viewsets.ModelViewSet):
+class UnitConversionViewSet(TenantScopeMixin, BulkSoftDeleteMixin, viewsets.ModelViewSet):
     serializer_class = UnitConversionSerializer
     permission_classes = [IsAuthenticated, ModulePermission]
     module_name = "unit_conversion"
+    scope_permission_column = "product_module"
 
     def get_queryset(self):
-        user = self.request.user
         qs = UnitConversion.objects.select_related(
             "parent_unit", "child_unit", "company", "business_type", "factory"
         ).all()
@@ -33,45 +33,8 @@ class UnitConversionViewSet(viewsets.ModelViewSet):
         if factory_id:
             qs = qs.filter(factory_id=factory_id)
 
-        # 🔹 Superuser / staff
-        if user.is_superuser or user.is_staff:
-            return qs
-
-        # 🔹 Permission based filter
-        perms = UserPermissionSet.objects.filter(user=user)
-        query = Q()
-        for p in perms:
-            perm_module = p.product_module or {}
-            module_perm = perm_module.get("unit_conversion", {})
-            if not module_perm.get("view", False):
-                continue
-
-            allowed_companies = list(map(int, p.companies or []))
-            for cid in allowed_companies:
-                company_filter = Q(company_id=cid)
-
-                allowed_bts = p.business_types.get(str(cid), [])
-                if allowed_bts:
-                    bt_filter = Q()
-                    for bt in allowed_bts:
-                        bt_filter |= Q(business_type_id=bt)
-                    company_filter &= bt_filter
-
-                allowed_factories = p.factories.get(str(cid), [])
-                if allowed_factories:
-                    factory_filter = Q()
-                    for f in allowed_factories:
-                        factory_filter |= Q(
-                            factory_id=f["factory_id"],
-                            business_type_id=f.get("business_type_id"),
-                        )
-                    company_filter &= factory_filter
-
-                query |= company_filter
-
-        if query:
-            return qs.filter(query).distinct()
-        return UnitConversion.objects.none()
+        # ✅ company / business type / factory scope (single predicate, no DISTINCT)
+        return self.scope_queryset(qs)
 
     def get_permissions(self):
         action_perm_map = {
@@ -3,21 +3,27 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Q
 from products.models.unitSize import UnitSize
 from products.serializers.unitSizeSerializer import UnitSizeSerializer
 from products.permissions import ModulePermission
-from users.models import UserPermissionSet
+from backend.scope import TenantScopeMixin
 from utils.excel_import import import_excel_to_model
+from backend.bulk import BulkSoftDeleteMixin
 
 
-class UnitSizeViewSet(viewsets.ModelViewSet):
+class UnitSizeViewSet(TenantScopeMixin, BulkSoftDeleteMixin, viewsets.ModelViewSet):
     serializer_class = UnitSizeSerializer
     permission_classes = [IsAuthenticated, ModulePermission]
     module_name = "unit_size"
+    scope_permission_column = "product_module"
+    scope_fields = {
+        "company": "unit__company_id",
+        "business_type": "unit__business_type_id",
+        "factory": "unit__factory_id",
+    }
+    scope_include_unassigned = True
 
     def get_queryset(self):
-        user = self.request.user
         qs = UnitSize.objects.select_related("unit", "unit__company", "unit__business_type", "unit__factory").all()
 
         # 🔹 Query param filter (frontend se)
@@ -32,61 +38,8 @@ class UnitSizeViewSet(viewsets.ModelViewSet):
         if factory_id:
             qs = qs.filter(unit__factory_id=factory_id)
 
-        # 🔹 Superuser / Staff get all
-        if user.is_superuser or user.is_staff:
-            return qs
-
-        # 🔹 Permission based filter
-        perms = UserPermissionSet.objects.filter(user=user)
-        query = Q()
-        has_perm = False
-
-        for p in perms:
-            unit_size_perm = p.product_module or {}
-            module_perm = unit_size_perm.get("unit_size", {})
-            if not module_perm.get("view", False):
-                continue
-
-            has_perm = True
-            allowed_companies = list(map(int, p.companies or []))
-
-            if not allowed_companies:
-                query |= Q(unit__company__isnull=True)
-                continue
-
-            for cid in allowed_companies:
-                company_filter = Q(unit__company_id=cid)
-
-                allowed_bts = p.business_types.get(str(cid), [])
-                if allowed_bts:
-                    bt_filter = Q()
-                    for bt in allowed_bts:
-                        bt_filter |= Q(unit__business_type_id=bt)
-                    company_filter &= (bt_filter | Q(unit__business_type__isnull=True))
-
-                allowed_factories = p.factories.get(str(cid), [])
-                if allowed_factories:
-                    f_filter = Q()
-                    for f in allowed_factories:
-                        f_filter |= Q(
-                            unit__factory_id=f["factory_id"],
-                            unit__business_type_id=f.get("business_type_id"),
-                        )
-                    company_filter &= (f_filter | Q(unit__factory__isnull=True))
-
-                query |= company_filter
-
-        if query:
-            return qs.filter(query).distinct()
-
-        if has_perm:
-            return qs.filter(
-                Q(unit__company__isnull=True)
-                | Q(unit__business_type__isnull=True)
-                | Q(unit__factory__isnull=True)
-            ).distinct()
-
-        return UnitSize.objects.none()
+        # ✅ company / business type / factory scope (single predicate, no DISTINCT)
+        return self.scope_queryset(qs)
 
     def get_permissions(self):
         action_perm_map = {
@@ -1,21 +1,22 @@
 # products/views/unitViews.py
 from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Q
 from products.models.unit import Unit
 from products.serializers.unitSerializer import UnitSerializer
 from products.permissions import ModulePermission
-from users.models import UserPermissionSet
+from backend.scope import TenantScopeMixin
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from utils.excel_import import import_excel_to_model
-class UnitViewSet(viewsets.ModelViewSet):
+from backend.bulk import BulkSoftDeleteMixin
+class UnitViewSet(TenantScopeMixin, BulkSoftDeleteMixin, viewsets.ModelViewSet):
     serializer_class = UnitSerializer
     permission_classes = [IsAuthenticated, ModulePermission]
     module_name = "unit"
+    scope_permission_column = "product_module"
+    scope_include_unassigned = True
 
     def get_queryset(self):
-        user = self.request.user
         qs = Unit.objects.select_related("company", "business_type", "factory").all()
 
         # ✅ query param filter (company, business_type, factory)
@@ -30,61 +31,8 @@ class UnitViewSet(viewsets.ModelViewSet):
         if factory_id:
             qs = qs.filter(factory_id=factory_id)
 
-        # ✅ Superuser & staff can see all
-        if user.is_superuser or user.is_staff:
-            return qs
-
-        # ✅ Permission based filter
-        perms = UserPermissionSet.objects.filter(user=user)
-        query = Q()
-        has_perm = False
-
-        for p in perms:
-            unit_perm = p.product_module or {}
-            module_perm = unit_perm.get("unit", {})
-            if not module_perm.get("view", False):
-                continue
-
-            has_perm = True
-            allowed_companies = list(map(int, p.companies or []))
-
-            if not allowed_companies:
-                query |= Q(company__isnull=True)
-                continue
-
-            for cid in allowed_companies:
-                company_filter = Q(company_id=cid)
-
-                allowed_bts = p.business_types.get(str(cid), [])
-                if allowed_bts:
-                    bt_filter = Q()
-                    for bt in allowed_bts:
-                        bt_filter |= Q(business_type_id=bt)
-                    company_filter &= (bt_filter | Q(business_type__isnull=True))
-
-                allowed_factories = p.factories.get(str(cid), [])
-                if allowed_factories:
-                    f_filter = Q()
-                    for f in allowed_factories:
-                        f_filter |= Q(
-                            factory_id=f["factory_id"],
-                            business_type_id=f.get("business_type_id"),
-                        )
-                    company_filter &= (f_filter | Q(factory__isnull=True))
-
-                query |= company_filter
-
-        if query:
-            return qs.filter(query).distinct()
-
-        if has_perm:
-            return qs.filter(
-                Q(company__isnull=True)
-                | Q(business_type__isnull=True)
-                | Q(factory__isnull=True)
-            ).distinct()
-
-        return Unit.objects.none()
+        # ✅ company / business type / factory scope (single predicate, no DISTINCT)
+        return self.scope_queryset(qs)
 
     def get_permissions(self):
         action_perm_map = {
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('party_type', '0006_alive_indexes'),
+        ('products', '0003_tenant_indexes'),
+        ('sr', '0002_sr_deleted_at_sr_deleted_by_sr_is_deleted'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='sr',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['sr_no'], name='sr_sr_no_alive'),
+        ),
+        migrations.AddIndex(
+            model_name='sr',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['party'], name='sr_party_alive'),
+        ),
+    ]
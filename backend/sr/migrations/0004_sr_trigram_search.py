@@ -0,0 +1,16 @@
+from django.db import migrations
+
+from backend.search import create_trigram_indexes
+
+forwards, backwards = create_trigram_indexes("sr_sr", ["customer_name", "lot_number"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sr', '0003_alive_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:26
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sr', '0004_sr_trigram_search'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='sr',
+            name='sr_sr_no_alive',
+        ),
+    ]
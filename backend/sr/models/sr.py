@@ -1,5 +1,5 @@
 from django.db import models
-from backend.mixins import AuditMixin
+from backend.mixins import AuditMixin, alive_indexes
 from party_type.models.party import Party
 from products.models.productType import ProductType
 
@@ -29,6 +29,7 @@ class SR(AuditMixin):
 
     class Meta:
         ordering = ["sr_no"]
+        indexes = alive_indexes("sr", "party")
 
     def __str__(self):
         return f"SR-{self.sr_no} ({self.customer_name})"
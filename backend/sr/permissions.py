@@ -1,7 +1,6 @@
-from rest_framework.permissions import BasePermission
 from rest_framework.exceptions import PermissionDenied
-from users.models import UserPermissionSet
-import json
+from users.permission_engine import get_permission_snapshot
+from backend.scope import ObjectScopePermission
 
 SR_PERMISSIONS = {
     "sr": ["create", "view", "edit", "delete"],
@@ -18,7 +17,7 @@ def get_all_sr_permissions():
             })
     return permissions
 
-class SRModulePermission(BasePermission):
+class SRModulePermission(ObjectScopePermission):
     ACTION_MAP = {
         "list": "view",
         "retrieve": "view",
@@ -26,6 +25,8 @@ class SRModulePermission(BasePermission):
         "update": "edit",
         "partial_update": "edit",
         "destroy": "delete",
+        "bulk_delete": "delete",
+        "bulk_restore": "delete",
         "GET": "view",
         "POST": "create",
         "PUT": "edit",
@@ -50,19 +51,9 @@ class SRModulePermission(BasePermission):
         if not action_perm:
             return True
 
-        perms = UserPermissionSet.objects.filter(user=user)
-        for p in perms:
-            sr_module = p.sr_module
-            if isinstance(sr_module, str):
-                try:
-                    sr_module = json.loads(sr_module)
-                except:
-                    sr_module = {}
-            elif sr_module is None:
-                sr_module = {}
-
-            module_perms = sr_module.get(module_name, {})
-            if module_perms.get(action_perm, False):
-                return True
+        # Compiled permission snapshot (request memo → redis → DB)
+        snapshot = get_permission_snapshot(user)
+        if snapshot.has("sr_module", module_name, action_perm):
+            return True
 
         raise PermissionDenied(f"You cannot perform {action_perm} on {module_name}")
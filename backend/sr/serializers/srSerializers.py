@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from backend.AuditSerializerMixin import AuditSerializerMixin
+from backend.DynamicFieldsSerializerMixin import DynamicFieldsSerializerMixin
 from party_type.models.party import Party
 from products.models.productType import ProductType
 from sr.models.sr import SR
@@ -16,7 +17,7 @@ class ProductTypeMiniSerializer(serializers.ModelSerializer):
         model = ProductType
         fields = ["id", "name"]
 
-class SRSerializer(AuditSerializerMixin, serializers.ModelSerializer):
+class SRSerializer(AuditSerializerMixin, DynamicFieldsSerializerMixin, serializers.ModelSerializer):
     party = PartyMiniSerializer(read_only=True)
     party_id = serializers.PrimaryKeyRelatedField(
         queryset=Party.objects.all(),
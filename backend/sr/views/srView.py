@@ -2,7 +2,7 @@ from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from django.db.models import Q, Max
+from django.db.models import Max
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from utils.excel_import import import_excel_to_model
@@ -12,12 +12,20 @@ from party_type.permissions import PartyTypeModulePermission
 from users.models import UserPermissionSet
 from sr.permissions import SRModulePermission
 from django.views.decorators.cache import cache_page
+from backend.DynamicFieldsSerializerMixin import SparseFieldsViewMixin
+from backend.conditional import ConditionalGetMixin
+from backend.search import TrigramSearchMixin
+from backend.bulk import BulkSoftDeleteMixin
 
-class SRViewSet(viewsets.ModelViewSet):
-    queryset = SR.objects.all().order_by("sr_no")
+class SRViewSet(TrigramSearchMixin, SparseFieldsViewMixin, ConditionalGetMixin, BulkSoftDeleteMixin, viewsets.ModelViewSet):
+    queryset = SR.objects.select_related("party", "product_type").order_by("sr_no")
     serializer_class = SRSerializer
     permission_classes = [IsAuthenticated, SRModulePermission]
     module_name = "sr"
+    keyset_ordering = ("sr_no",)
+    # backend/tests.py: conditional GET aggregate + এক page (nested relation সব select_related এ)
+    query_budget = 2
+    search_fields = ("customer_name", "lot_number")
     
     @action(detail=False, methods=["post"], url_path="bulk-import")
     def bulk_import(self, request):
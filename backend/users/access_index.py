@@ -0,0 +1,81 @@
+# users/access_index.py
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+
+from company.models import Factory
+from .models import CustomUser, UserModuleGrant, UserScopeGrant
+
+
+# ======================
+# Reverse Access Index
+# ======================
+# (column, module, action, company, factory) → কোন কোন user access পায়।
+# UserModuleGrant / UserScopeGrant (permission write এর সময় sync হয়) এর উপর
+# indexed EXISTS semi-join, JSON blob scan লাগে না।
+
+def _scope_grants(**filters):
+    return UserScopeGrant.objects.filter(user_id=OuterRef("pk"), **filters)
+
+
+def users_with_access(column=None, module=None, action=None, company_id=None, factory_id=None):
+    """
+    সব parameter optional। যেমন:
+        users_with_access("pallot_module", "pallot", "edit", factory_id=12)
+    Superuser/staff এখানে আসে না (ওরা সবকিছু bypass করে)।
+    """
+    qs = CustomUser.objects.filter(is_active=True, is_superuser=False, is_staff=False)
+
+    if column or module or action:
+        grant_filter = {k: v for k, v in (("column", column), ("module", module), ("action", action)) if v}
+        qs = qs.filter(Exists(UserModuleGrant.objects.filter(user_id=OuterRef("pk"), **grant_filter)))
+
+    business_type_id = None
+    if factory_id is not None:
+        factory = Factory.all_objects.filter(id=factory_id).values("company_id", "business_type_id").first()
+        if factory is None:
+            return qs.none()
+        company_id = company_id or factory["company_id"]
+        business_type_id = factory["business_type_id"]
+
+    if company_id is None:
+        return qs
+
+    # Company grant থাকতে হবে
+    qs = qs.filter(Exists(_scope_grants(company_id=company_id, business_type__isnull=True, factory__isnull=True)))
+
+    # Business type restriction থাকলে সেটার ভিতরে হতে হবে
+    if business_type_id is not None:
+        bt_rows = _scope_grants(company_id=company_id, business_type__isnull=False, factory__isnull=True)
+        qs = qs.filter(~Exists(bt_rows) | Exists(bt_rows.filter(business_type_id=business_type_id)))
+
+    # Factory restriction থাকলে factory grant লাগবে
+    if factory_id is not None:
+        # factory grant এর business type থাকলে সেটা factory র business type হতে হবে (compile_scope_predicate এর মতো)
+        factory_rows = _scope_grants(company_id=company_id, factory__isnull=False)
+        matching = factory_rows.filter(
+            Q(business_type__isnull=True) | Q(business_type_id=business_type_id),
+            factory_id=factory_id,
+        )
+        qs = qs.filter(~Exists(factory_rows) | Exists(matching))
+
+    return qs
+
+
+def invalidate_access(user_ids=None, **filters):
+    """
+    শুধু affected user দের snapshot invalidate (সব user এর cache flush না করে)।
+        invalidate_access(user_ids=[...])          → grant বদলানো user রা
+        invalidate_access(factory_id=factory.id)   → যারা ওই factory access পায়
+    Version bump commit এর পরে হয় (rollback হলে পুরোনো snapshot ই ঠিক)।
+    """
+    from .permission_engine import bump_permission_versions
+
+    if filters:
+        qs = users_with_access(**filters)
+        if user_ids is not None:
+            qs = qs.filter(id__in=user_ids)
+        user_ids = qs.values_list("id", flat=True)
+    user_ids = list(user_ids or ())
+    if user_ids:
+        transaction.on_commit(lambda: bump_permission_versions(user_ids))
+    return user_ids
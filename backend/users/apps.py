@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_save
 
 
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
+
+    def ready(self):
+        # যে পথেই token blacklist হোক, jti cache এ যায় (users/token_blacklist.py)
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+        from .token_blacklist import cache_blacklisted_token
+
+        post_save.connect(cache_blacklisted_token, sender=BlacklistedToken, dispatch_uid="users.cache_blacklisted_token")
@@ -0,0 +1,56 @@
+# users/authentication.py
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .permission_engine import get_permission_version
+from .token_claims import PERMISSION_CLAIM, snapshot_from_claim
+from .user_cache import get_cached_user
+
+
+class PermissionClaimsJWTAuthentication(JWTAuthentication):
+    """
+    simplejwt JWTAuthentication + token এর permission claim।
+    Claim থাকলে আর version current হলে snapshot সরাসরি token থেকে বানানো হয়,
+    permission class গুলো আর DB hit করে না। Version পুরোনো হলে token reject।
+    User row নিজেও short-TTL cache থেকে আসে (users/user_cache.py)।
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        try:
+            user = get_cached_user(user_id)
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed("The user's password has been changed.", code="password_changed")
+
+        return user
+
+    def authenticate(self, request):
+        result = super().authenticate(request)
+        if result is None:
+            return None
+
+        user, validated_token = result
+        claim = validated_token.get(PERMISSION_CLAIM)
+        if claim is not None:
+            if claim.get("v") != get_permission_version(user.pk):
+                raise AuthenticationFailed(
+                    "Permissions changed, please refresh your token.",
+                    code="permissions_stale",
+                )
+            user._permission_snapshot = snapshot_from_claim(user.pk, claim)
+
+        return user, validated_token
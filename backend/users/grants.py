@@ -0,0 +1,77 @@
+# users/grants.py
+from django.db import transaction
+
+from company.models import Company, BusinessType, Factory
+from .access_index import invalidate_access
+from .models import UserPermissionSet, UserScopeGrant, UserModuleGrant
+from .permission_engine import ACTION_BITS, compile_permission_sets
+
+
+# ======================
+# UserPermissionSet JSON → UserScopeGrant / UserModuleGrant
+# ======================
+
+def build_grant_rows(snapshots):
+    """Compiled snapshot গুলো থেকে grant row (unsaved) বানায়"""
+    # JSON এ পুরোনো/hard-deleted id থাকতে পারে → FK ভাঙবে, তাই আগে filter
+    company_ids = {cid for s in snapshots for cid in s.companies}
+    bt_ids = {bt for s in snapshots for ids in s.business_types.values() for bt in ids}
+    factory_ids = {f for s in snapshots for pairs in s.factories.values() for f, _ in pairs}
+    company_ids = set(Company.all_objects.filter(id__in=company_ids).values_list("id", flat=True))
+    bt_ids = set(BusinessType.all_objects.filter(id__in=bt_ids).values_list("id", flat=True))
+    factory_ids = set(Factory.all_objects.filter(id__in=factory_ids).values_list("id", flat=True))
+
+    scope_rows = []
+    module_rows = []
+    for snapshot in snapshots:
+        user_id = snapshot.user_id
+        for cid in sorted(snapshot.companies & company_ids):
+            scope_rows.append(UserScopeGrant(user_id=user_id, company_id=cid))
+            for bt in sorted(snapshot.business_types.get(cid, ())):
+                if bt in bt_ids:
+                    scope_rows.append(UserScopeGrant(user_id=user_id, company_id=cid, business_type_id=bt))
+            for factory_id, bt in snapshot.factories.get(cid, ()):
+                if factory_id in factory_ids:
+                    scope_rows.append(UserScopeGrant(
+                        user_id=user_id,
+                        company_id=cid,
+                        business_type_id=bt if bt in bt_ids else None,
+                        factory_id=factory_id,
+                    ))
+
+        for column, modules in snapshot.actions.items():
+            for module, bits in modules.items():
+                for action, bit in ACTION_BITS.items():
+                    if bits & bit:
+                        module_rows.append(UserModuleGrant(user_id=user_id, column=column, module=module, action=action))
+
+    return scope_rows, module_rows
+
+
+def sync_grants_for_users(user_ids):
+    """
+    User গুলোর grant table UserPermissionSet অনুযায়ী replace করে।
+    সব user এর permission set একটা query তে, delete/insert bulk এ।
+    Commit এর পরে ওই user দের cached snapshot invalidate হয়।
+    """
+    user_ids = list(user_ids)
+    by_user = {user_id: [] for user_id in user_ids}
+    for p in UserPermissionSet.objects.filter(user_id__in=user_ids):
+        by_user[p.user_id].append(p)
+
+    snapshots = [compile_permission_sets(user_id, None, sets) for user_id, sets in by_user.items()]
+    scope_rows, module_rows = build_grant_rows(snapshots)
+
+    with transaction.atomic():
+        UserScopeGrant.objects.filter(user_id__in=user_ids).delete()
+        UserModuleGrant.objects.filter(user_id__in=user_ids).delete()
+        UserScopeGrant.objects.bulk_create(scope_rows, batch_size=1000)
+        UserModuleGrant.objects.bulk_create(module_rows, batch_size=1000)
+        invalidate_access(user_ids=user_ids)
+
+    return len(scope_rows), len(module_rows)
+
+
+def sync_user_grants(user_id):
+    """update_or_create_set এর পরে (একই transaction এ) call হয়"""
+    return sync_grants_for_users([user_id])
@@ -0,0 +1,53 @@
+# users/management/commands/backfill_permission_grants.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from users.grants import sync_grants_for_users
+from users.models import UserPermissionSet
+
+
+class Command(BaseCommand):
+    help = "Existing UserPermissionSet row থেকে UserScopeGrant / UserModuleGrant table fill করে"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, action="append", dest="users",
+                            help="শুধু এই user id (একাধিকবার দেওয়া যাবে)")
+        parser.add_argument("--batch-size", type=int, default=500,
+                            help="প্রতি batch এ কতজন user (প্রতি batch আলাদা transaction এ commit)")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if options["users"]:
+            # permission set না থাকলেও দেওয়া user এর grant sync (পুরোনো row মুছে যাবে)
+            user_ids = options["users"]
+        else:
+            # সব user id একসাথে memory তে না এনে chunk করে পড়া
+            user_ids = (
+                UserPermissionSet.objects.order_by("user_id").values_list("user_id", flat=True)
+                .distinct().iterator(chunk_size=batch_size)
+            )
+
+        scope_total = module_total = synced = 0
+
+        def flush(batch):
+            nonlocal scope_total, module_total, synced
+            # batch শেষ হলেই commit → মাঝপথে থামলেও আগের batch গুলো থেকে যায়
+            with transaction.atomic():
+                scope_count, module_count = sync_grants_for_users(batch)
+            scope_total += scope_count
+            module_total += module_count
+            synced += len(batch)
+            self.stdout.write(f"{synced} users synced")
+
+        batch = []
+        for user_id in user_ids:
+            batch.append(user_id)
+            if len(batch) >= batch_size:
+                flush(batch)
+                batch = []
+        if batch:
+            flush(batch)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Done: {scope_total} scope grants, {module_total} module grants"
+        ))
@@ -0,0 +1,30 @@
+# users/management/commands/purge_expired_tokens.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+
+class Command(BaseCommand):
+    help = "Expire হয়ে যাওয়া OutstandingToken / BlacklistedToken row batch এ delete করে (cron থেকে চালাতে হবে)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        expired = OutstandingToken.objects.filter(expires_at__lt=timezone.now()).order_by("id")
+
+        total = 0
+        while True:
+            ids = list(expired.values_list("id", flat=True)[:batch_size])
+            if not ids:
+                break
+            # ছোট ছোট transaction → table lock লম্বা সময় ধরে থাকে না
+            with transaction.atomic():
+                BlacklistedToken.objects.filter(token_id__in=ids).delete()
+                OutstandingToken.objects.filter(id__in=ids).delete()
+            total += len(ids)
+            self.stdout.write(f"{total} expired tokens purged")
+
+        self.stdout.write(self.style.SUCCESS(f"Done: {total} expired tokens purged"))
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company', '0002_businesstype_deleted_at_businesstype_deleted_by_and_more'),
+        ('users', '0002_customuser_deleted_at_customuser_deleted_by_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserModuleGrant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('column', models.CharField(max_length=50)),
+                ('module', models.CharField(max_length=100)),
+                ('action', models.CharField(max_length=20)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='module_grants', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['column', 'module', 'action'], name='module_grant_lookup_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'column', 'module', 'action'), name='unique_user_module_grant')],
+            },
+        ),
+        migrations.CreateModel(
+            name='UserScopeGrant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('business_type', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='company.businesstype')),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='company.company')),
+                ('factory', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='company.factory')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='scope_grants', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['company', 'business_type', 'factory'], name='scope_grant_tenant_idx'), models.Index(fields=['user', 'company'], name='scope_grant_user_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_userscopegrant_usermodulegrant'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='role',
+            name='business_types',
+            field=models.JSONField(blank=True, default=dict, null=True),
+        ),
+        migrations.AddField(
+            model_name='role',
+            name='companies',
+            field=models.JSONField(blank=True, default=list, null=True),
+        ),
+        migrations.AddField(
+            model_name='role',
+            name='factories',
+            field=models.JSONField(blank=True, default=dict, null=True),
+        ),
+        migrations.AddField(
+            model_name='role',
+            name='modules',
+            field=models.JSONField(blank=True, default=dict, null=True),
+        ),
+    ]
@@ -2,7 +2,9 @@
 from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
 from django.utils import timezone
+from django.db import transaction
 from backend.mixins import AuditMixin
+from .user_cache import bump_user_version
 
 # ======================
 # User Model
@@ -43,6 +45,11 @@ class CustomUser(AbstractBaseUser, PermissionsMixin,AuditMixin):
     def __str__(self):
         return self.email
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # toggle_active / update_role / password change → cached auth user invalidate
+        transaction.on_commit(lambda: bump_user_version(self.pk))
+
     def has_perm(self, perm, obj=None):
         return self.is_superuser
 
@@ -68,6 +75,14 @@ class Permission(AuditMixin):
 class Role(AuditMixin):
     name = models.CharField(max_length=100, unique=True)  # e.g. "Admin", "Manager"
 
+    # 🔹 Permission template → role এর সব user এ materialize হয় (users/roles.py)
+    # modules: {"product_module": {"category": {"view": True, ...}}, ...}
+    modules = models.JSONField(default=dict, blank=True, null=True)
+    # Default scope (খালি থাকলে user এর নিজের scope রাখা হয়)
+    companies = models.JSONField(default=list, blank=True, null=True)
+    business_types = models.JSONField(default=dict, blank=True, null=True)
+    factories = models.JSONField(default=dict, blank=True, null=True)
+
     def __str__(self):
         return self.name
 
@@ -103,3 +118,66 @@ class UserPermissionSet(AuditMixin):
     def __str__(self):
         return f"PermissionSet → {self.user.email}"
 
+
+
+# ======================
+# Normalized Grant Tables (UserPermissionSet JSON এর indexed copy)
+# ======================
+# UserPermissionSet এর JSON column index/join করা যায় না।
+# update_or_create_set এ এই table গুলোতে dual-write হয় (users/grants.py)।
+
+class UserScopeGrantQuerySet(models.QuerySet):
+    def for_company(self, company_id):
+        return self.filter(company_id=company_id)
+
+    def for_factory(self, factory_id):
+        return self.filter(factory_id=factory_id)
+
+
+class UserScopeGrant(models.Model):
+    """
+    (company, NULL, NULL)    → company grant (প্রতিটি allowed company এর জন্য একটা row)
+    (company, bt, NULL)      → business type restriction
+    (company, bt/NULL, f)    → factory restriction
+    """
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="scope_grants")
+    company = models.ForeignKey("company.Company", on_delete=models.CASCADE, related_name="+")
+    business_type = models.ForeignKey("company.BusinessType", on_delete=models.CASCADE, null=True, blank=True, related_name="+")
+    factory = models.ForeignKey("company.Factory", on_delete=models.CASCADE, null=True, blank=True, related_name="+")
+
+    objects = UserScopeGrantQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["company", "business_type", "factory"], name="scope_grant_tenant_idx"),
+            models.Index(fields=["user", "company"], name="scope_grant_user_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} → {self.company_id}/{self.business_type_id}/{self.factory_id}"
+
+
+class UserModuleGrantQuerySet(models.QuerySet):
+    def granting(self, column, module, action):
+        # e.g. granting("pallot_module", "pallot", "edit") → যাদের pallot edit আছে
+        return self.filter(column=column, module=module, action=action)
+
+
+class UserModuleGrant(models.Model):
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="module_grants")
+    column = models.CharField(max_length=50)     # e.g. "pallot_module"
+    module = models.CharField(max_length=100)    # e.g. "pallot"
+    action = models.CharField(max_length=20)     # create / view / edit / delete
+
+    objects = UserModuleGrantQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "column", "module", "action"], name="unique_user_module_grant"),
+        ]
+        indexes = [
+            models.Index(fields=["column", "module", "action"], name="module_grant_lookup_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} → {self.column}.{self.module}.{self.action}"
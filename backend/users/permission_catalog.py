@@ -0,0 +1,45 @@
+# users/permission_catalog.py
+import hashlib
+import json
+
+# ======================
+# সব app এর *_PERMISSIONS dict এক জায়গায়
+# ======================
+# key → UserPermissionSet এর column
+
+
+def get_permission_catalog():
+    # app permission module গুলো users.permission_engine import করে, তাই lazy import
+    from products.permissions import PRODUCT_PERMISSIONS
+    from company.permissions import COMPANY_PERMISSIONS
+    from accounts.permissions import ACCOUNTS_PERMISSIONS
+    from essential_settings.permissions import SETTINGS_PERMISSIONS
+    from party_type.permissions import PARTY_TYPE_PERMISSIONS
+    from sr.permissions import SR_PERMISSIONS
+    from booking.permissions import BOOKING_PERMISSIONS
+    from loan.permissions import LOAN_PERMISSIONS
+    from pallot.permissions import PALLOT_PERMISSIONS
+
+    return {
+        "product_module": PRODUCT_PERMISSIONS,
+        "company_module": COMPANY_PERMISSIONS,
+        "accounts_module": ACCOUNTS_PERMISSIONS,
+        "settings_module": SETTINGS_PERMISSIONS,
+        "party_type_module": PARTY_TYPE_PERMISSIONS,
+        "sr_module": SR_PERMISSIONS,
+        "booking_module": BOOKING_PERMISSIONS,
+        "loan_module": LOAN_PERMISSIONS,
+        "pallot_module": PALLOT_PERMISSIONS,
+    }
+
+
+_catalog_hash = None
+
+
+def get_catalog_hash():
+    """Catalog code এ define করা, তাই process এ একবারই hash করা হয়"""
+    global _catalog_hash
+    if _catalog_hash is None:
+        raw = json.dumps(get_permission_catalog(), sort_keys=True)
+        _catalog_hash = hashlib.sha1(raw.encode()).hexdigest()[:12]
+    return _catalog_hash
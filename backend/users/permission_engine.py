@@ -0,0 +1,227 @@
+# users/permission_engine.py
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import UserPermissionSet
+
+# ======================
+# Shared Permission Engine
+# ======================
+# প্রতিটি app এর permission class আগে নিজে নিজে UserPermissionSet query করতো।
+# এখন user এর সব permission row একবার compile করে একটা immutable snapshot
+# বানানো হয় এবং redis cache এ per-user version key দিয়ে রাখা হয়।
+
+# UserPermissionSet এর module-wise JSON column গুলো
+MODULE_COLUMNS = (
+    "product_module",
+    "company_module",
+    "hr_module",
+    "accounts_module",
+    "inventory_module",
+    "settings_module",
+    "party_type_module",
+    "sr_module",
+    "booking_module",
+    "loan_module",
+    "pallot_module",
+    "delivery_module",
+    "ledger_module",
+)
+
+# action → bit
+ACTION_BITS = {
+    "create": 1,
+    "view": 2,
+    "edit": 4,
+    "delete": 8,
+}
+
+SNAPSHOT_TIMEOUT = getattr(settings, "PERMISSION_SNAPSHOT_TIMEOUT", 60 * 60)
+VERSION_KEY = "perm:version:{user_id}"
+SNAPSHOT_KEY = "perm:snapshot:{user_id}:{version}"
+
+
+def _parse_json(raw):
+    """JSON column কখনো string হিসেবেও save হয়েছে → dict এ convert"""
+    if isinstance(raw, str):
+        try:
+            raw = json.loads(raw)
+        except json.JSONDecodeError:
+            return {}
+    return raw if isinstance(raw, dict) else {}
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class PermissionSnapshot:
+    """
+    User এর compiled permission (read-only).
+
+    actions:        {column: {module_name: bitset}}
+    companies:      frozenset of company ids
+    business_types: {company_id: frozenset of business_type ids}
+    factories:      {company_id: frozenset of (factory_id, business_type_id)}
+    """
+
+    __slots__ = ("user_id", "version", "actions", "companies", "business_types", "factories")
+
+    def __init__(self, user_id, version, actions, companies, business_types, factories):
+        object.__setattr__(self, "user_id", user_id)
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "actions", actions)
+        object.__setattr__(self, "companies", companies)
+        object.__setattr__(self, "business_types", business_types)
+        object.__setattr__(self, "factories", factories)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PermissionSnapshot is immutable")
+
+    # 🔹 Cache এ শুধু plain data রাখা হয় (class change হলেও unpickle ভাঙবে না)
+    def to_payload(self):
+        return {
+            "actions": {col: dict(mods) for col, mods in self.actions.items()},
+            "companies": sorted(self.companies),
+            "business_types": {cid: sorted(ids) for cid, ids in self.business_types.items()},
+            "factories": {cid: list(pairs) for cid, pairs in self.factories.items()},
+        }
+
+    @classmethod
+    def from_payload(cls, user_id, version, payload):
+        return cls(
+            user_id=user_id,
+            version=version,
+            actions={col: dict(mods) for col, mods in payload["actions"].items()},
+            companies=frozenset(payload["companies"]),
+            business_types={cid: frozenset(ids) for cid, ids in payload["business_types"].items()},
+            factories={
+                cid: frozenset(tuple(pair) for pair in pairs)
+                for cid, pairs in payload["factories"].items()
+            },
+        )
+
+    def bits(self, column, module_name):
+        return self.actions.get(column, {}).get(module_name, 0)
+
+    def has(self, column, module_name, action):
+        bit = ACTION_BITS.get(action, 0)
+        return bool(bit) and bool(self.bits(column, module_name) & bit)
+
+
+def compile_permission_sets(user_id, version, perm_sets):
+    """UserPermissionSet rows → PermissionSnapshot (সব row এর union)"""
+    actions = {}
+    companies = set()
+    business_types = {}
+    factories = {}
+
+    for p in perm_sets:
+        for column in MODULE_COLUMNS:
+            for module_name, module_perms in _parse_json(getattr(p, column, None)).items():
+                if not isinstance(module_perms, dict):
+                    continue
+                bits = 0
+                for action, bit in ACTION_BITS.items():
+                    if module_perms.get(action, False):
+                        bits |= bit
+                if bits:
+                    col_actions = actions.setdefault(column, {})
+                    col_actions[module_name] = col_actions.get(module_name, 0) | bits
+
+        for cid in p.companies or []:
+            cid = _to_int(cid)
+            if cid is not None:
+                companies.add(cid)
+
+        for cid, bt_ids in _parse_json(p.business_types).items():
+            cid = _to_int(cid)
+            if cid is None:
+                continue
+            bucket = business_types.setdefault(cid, set())
+            for bt_id in bt_ids or []:
+                bt_id = _to_int(bt_id)
+                if bt_id is not None:
+                    bucket.add(bt_id)
+
+        for cid, items in _parse_json(p.factories).items():
+            cid = _to_int(cid)
+            if cid is None:
+                continue
+            bucket = factories.setdefault(cid, set())
+            for f in items or []:
+                factory_id = _to_int(f.get("factory_id"))
+                if factory_id is not None:
+                    bucket.add((factory_id, _to_int(f.get("business_type_id"))))
+
+    return PermissionSnapshot(
+        user_id=user_id,
+        version=version,
+        actions=actions,
+        companies=frozenset(companies),
+        business_types={cid: frozenset(ids) for cid, ids in business_types.items()},
+        factories={cid: frozenset(pairs) for cid, pairs in factories.items()},
+    )
+
+
+def _new_version():
+    # version key evict হলেও পুরোনো snapshot key আর match করবে না
+    return time.time_ns()
+
+
+def get_permission_version(user_id):
+    return cache.get_or_set(VERSION_KEY.format(user_id=user_id), _new_version, timeout=None)
+
+
+def bump_permission_version(user_id):
+    """Permission change হলে call করতে হবে → পুরোনো snapshot আর ব্যবহার হবে না"""
+    key = VERSION_KEY.format(user_id=user_id)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        version = _new_version()
+        cache.set(key, version, timeout=None)
+        return version
+
+
+def bump_permission_versions(user_ids):
+    """অনেক user এর version একসাথে (একটা cache round trip)"""
+    version = _new_version()
+    cache.set_many(
+        {VERSION_KEY.format(user_id=user_id): version for user_id in user_ids},
+        timeout=None,
+    )
+
+
+def load_permission_snapshot(user_id):
+    """redis থেকে snapshot, না থাকলে DB থেকে compile করে cache এ রাখা"""
+    version = get_permission_version(user_id)
+    key = SNAPSHOT_KEY.format(user_id=user_id, version=version)
+    payload = cache.get(key)
+
+    if payload is not None:
+        return PermissionSnapshot.from_payload(user_id, version, payload)
+
+    snapshot = compile_permission_sets(
+        user_id, version, UserPermissionSet.objects.filter(user_id=user_id)
+    )
+    cache.set(key, snapshot.to_payload(), timeout=SNAPSHOT_TIMEOUT)
+    return snapshot
+
+
+def get_permission_snapshot(user):
+    """
+    Request এর ভিতরে user object এ memoize, তারপর redis, শেষে DB।
+    একই request এ যত permission check হোক, DB/cache একবারই hit হবে।
+    """
+    snapshot = getattr(user, "_permission_snapshot", None)
+    if snapshot is None:
+        snapshot = load_permission_snapshot(user.pk)
+        user._permission_snapshot = snapshot
+    return snapshot
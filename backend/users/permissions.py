@@ -0,0 +1,9 @@
+from rest_framework.permissions import BasePermission
+
+
+class IsSuperUserOrStaff(BasePermission):
+    """Role template এর মতো global config শুধু superuser / staff বদলাতে পারে"""
+
+    def has_permission(self, request, view):
+        user = request.user
+        return bool(user and user.is_authenticated and (user.is_superuser or user.is_staff))
@@ -0,0 +1,72 @@
+# users/roles.py
+from django.db import transaction
+from django.utils import timezone
+
+from .grants import sync_grants_for_users
+from .models import CustomUser, UserPermissionSet
+from .permission_engine import MODULE_COLUMNS
+
+
+# ======================
+# Role template → UserPermissionSet (bulk materialize)
+# ======================
+
+# এগুলোর কোনোটা বদলালেই user দের permission set আবার materialize করতে হয়
+ROLE_TEMPLATE_FIELDS = ("modules", "companies", "business_types", "factories")
+
+
+def role_template_fields(role):
+    """
+    Role template থেকে UserPermissionSet এর field values।
+    modules খালি হলে module column গুলো বাদ (user এর আগের grant থাকে),
+    পুরো template খালি হলে {}।
+    """
+    modules = role.modules or {}
+    fields = {}
+    if modules:
+        fields.update({column: modules.get(column, {}) for column in MODULE_COLUMNS})
+    if role.companies:
+        fields["companies"] = role.companies
+        fields["business_types"] = role.business_types or {}
+        fields["factories"] = role.factories or {}
+    return fields
+
+
+@transaction.atomic
+def materialize_role(role, user_ids=None):
+    """
+    Role এর সব user (বা শুধু user_ids) এর permission set role template দিয়ে replace করে।
+    N টা HTTP call এর বদলে: একটা bulk_create (নতুনদের জন্য) + একটা bulk_update,
+    grant table bulk sync, আর একটাই cache round trip এ version bump।
+    """
+    fields = role_template_fields(role)
+    # খালি template দিয়ে user দের existing grant মুছে ফেলা যাবে না
+    if not fields:
+        return 0
+
+    users = CustomUser.objects.filter(role=role)
+    if user_ids is not None:
+        users = users.filter(id__in=user_ids)
+    user_ids = list(users.values_list("id", flat=True))
+    if not user_ids:
+        return 0
+
+    now = timezone.now()
+
+    sets = list(UserPermissionSet.objects.filter(user_id__in=user_ids))
+    have_set = {p.user_id for p in sets}
+    UserPermissionSet.objects.bulk_create(
+        [UserPermissionSet(user_id=uid, role=role, **fields) for uid in user_ids if uid not in have_set],
+        batch_size=500,
+    )
+
+    for p in sets:
+        for name, value in fields.items():
+            setattr(p, name, value)
+        p.role = role
+        p.modified_at = now  # bulk_update এ auto_now কাজ করে না
+    UserPermissionSet.objects.bulk_update(sets, [*fields, "role", "modified_at"], batch_size=500)
+
+    # grant sync commit এর পরে এই user দের snapshot invalidate করে
+    sync_grants_for_users(user_ids)
+    return len(user_ids)
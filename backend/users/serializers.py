@@ -11,6 +11,12 @@ class RoleSerializer(AuditSerializerMixin, serializers.ModelSerializer):
         model = Role
         fields = ["id", "name"]
 
+class RoleTemplateSerializer(AuditSerializerMixin, serializers.ModelSerializer):
+    # Role CRUD → permission template সহ
+    class Meta:
+        model = Role
+        fields = ["id", "name", "modules", "companies", "business_types", "factories"]
+
 class UserSerializer(AuditSerializerMixin, serializers.ModelSerializer):
     role = RoleSerializer(read_only=True)  # show role info
     class Meta:
@@ -54,3 +60,35 @@ class UserPermissionSetSerializer(AuditSerializerMixin, serializers.ModelSeriali
     class Meta:
         model = UserPermissionSet
         fields = "__all__"
+
+
+# ------------------------------
+# JWT serializers (permission claims)
+# ------------------------------
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from .token_claims import add_permission_claims, permission_claims_enabled
+from .token_blacklist import CachedBlacklistRefreshToken
+
+
+class PermissionTokenObtainPairSerializer(TokenObtainPairSerializer):
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        if permission_claims_enabled():
+            access = add_permission_claims(AccessToken(data["access"]), self.user.pk)
+            data["access"] = str(access)
+        return data
+
+
+class PermissionTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = CachedBlacklistRefreshToken
+
+    # ✅ Refresh এর সময় সবসময় fresh permission digest
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        if permission_claims_enabled():
+            access = AccessToken(data["access"])
+            add_permission_claims(access, access[jwt_settings.USER_ID_CLAIM])
+            data["access"] = str(access)
+        return data
@@ -0,0 +1,68 @@
+# users/token_blacklist.py
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+# ======================
+# Redis Blacklisted-JTI Cache
+# ======================
+# simplejwt প্রতি refresh এ BlacklistedToken ⨝ OutstandingToken query করে,
+# table বড় হলে refresh slow হয়। এখানে প্রতি blacklisted jti একটা redis key
+# (token expire হওয়া পর্যন্ত TTL), তাই lookup সবসময় একটা GET।
+#
+# "ready" flag না থাকলে (redis restart/flush) DB থেকে live blacklist আবার load হয়।
+# BlacklistedToken এর post_save থেকে key set হয় → blacklist(), admin, shell
+# বা সরাসরি create সব পথেই cache সাথে সাথে update (users/apps.py তে connect)।
+
+BLACKLIST_KEY = "jwt:blacklist:{jti}"
+BLACKLIST_READY_KEY = "jwt:blacklist:ready"
+BLACKLIST_REWARM_TIMEOUT = getattr(settings, "JWT_BLACKLIST_REWARM_TIMEOUT", 60 * 60)
+
+
+def _ttl(exp):
+    return max(int(exp - time.time()), 1)
+
+
+def cache_blacklisted_jti(jti, exp):
+    cache.set(BLACKLIST_KEY.format(jti=jti), 1, timeout=_ttl(exp))
+
+
+def cache_blacklisted_token(sender, instance, created, **kwargs):
+    """post_save(BlacklistedToken) receiver"""
+    cache_blacklisted_jti(instance.token.jti, instance.token.expires_at.timestamp())
+
+
+def warm_blacklist_cache():
+    """এখনো expire না হওয়া blacklisted token গুলো cache এ load"""
+    rows = BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now()).values_list(
+        "token__jti", "token__expires_at"
+    )
+    for jti, expires_at in rows.iterator(chunk_size=2000):
+        cache_blacklisted_jti(jti, expires_at.timestamp())
+    cache.set(BLACKLIST_READY_KEY, 1, timeout=BLACKLIST_REWARM_TIMEOUT)
+
+
+def is_jti_blacklisted(jti):
+    key = BLACKLIST_KEY.format(jti=jti)
+    found = cache.get_many([BLACKLIST_READY_KEY, key])
+    if BLACKLIST_READY_KEY not in found:
+        warm_blacklist_cache()
+        return cache.get(key) is not None
+    return key in found
+
+
+class CachedBlacklistRefreshToken(RefreshToken):
+    """
+    RefreshToken, কিন্তু blacklist check redis থেকে।
+    blacklist() আগের মতো DB তে লেখে (source of truth), cache post_save receiver থেকে।
+    """
+
+    def check_blacklist(self):
+        if is_jti_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError("Token is blacklisted")
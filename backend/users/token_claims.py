@@ -0,0 +1,47 @@
+# users/token_claims.py
+from django.conf import settings
+
+from .permission_engine import PermissionSnapshot, load_permission_snapshot
+
+# ======================
+# Permission claims inside JWT access token
+# ======================
+# PERMISSION_TOKEN_CLAIMS = True হলে access token এ compact permission digest থাকে:
+#   {"v": version, "a": {column: {module: bits}}, "c": [company ids],
+#    "b": {company: [bt ids]}, "f": {company: [[factory, bt], ...]}}
+# Token simplejwt এর SIGNING_KEY দিয়ে signed, তাই client বদলাতে পারবে না।
+# Version redis এর per-user counter এর সাথে না মিললে token stale ধরা হয়।
+
+PERMISSION_CLAIM = "perm"
+
+
+def permission_claims_enabled():
+    return getattr(settings, "PERMISSION_TOKEN_CLAIMS", False)
+
+
+def snapshot_to_claim(snapshot):
+    payload = snapshot.to_payload()
+    return {
+        "v": snapshot.version,
+        "a": payload["actions"],
+        "c": payload["companies"],
+        # JSON key সবসময় string
+        "b": {str(cid): ids for cid, ids in payload["business_types"].items()},
+        "f": {str(cid): [list(pair) for pair in pairs] for cid, pairs in payload["factories"].items()},
+    }
+
+
+def snapshot_from_claim(user_id, claim):
+    return PermissionSnapshot.from_payload(user_id, claim["v"], {
+        "actions": claim["a"],
+        "companies": claim["c"],
+        "business_types": {int(cid): ids for cid, ids in claim["b"].items()},
+        "factories": {int(cid): pairs for cid, pairs in claim["f"].items()},
+    })
+
+
+def add_permission_claims(access_token, user_id):
+    """Access token এ current permission digest বসায় (mode off থাকলে কিছু করে না)"""
+    if permission_claims_enabled():
+        access_token[PERMISSION_CLAIM] = snapshot_to_claim(load_permission_snapshot(user_id))
+    return access_token
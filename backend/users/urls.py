@@ -5,7 +5,8 @@ from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from .views import (
     RegisterView, UserViewSet, UserListView,
     CustomLoginView, LogoutView,
-     RoleViewSet, PermissionViewSet,UserPermissionSetViewSet
+     RoleViewSet, PermissionViewSet,UserPermissionSetViewSet,
+     EffectivePermissionView, AccessIndexView,
 )
 
 # users/urls.py
@@ -28,5 +29,7 @@ urlpatterns = [
     path("logout/", LogoutView.as_view(), name="logout"),
     path("refresh/", TokenRefreshView.as_view(), name="token_refresh"),
     path("jwt-login/", TokenObtainPairView.as_view(), name="jwt_login"),
+    path("permissions/effective/", EffectivePermissionView.as_view(), name="effective-permissions"),
+    path("access-index/", AccessIndexView.as_view(), name="access-index"),
     path("", include(router.urls)),
 ]
@@ -0,0 +1,50 @@
+# users/user_cache.py
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+# ======================
+# Authenticated User Cache
+# ======================
+# JWTAuthentication প্রতি request এ CustomUser row DB থেকে load করে।
+# এখানে user এর concrete field গুলো (plain data) short TTL এ cache হয়,
+# key তে user version থাকে → user save হলেই পুরোনো entry আর match করে না।
+
+USER_CACHE_TIMEOUT = getattr(settings, "AUTH_USER_CACHE_TIMEOUT", 5 * 60)
+USER_VERSION_KEY = "auth:user_version:{user_id}"
+USER_KEY = "auth:user:{user_id}:{version}"
+
+
+def get_user_version(user_id):
+    return cache.get_or_set(USER_VERSION_KEY.format(user_id=user_id), time.time_ns, timeout=None)
+
+
+def bump_user_version(user_id):
+    """toggle_active / update_role / password change → CustomUser.save থেকে call হয়"""
+    cache.set(USER_VERSION_KEY.format(user_id=user_id), time.time_ns(), timeout=None)
+
+
+def _user_fields(model):
+    return [f.attname for f in model._meta.concrete_fields]
+
+
+def get_cached_user(user_id):
+    """
+    Cache hit → DB query ছাড়াই CustomUser instance (from_db দিয়ে বানানো, save() ঠিকমতো কাজ করবে)।
+    Miss → DB থেকে load করে cache এ রাখে। User না থাকলে DoesNotExist raise করে।
+    """
+    model = get_user_model()
+    fields = _user_fields(model)
+    key = USER_KEY.format(user_id=user_id, version=get_user_version(user_id))
+
+    values = cache.get(key)
+    if values is not None and len(values) == len(fields):
+        return model.from_db(DEFAULT_DB_ALIAS, fields, values)
+
+    user = model.objects.get(pk=user_id)
+    # শুধু field values → request-level attribute (_permission_snapshot ইত্যাদি) cache এ যায় না
+    cache.set(key, [getattr(user, f) for f in fields], timeout=USER_CACHE_TIMEOUT)
+    return user
@@ -1,10 +1,12 @@
 from rest_framework import generics, viewsets, status
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import SAFE_METHODS, IsAuthenticated
 from rest_framework.decorators import action, api_view
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import authenticate
+from .token_claims import add_permission_claims
+from .token_blacklist import CachedBlacklistRefreshToken
 
 from .models import (
     CustomUser, 
@@ -13,8 +15,11 @@ from .models import (
 from .serializers import (
     UserSerializer, RegisterSerializer, 
     RoleSerializer, PermissionSerializer, 
-    UserRoleUpdateSerializer
+    UserRoleUpdateSerializer, RoleTemplateSerializer
 )
+from .roles import ROLE_TEMPLATE_FIELDS, materialize_role
+from .permissions import IsSuperUserOrStaff
+from django.db import transaction
 
 # ------------------------------
 # Custom Login
@@ -34,7 +39,7 @@ class CustomLoginView(APIView):
         user.is_logged_in = True
         user.save()
         refresh = RefreshToken.for_user(user)
-        access = str(refresh.access_token)
+        access = str(add_permission_claims(refresh.access_token, user.pk))
 
         user_data = UserSerializer(user).data
 
@@ -90,7 +95,11 @@ class UserViewSet(viewsets.ModelViewSet):
         user = self.get_object()
         serializer = UserRoleUpdateSerializer(user, data=request.data, partial=True)
         if serializer.is_valid():
-            serializer.save()
+            with transaction.atomic():
+                serializer.save()
+                # ✅ নতুন role এর permission template এই user এ apply
+                if user.role:
+                    materialize_role(user.role, user_ids=[user.id])
             return Response({"success": True, "role": RoleSerializer(user.role).data})
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 # ------------------------------
@@ -98,9 +107,29 @@ class UserViewSet(viewsets.ModelViewSet):
 # ------------------------------
 class RoleViewSet(viewsets.ModelViewSet):
     queryset = Role.objects.all()
-    serializer_class = RoleSerializer
+    serializer_class = RoleTemplateSerializer
     permission_classes = [IsAuthenticated]
 
+    # Role পড়া সবার জন্য খোলা, template বদলানো / materialize শুধু superuser / staff
+    def get_permissions(self):
+        permissions = super().get_permissions()
+        if self.request.method not in SAFE_METHODS:
+            permissions.append(IsSuperUserOrStaff())
+        return permissions
+
+    # ✅ Role template বদলালে role এর সব user এ bulk apply (শুধু name বদলালে না)
+    @transaction.atomic
+    def perform_update(self, serializer):
+        before = {name: getattr(serializer.instance, name) for name in ROLE_TEMPLATE_FIELDS}
+        role = serializer.save()
+        if any(getattr(role, name) != value for name, value in before.items()):
+            materialize_role(role)
+
+    @action(detail=True, methods=["post"])
+    def materialize(self, request, pk=None):
+        count = materialize_role(self.get_object())
+        return Response({"success": True, "users": count})
+
 
 # ------------------------------
 # Permission ViewSet
@@ -130,7 +159,7 @@ class LogoutView(APIView):
             user = request.user
             user.is_logged_in = False  # ✅ Mark logged out
             user.save()
-            token = RefreshToken(refresh_token)
+            token = CachedBlacklistRefreshToken(refresh_token)
             token.blacklist()
             return Response({"detail": "Logged out successfully"}, status=status.HTTP_200_OK)
         except Exception as e:
@@ -141,7 +170,7 @@ class LogoutView(APIView):
     def logout_view(request):
         try:
             refresh_token = request.data.get("refresh")
-            token = RefreshToken(refresh_token)
+            token = CachedBlacklistRefreshToken(refresh_token)
             token.blacklist()
             return Response({"detail": "Logged out successfully."})
         except Exception:
@@ -154,6 +183,7 @@ class LogoutView(APIView):
 # ------------------------------
 from .models import UserPermissionSet
 from .serializers import UserPermissionSetSerializer
+from .grants import sync_user_grants
 
 class UserPermissionSetViewSet(viewsets.ModelViewSet):
     queryset = UserPermissionSet.objects.all()
@@ -167,6 +197,30 @@ class UserPermissionSetViewSet(viewsets.ModelViewSet):
             return UserPermissionSet.objects.all()
         return UserPermissionSet.objects.filter(user=user)   
 
+    # ✅ Permission change হলে grant table sync + cached snapshot invalid করা
+    # (sync_user_grants → invalidate_access, commit এর পরে version bump)
+    def _permissions_changed(self, user_id):
+        sync_user_grants(user_id)
+
+    @transaction.atomic
+    def perform_create(self, serializer):
+        obj = serializer.save()
+        self._permissions_changed(obj.user_id)
+
+    @transaction.atomic
+    def perform_update(self, serializer):
+        old_user_id = serializer.instance.user_id
+        obj = serializer.save()
+        self._permissions_changed(obj.user_id)
+        # অন্য user এ সরানো হলে আগের user এর cached snapshot ও বাতিল
+        if old_user_id != obj.user_id:
+            self._permissions_changed(old_user_id)
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        instance.delete(user=self.request.user)
+        self._permissions_changed(instance.user_id)
+
     @action(detail=False, methods=['get'], url_path='user/(?P<user_id>[^/.]+)')
     def by_user(self, request, user_id=None):
         sets = UserPermissionSet.objects.filter(user_id=user_id)
@@ -218,31 +272,127 @@ class UserPermissionSetViewSet(viewsets.ModelViewSet):
         if not request.user.is_superuser and str(request.user.id) != str(user_id):
             return Response({"detail": "Access denied"}, status=status.HTTP_403_FORBIDDEN)
         
-        obj, created = UserPermissionSet.objects.update_or_create(
-            user_id=user_id,
-            defaults={
-                "role_id": role,
-                "companies": companies,
-                "business_types": business_types,
-                "factories": clean_factories, 
-                "product_module": product_module,
-                "company_module": company_module,
-                "hr_module": hr_module,
-                "accounts_module": accounts_module,
-                "inventory_module": inventory_module,
-                "settings_module": settings_module,
-                "party_type_module": party_type_module,
-                "sr_module": sr_module,
-                "booking_module": booking_module,
-                "loan_module": loan_module,
-                "pallot_module": pallot_module,
-                "delivery_module": delivery_module,
-                "ledger_module": ledger_module,
-            }
-        )
+        with transaction.atomic():
+            obj, created = UserPermissionSet.objects.update_or_create(
+                user_id=user_id,
+                defaults={
+                    "role_id": role,
+                    "companies": companies,
+                    "business_types": business_types,
+                    "factories": clean_factories, 
+                    "product_module": product_module,
+                    "company_module": company_module,
+                    "hr_module": hr_module,
+                    "accounts_module": accounts_module,
+                    "inventory_module": inventory_module,
+                    "settings_module": settings_module,
+                    "party_type_module": party_type_module,
+                    "sr_module": sr_module,
+                    "booking_module": booking_module,
+                    "loan_module": loan_module,
+                    "pallot_module": pallot_module,
+                    "delivery_module": delivery_module,
+                    "ledger_module": ledger_module,
+                }
+            )
+            self._permissions_changed(obj.user_id)
 
         serializer = self.get_serializer(obj)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
 
+
+
+# ------------------------------
+# Effective Permissions (SPA bootstrap)
+# ------------------------------
+from django.utils.http import parse_etags, quote_etag
+from .permission_catalog import get_permission_catalog, get_catalog_hash
+from .permission_engine import get_permission_snapshot, get_permission_version
+
+
+class EffectivePermissionView(APIView):
+    """
+    Catalog + current user এর action matrix + scope tree এক response এ।
+    Snapshot cache থেকে আসে (miss হলে একটাই query), ETag permission version থেকে।
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        user = request.user
+        is_admin = user.is_superuser or user.is_staff
+        etag = quote_etag(f"{user.pk}-{get_permission_version(user.pk)}-{int(is_admin)}-{get_catalog_hash()}")
+
+        # ✅ কিছু বদলায়নি → 304
+        if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+        if if_none_match and (etag in parse_etags(if_none_match) or if_none_match.strip() == "*"):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            response["ETag"] = etag
+            return response
+
+        catalog = get_permission_catalog()
+        snapshot = get_permission_snapshot(user)
+
+        permissions = {}
+        for column, modules in catalog.items():
+            permissions[column] = {
+                module: {a: is_admin or snapshot.has(column, module, a) for a in actions}
+                for module, actions in modules.items()
+            }
+
+        companies = []
+        for cid in sorted(snapshot.companies):
+            companies.append({
+                "id": cid,
+                "business_types": sorted(snapshot.business_types.get(cid, ())),
+                "factories": [
+                    {"factory_id": f, "business_type_id": bt}
+                    for f, bt in sorted(snapshot.factories.get(cid, ()), key=lambda pair: pair[0])
+                ],
+            })
+
+        response = Response({
+            "catalog": catalog,
+            "is_admin": is_admin,
+            "permissions": permissions,
+            "scope": {"all": is_admin, "companies": companies},
+        })
+        response["ETag"] = etag
+        return response
+
+
+# ------------------------------
+# Reverse Access Index (access review)
+# ------------------------------
+from .access_index import users_with_access
+
+
+class AccessIndexView(APIView):
+    """
+    GET /api/access-index/?column=pallot_module&module=pallot&action=edit&company=1&factory=12
+    → কোন কোন user এই access পায় (শুধু superuser)
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if not request.user.is_superuser:
+            return Response({"detail": "Access denied"}, status=status.HTTP_403_FORBIDDEN)
+
+        params = request.query_params
+        try:
+            company_id = int(params["company"]) if params.get("company") else None
+            factory_id = int(params["factory"]) if params.get("factory") else None
+        except ValueError:
+            return Response({"error": "company and factory must be integers"}, status=status.HTTP_400_BAD_REQUEST)
+
+        users = users_with_access(
+            column=params.get("column"),
+            module=params.get("module"),
+            action=params.get("action"),
+            company_id=company_id,
+            factory_id=factory_id,
+        ).order_by("id").values("id", "email", "name")
+
+        users = list(users)
+        return Response({"count": len(users), "users": users})
@@ -2,6 +2,7 @@
 import pandas as pd
 from django.db import transaction
 
+from backend.mixins import bump_table_version
 from company.models import Company, BusinessType, Factory
 from products.models import ProductType, Category, Unit, UnitSize,Product
 from party_type.models.party_type import PartyType
@@ -72,6 +73,8 @@ def import_excel_to_model(file, model_class, field_mapping):
 
         with transaction.atomic():
             model_class.objects.bulk_create(objects)
+            # bulk_create save() call করে না → lookup / list cache বাতিল করতে হবে
+            transaction.on_commit(lambda: bump_table_version(model_class))
 
         return {"status": "success", "count": len(objects)}
 